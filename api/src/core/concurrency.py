@@ -0,0 +1,155 @@
+"""Helpers for running blocking work off the event loop and sharing work between requests."""
+
+import asyncio
+from concurrent.futures import Executor
+from typing import AsyncGenerator, AsyncIterator, Callable, Dict, Generic, Iterable, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+async def iterate_in_executor(
+    iterable: Iterable[T],
+    executor: Optional[Executor] = None,
+    maxsize: int = 0,
+) -> AsyncGenerator[T, None]:
+    """Drive a blocking iterator in an executor and yield its items on the event loop.
+
+    Items are produced ahead of the consumer and handed back through an asyncio queue,
+    so the consumer can work on one item while the executor computes the next. Each
+    item is computed by its own executor call, so a producer waiting on a slow consumer
+    doesn't hold on to an executor thread that other iterators could use.
+
+    Args:
+        iterable: Blocking iterable to consume, e.g. a synchronous generator
+        executor: Executor to run it in, or None for the loop's default executor
+        maxsize: Maximum number of items queued ahead of the consumer, 0 for unbounded
+    """
+    loop = asyncio.get_running_loop()
+    iterator = iter(iterable)
+    queue: asyncio.Queue = asyncio.Queue(maxsize)
+
+    async def produce() -> None:
+        try:
+            while True:
+                item = await loop.run_in_executor(executor, next, iterator, _DONE)
+                if item is _DONE:
+                    break
+                await queue.put((item, None))
+        except Exception as e:
+            await queue.put((_DONE, e))
+        else:
+            await queue.put((_DONE, None))
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            item, error = await queue.get()
+            if item is _DONE:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        producer.cancel()
+
+
+class SharedStream(Generic[T]):
+    """Runs an async iterator once and fans its items out to any number of subscribers.
+
+    Items are kept in a replay buffer, so a subscriber that joins late first receives
+    everything produced so far and then follows along live. Subscribers share the item
+    objects and must not modify them. The source is cancelled once the last subscriber
+    leaves before it is exhausted.
+
+    With max_replay, the stream closes to new subscribers once it has produced that
+    many items, and from then on drops items every subscriber has received, so a long
+    stream doesn't hold all of its output.
+    """
+
+    def __init__(self, source: AsyncIterator[T], on_close: Optional[Callable[[], None]] = None, max_replay: int = 0):
+        self.items: List[T] = []
+        # Items dropped from the front of the buffer, and the next item of each subscriber
+        self.dropped = 0
+        self._positions: Dict[object, int] = {}
+        self.max_replay = max_replay
+        self.error: Optional[BaseException] = None
+        self.done = False
+        self.closed = False
+        self.subscribers = 0
+        self._on_close = on_close
+        self._changed = asyncio.Event()
+        self._task = asyncio.create_task(self._run(source))
+        self._task.add_done_callback(lambda _: self._close())
+
+    async def _run(self, source: AsyncIterator[T]) -> None:
+        try:
+            async for item in source:
+                self.items.append(item)
+                if self.max_replay and self.dropped + len(self.items) >= self.max_replay:
+                    self._close()
+                self._trim()
+                self._notify()
+        except asyncio.CancelledError:
+            self.error = RuntimeError("Shared stream was cancelled")
+            raise
+        except Exception as e:
+            self.error = e
+        finally:
+            self.done = True
+            self._notify()
+            aclose = getattr(source, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    def _notify(self) -> None:
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def _trim(self) -> None:
+        if self.closed and self._positions:
+            received = min(self._positions.values()) - self.dropped
+            if received > 0:
+                del self.items[:received]
+                self.dropped += received
+
+    def _close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            if self._on_close is not None:
+                self._on_close()
+
+    async def subscribe(self) -> AsyncGenerator[T, None]:
+        """Yield every item of the source, replaying those produced before joining.
+
+        Raises:
+            RuntimeError: If the stream is closed and has already dropped items
+        """
+        if self.dropped:
+            raise RuntimeError("Shared stream no longer has its first items")
+        token = object()
+        self.subscribers += 1
+        self._positions[token] = 0
+        try:
+            while True:
+                index = self._positions[token]
+                if index < self.dropped + len(self.items):
+                    self._positions[token] = index + 1
+                    item = self.items[index - self.dropped]
+                    self._trim()
+                    yield item
+                elif self.done:
+                    if self.error is not None:
+                        raise self.error
+                    return
+                else:
+                    await self._changed.wait()
+        finally:
+            self.subscribers -= 1
+            del self._positions[token]
+            self._trim()
+            if self.subscribers == 0 and not self.done:
+                # Nobody is listening anymore; stop producing and don't let new requests join
+                self._close()
+                self._task.cancel()
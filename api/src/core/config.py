@@ -23,6 +23,25 @@ class Settings(BaseSettings):
     use_gpu: bool = True
     use_ONNX: bool = False
     device_type: str | None = None
+    cpu_intra_op_threads: int | None = None
+    cpu_inter_op_threads: int | None = None
+    inference_workers: int = 1
+    max_concurrent_chunks: int = 4
+    pipeline_text_queue_size: int = 2
+    pipeline_audio_queue_size: int = 2
+    encoder_backend: str = "thread"
+    encoder_workers: int = 4
+    audio_cache_enabled: bool = True
+    audio_cache_memory_mb: int = 128
+    audio_cache_dir: str | None = None
+    audio_cache_disk_mb: int = 1024
+    chunk_cache_enabled: bool = True
+    chunk_cache_memory_mb: int = 64
+    coalesce_requests: bool = True
+    coalesce_max_replay_chunks: int = 16
+    job_workers: int = 1
+    job_retention_hours: float = 24.0
+    bulk_max_items: int = 1000
     allow_local_voice_saving: bool = False
 
     model_dir: str = "src/models"
@@ -33,7 +52,14 @@ class Settings(BaseSettings):
     target_min_tokens: int = 175
     target_max_tokens: int = 250
     absolute_max_tokens: int = 450
+    stream_first_chunk_tokens: int = 40
+    stream_chunk_growth: float = 2.0
     advanced_text_normalization: bool = True
+    single_pass_phonemization: bool = False
+    phoneme_cache_size: int = 4096
+    phoneme_batch_size: int = 32
+    text_frontend_processes: int = 0
+    text_frontend_partition_chars: int = 4000
     voice_weight_normalization: bool = True
 
     gap_trim_ms: int = 1
@@ -44,6 +70,7 @@ class Settings(BaseSettings):
         "?": 1,
         ",": 0.8,
     }
+    silence_frame_ms: float = 0
 
     enable_web_player: bool = True
     web_player_path: str = "web"
@@ -54,7 +81,21 @@ class Settings(BaseSettings):
     max_temp_dir_count: int = 3
 
     def get_device(self) -> str:
-        assert torch.cuda.is_available()
-        return "cuda"
+        if self.device_type:
+            device = self.device_type.lower()
+            if device == "cuda" and not torch.cuda.is_available():
+                raise RuntimeError("device_type is 'cuda' but CUDA is not available")
+            if device == "mps" and not torch.backends.mps.is_available():
+                raise RuntimeError("device_type is 'mps' but MPS is not available")
+            if device not in ("cuda", "mps", "cpu"):
+                raise ValueError(f"Unsupported device_type: {self.device_type}")
+            return device
+
+        if self.use_gpu:
+            if torch.cuda.is_available():
+                return "cuda"
+            if torch.backends.mps.is_available():
+                return "mps"
+        return "cpu"
 
 settings = Settings()
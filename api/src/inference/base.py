@@ -12,21 +12,23 @@ class AudioChunk:
         self,
         audio: np.ndarray,
         word_timestamps: Optional[List] = None,
-        output: Optional[Union[bytes, np.ndarray]] = b"",
+        output: Optional[List[Union[bytes, memoryview]]] = None,
     ):
         self.audio = audio
         self.word_timestamps = word_timestamps or []
-        self.output = output
+        # Encoded audio as parts in order, see StreamingAudioWriter.write_chunk
+        self.output = output if output is not None else []
 
     @staticmethod
     def combine(audio_chunks: List["AudioChunk"]) -> "AudioChunk":
-        combined_audio = audio_chunks[0].audio
-        combined_timestamps = audio_chunks[0].word_timestamps.copy() if audio_chunks[0].word_timestamps else []
-
-        for chunk in audio_chunks[1:]:
-            combined_audio = np.concatenate((combined_audio, chunk.audio), dtype=np.int16)
-            if chunk.word_timestamps:
-                combined_timestamps += chunk.word_timestamps
+        """Join chunks into one, copying each chunk's audio exactly once."""
+        if not audio_chunks:
+            return AudioChunk(np.array([], dtype=np.int16))
+        if len(audio_chunks) == 1:
+            combined_audio = audio_chunks[0].audio
+        else:
+            combined_audio = np.concatenate([chunk.audio for chunk in audio_chunks], dtype=np.int16)
+        combined_timestamps = [timestamp for chunk in audio_chunks if chunk.word_timestamps for timestamp in chunk.word_timestamps]
 
         return AudioChunk(combined_audio, combined_timestamps)
 
@@ -1,4 +1,6 @@
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import AsyncGenerator, Dict, Optional, Tuple, Union
 
 import numpy as np
@@ -7,10 +9,12 @@ from kokoro import KModel, KPipeline
 from loguru import logger
 
 from ..core import paths
+from ..core.concurrency import iterate_in_executor
 from ..core.config import settings
 from ..core.model_config import model_config
 from ..structures.schemas import WordTimestamp
 from .base import AudioChunk, BaseModelBackend
+from .voice_manager import get_manager as get_voice_manager
 
 
 class KokoroV1(BaseModelBackend):
@@ -20,6 +24,13 @@ class KokoroV1(BaseModelBackend):
         self._device = settings.get_device()
         self._model: Optional[KModel] = None
         self._pipelines: Dict[str, KPipeline] = {}
+        # Forward passes of all requests queue for the same inference workers instead of
+        # competing for the device, and run off the event loop
+        self._inference_executor = ThreadPoolExecutor(max_workers=max(1, settings.inference_workers), thread_name_prefix="kokoro-infer")
+        # G2P backends (spaCy, espeak) are not safe to share across threads, so text
+        # processing gets a single worker of its own, off the event loop. Requests take
+        # turns on it one chunk at a time, see iterate_in_executor
+        self._g2p_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kokoro-g2p")
 
     async def load_model(self, path: str) -> None:
         model_path = await paths.get_model_path(path)
@@ -43,6 +54,13 @@ class KokoroV1(BaseModelBackend):
         else:
             self._model = self._model.cpu()
 
+    def _forward(self, phonemes: str, ref_s: torch.Tensor, speed: float) -> KModel.Output:
+        with torch.inference_mode():
+            return self._model(phonemes, ref_s, speed, return_output=True)
+
+    async def _infer(self, phonemes: str, ref_s: torch.Tensor, speed: float) -> KModel.Output:
+        """Run a forward pass for one phoneme sequence on the inference executor."""
+        return await asyncio.get_running_loop().run_in_executor(self._inference_executor, self._forward, phonemes, ref_s, speed)
 
     def _get_pipeline(self, lang_code: str) -> KPipeline:
         if not self._model:
@@ -50,9 +68,23 @@ class KokoroV1(BaseModelBackend):
 
         if lang_code not in self._pipelines:
             logger.info(f"Creating new pipeline for language code: {lang_code}")
-            self._pipelines[lang_code] = KPipeline(repo_id='hexgrad/Kokoro-82M', lang_code=lang_code, model=self._model, device=self._device)
+            # Quiet pipeline: G2P and chunking only, inference runs on the inference executor
+            self._pipelines[lang_code] = KPipeline(repo_id='hexgrad/Kokoro-82M', lang_code=lang_code, model=False)
         return self._pipelines[lang_code]
 
+    async def _get_voice_tensor(self, voice: Union[str, Tuple[str, Union[torch.Tensor, str]]]) -> Tuple[str, torch.Tensor]:
+        """Resolve a voice path or tensor to a voice pack on the inference device."""
+        if isinstance(voice, tuple):
+            voice_name, voice_data = voice
+        else:
+            voice_data = voice
+            voice_name = os.path.splitext(os.path.basename(voice))[0]
+
+        if isinstance(voice_data, str):
+            voice_manager = await get_voice_manager()
+            return voice_name, await voice_manager.get_voice_tensor(voice_data, self._device)
+        return voice_name, voice_data.to(self._device)
+
     async def generate_from_tokens(
         self,
         tokens: str,
@@ -69,52 +101,18 @@ class KokoroV1(BaseModelBackend):
                 if self._check_memory():
                     self._clear_memory()
 
-            # Handle voice input
-            voice_path: str
-            voice_name: str
-            if isinstance(voice, tuple):
-                voice_name, voice_data = voice
-                if isinstance(voice_data, str):
-                    voice_path = voice_data
-                else:
-                    # Save tensor to temporary file
-                    import tempfile
-
-                    temp_dir = tempfile.gettempdir()
-                    voice_path = os.path.join(temp_dir, f"{voice_name}.pt")
-                    # Save tensor with CPU mapping for portability
-                    torch.save(voice_data.cpu(), voice_path)
-            else:
-                voice_path = voice
-                voice_name = os.path.splitext(os.path.basename(voice_path))[0]
-
-            # Load voice tensor with proper device mapping
-            voice_tensor = await paths.load_voice_tensor(voice_path, device=self._device)
-            # Save back to a temporary file with proper device mapping
-            import tempfile
-
-            temp_dir = tempfile.gettempdir()
-            temp_path = os.path.join(temp_dir, f"temp_voice_{os.path.basename(voice_path)}")
-            await paths.save_voice_tensor(voice_tensor, temp_path)
-            voice_path = temp_path
-
-            # Use provided lang_code, settings voice code override, or first letter of voice name
-            if lang_code:  # api is given priority
-                pipeline_lang_code = lang_code
-            elif settings.default_voice_code:  # settings is next priority
-                pipeline_lang_code = settings.default_voice_code
-            else:  # voice name is default/fallback
-                pipeline_lang_code = voice_name[0].lower()
+            voice_name, voice_tensor = await self._get_voice_tensor(voice)
 
-            pipeline = self._get_pipeline(pipeline_lang_code)
+            if len(tokens) > 510:
+                raise ValueError(f"Phoneme string too long: {len(tokens)} > 510")
 
-            logger.debug(f"Generating audio from tokens with lang_code '{pipeline_lang_code}': '{tokens[:100]}{'...' if len(tokens) > 100 else ''}'")
-            for result in pipeline.generate_from_tokens(tokens=tokens, voice=voice_path, speed=speed, model=self._model):
-                if result.audio is not None:
-                    logger.debug(f"Got audio chunk with shape: {result.audio.shape}")
-                    yield result.audio.numpy()
-                else:
-                    logger.warning("No audio in chunk")
+            logger.debug(f"Generating audio from tokens: '{tokens[:100]}{'...' if len(tokens) > 100 else ''}'")
+            output = await self._infer(tokens, voice_tensor[len(tokens) - 1], speed)
+            if output.audio is not None:
+                logger.debug(f"Got audio chunk with shape: {output.audio.shape}")
+                yield output.audio.numpy()
+            else:
+                logger.warning("No audio in chunk")
 
         except Exception as e:
             logger.error(f"Generation failed: {e}")
@@ -141,41 +139,17 @@ class KokoroV1(BaseModelBackend):
                 if self._check_memory():
                     self._clear_memory()
 
-            # Handle voice input
-            voice_path: str
-            voice_name: str
-            if isinstance(voice, tuple):
-                voice_name, voice_data = voice
-                if isinstance(voice_data, str):
-                    voice_path = voice_data
-                else:
-                    # Save tensor to temporary file
-                    import tempfile
-
-                    temp_dir = tempfile.gettempdir()
-                    voice_path = os.path.join(temp_dir, f"{voice_name}.pt")
-                    # Save tensor with CPU mapping for portability
-                    torch.save(voice_data.cpu(), voice_path)
-            else:
-                voice_path = voice
-                voice_name = os.path.splitext(os.path.basename(voice_path))[0]
-
-            # Load voice tensor with proper device mapping
-            voice_tensor = await paths.load_voice_tensor(voice_path, device=self._device)
-            # Save back to a temporary file with proper device mapping
-            import tempfile
-
-            temp_dir = tempfile.gettempdir()
-            temp_path = os.path.join(temp_dir, f"temp_voice_{os.path.basename(voice_path)}")
-            await paths.save_voice_tensor(voice_tensor, temp_path)
-            voice_path = temp_path
+            voice_name, voice_tensor = await self._get_voice_tensor(voice)
 
             # Use provided lang_code, settings voice code override, or first letter of voice name
             pipeline_lang_code = lang_code if lang_code else (settings.default_voice_code if settings.default_voice_code else voice_name[0].lower())
-            pipeline = self._get_pipeline(pipeline_lang_code)
+            pipeline = await asyncio.get_running_loop().run_in_executor(self._g2p_executor, self._get_pipeline, pipeline_lang_code)
 
             logger.debug(f"Generating audio for text with lang_code '{pipeline_lang_code}': '{text[:100]}{'...' if len(text) > 100 else ''}'")
-            for result in pipeline(text, voice=voice_path, speed=speed, model=self._model):
+            async for result in iterate_in_executor(pipeline(text), self._g2p_executor, maxsize=2):
+                result.output = await self._infer(result.phonemes, voice_tensor[len(result.phonemes) - 1], speed)
+                if result.tokens and result.pred_dur is not None:
+                    KPipeline.join_timestamps(result.tokens, result.pred_dur)
                 if result.audio is not None:
                     logger.debug(f"Got audio chunk with shape: {result.audio.shape}")
                     word_timestamps = None
@@ -1,5 +1,8 @@
 from typing import Optional
 
+import torch
+from loguru import logger
+
 from ..core import paths
 from ..core.config import settings
 from ..core.model_config import ModelConfig, model_config
@@ -16,10 +19,24 @@ class ModelManager:
         self._device: Optional[str] = None
 
     def _determine_device(self) -> str:
-        return "cuda" if settings.use_gpu else "cpu"
+        return settings.get_device()
+
+    def _configure_threads(self) -> tuple[int, int]:
+        """Apply the configured torch thread pools and return the effective sizes."""
+        if settings.cpu_intra_op_threads:
+            torch.set_num_threads(settings.cpu_intra_op_threads)
+        if settings.cpu_inter_op_threads:
+            try:
+                torch.set_num_interop_threads(settings.cpu_inter_op_threads)
+            except RuntimeError as e:
+                # Can only be set once, before any inter-op parallel work has started
+                logger.warning(f"Could not set inter-op threads: {e}")
+        return torch.get_num_threads(), torch.get_num_interop_threads()
 
     async def initialize(self) -> None:
         self._device = self._determine_device()
+        intra_op, inter_op = self._configure_threads()
+        logger.info(f"Using device '{self._device}' with torch threads: intra-op={intra_op}, inter-op={inter_op}")
         self._backend = KokoroV1()
 
     async def initialize_with_warmup(self, voice_manager) -> tuple[str, str, int]:
@@ -40,6 +57,7 @@ class ModelManager:
             pass
 
         ms = int((time.perf_counter() - start) * 1000)
+        logger.info(f"Model warmed up on {self._device} in {ms}ms, {len(voices)} voices available")
 
         return self._device, "kokoro_v1", len(voices)
 
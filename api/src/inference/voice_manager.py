@@ -1,11 +1,13 @@
 """Voice management with controlled resource handling."""
 
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 
 import torch
 
 from ..core import paths
 from ..core.config import settings
+from ..core.model_config import model_config
 
 
 class VoiceManager:
@@ -13,18 +15,40 @@ class VoiceManager:
 
     def __init__(self):
         self._device = settings.get_device()
-        self._voices: Dict[str, torch.Tensor] = {}
+        # LRU of voice tensors already on their target device, keyed by (path, device)
+        self._voices: OrderedDict[Tuple[str, str], torch.Tensor] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        # LRU of blended voices keyed by their normalized (voice, weight) components
+        self._blends: OrderedDict[Tuple[str, Tuple[Tuple[str, float], ...]], torch.Tensor] = OrderedDict()
+        self._blend_hits = 0
+        self._blend_misses = 0
 
     async def get_voice_path(self, voice_name: str) -> str:
         return await paths.get_voice_path(voice_name)
 
+    async def get_voice_tensor(self, voice_path: str, device: Optional[str] = None) -> torch.Tensor:
+        """Get a voice tensor by file path, serving repeated lookups from the LRU cache."""
+        target_device = device or self._device
+        key = (voice_path, target_device)
+        voice = self._voices.get(key)
+        if voice is not None:
+            self._voices.move_to_end(key)
+            self._hits += 1
+            return voice
+
+        self._misses += 1
+        voice = await paths.load_voice_tensor(voice_path, target_device)
+        if model_config.cache_voices:
+            self._voices[key] = voice
+            while len(self._voices) > model_config.voice_cache_size:
+                self._voices.popitem(last=False)
+        return voice
+
     async def load_voice(self, voice_name: str, device: Optional[str] = None) -> torch.Tensor:
         try:
             voice_path = await self.get_voice_path(voice_name)
-            target_device = device or self._device
-            voice = await paths.load_voice_tensor(voice_path, target_device)
-            self._voices[voice_name] = voice
-            return voice
+            return await self.get_voice_tensor(voice_path, device)
         except Exception as e:
             raise RuntimeError(f"Failed to load voice {voice_name}: {e}")
 
@@ -37,11 +61,47 @@ class VoiceManager:
         combined = torch.mean(torch.stack(voice_tensors), dim=0)
         return combined
 
+    async def blend_voices(self, weights: Dict[str, float], device: Optional[str] = None) -> torch.Tensor:
+        """Weighted sum of voices, computed once per distinct set of weights.
+
+        Args:
+            weights: Signed, already normalized weight per voice name
+            device: Device for the blended tensor, defaults to the inference device
+        """
+        target_device = device or self._device
+        key = (target_device, tuple(sorted((name, round(weight, 6)) for name, weight in weights.items())))
+        blend = self._blends.get(key)
+        if blend is not None:
+            self._blends.move_to_end(key)
+            self._blend_hits += 1
+            return blend
+
+        self._blend_misses += 1
+        names = list(weights)
+        voice_tensors = torch.stack([await self.load_voice(name, target_device) for name in names])
+        weight_tensor = torch.tensor([weights[name] for name in names], dtype=voice_tensors.dtype, device=voice_tensors.device)
+        blend = torch.tensordot(weight_tensor, voice_tensors, dims=1)
+
+        if model_config.cache_voices:
+            self._blends[key] = blend
+            while len(self._blends) > model_config.blend_cache_size:
+                self._blends.popitem(last=False)
+        return blend
+
     async def list_voices(self) -> List[str]:
         return await paths.list_voices()
 
     def cache_info(self) -> Dict[str, int]:
-        return {"loaded_voices": len(self._voices), "device": self._device}
+        return {
+            "loaded_voices": len(self._voices),
+            "max_size": model_config.voice_cache_size,
+            "hits": self._hits,
+            "misses": self._misses,
+            "blended_voices": len(self._blends),
+            "blend_hits": self._blend_hits,
+            "blend_misses": self._blend_misses,
+            "device": self._device,
+        }
 
 
 async def get_manager() -> VoiceManager:
@@ -12,7 +12,10 @@ from .routers.web_player import router as web_router
 async def lifespan(app: FastAPI):
     from .inference.model_manager import get_manager
     from .inference.voice_manager import get_manager as get_voice_manager
+    from .services.encoder_pool import get_encoder_pool
+    from .services.job_manager import get_job_manager
     from .services.temp_manager import cleanup_temp_files
+    from .services.text_processing.text_processor import shutdown_frontend_pool, warm_frontend_pool
 
     await cleanup_temp_files()
 
@@ -20,8 +23,18 @@ async def lifespan(app: FastAPI):
     voice_manager = await get_voice_manager()
 
     device, model, voicepack_count = await model_manager.initialize_with_warmup(voice_manager)
+    if settings.text_frontend_processes > 0:
+        await warm_frontend_pool()
+    encoder_pool = await get_encoder_pool()
+    await encoder_pool.warm()
+    job_manager = await get_job_manager()
+    await job_manager.start()
     yield
 
+    await job_manager.stop()
+    shutdown_frontend_pool()
+    encoder_pool.shutdown()
+
 
 app = FastAPI(
     lifespan=lifespan,
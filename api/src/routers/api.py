@@ -1,9 +1,12 @@
+import asyncio
+import base64
 import io
 import json
 import os
 import re
 import tempfile
-from typing import AsyncGenerator, Dict, List, Union
+import zipfile
+from typing import AsyncGenerator, Dict, List, Optional, Tuple, Union
 
 import aiofiles
 import numpy as np
@@ -14,11 +17,22 @@ from loguru import logger
 
 from ..core.config import settings
 from ..inference.base import AudioChunk
-from ..services.audio import AudioService
-from ..services.streaming_audio_writer import StreamingAudioWriter
+from ..inference.voice_manager import get_manager as get_voice_manager
+from ..services.audio_cache import audio_cache_key, get_audio_cache, get_chunk_cache
+from ..services.encoder_pool import get_encoder_pool
+from ..services.job_manager import get_job_manager
+from ..services.streaming_audio_writer import StreamingAudioWriter, WriterPool, join_output
 from ..services.tts_service import TTSService
 from ..structures import OpenAISpeechRequest
-from ..structures.schemas import CaptionedSpeechRequest
+from ..structures.custom_responses import JSONStreamingResponse
+from ..structures.schemas import (
+    BulkSpeechItem,
+    BulkSpeechRequest,
+    CaptionedSpeechRequest,
+    SpeechJob,
+    SpeechJobRequest,
+    TTSStatus,
+)
 
 
 def load_openai_mappings() -> Dict:
@@ -34,6 +48,8 @@ def load_openai_mappings() -> Dict:
 
 _openai_mappings = load_openai_mappings()
 
+AUDIO_CONTENT_TYPES = {"mp3": "audio/mpeg", "opus": "audio/opus", "aac": "audio/aac", "flac": "audio/flac", "wav": "audio/wav", "pcm": "audio/pcm"}
+
 
 router = APIRouter(
     tags=["OpenAI Compatible TTS"],
@@ -105,17 +121,32 @@ async def process_and_validate_voices(voice_input: Union[str, List[str]], tts_se
     return "".join(voices)
 
 
+def get_first_chunk_tokens(request: Union[OpenAISpeechRequest, CaptionedSpeechRequest]) -> Optional[int]:
+    """First chunk size for adaptive chunking, or None to use full-size chunks throughout."""
+    adaptive = request.adaptive_chunking if request.adaptive_chunking is not None else request.stream
+    if not adaptive:
+        return None
+    return request.first_chunk_tokens or settings.stream_first_chunk_tokens
+
+
 async def stream_audio_chunks(
     tts_service: TTSService,
     request: Union[OpenAISpeechRequest, CaptionedSpeechRequest],
     client_request: Request,
     writer: StreamingAudioWriter,
+    cache_key: Optional[str] = None,
 ) -> AsyncGenerator[AudioChunk, None]:
-    """Stream audio chunks as they're generated with client disconnect handling"""
+    """Stream audio chunks as they're generated with client disconnect handling
+
+    With a cache_key, the encoded stream is added to the audio cache once it completes
+    without any failed chunks.
+    """
     voice_name = await process_and_validate_voices(request.voice, tts_service)
     unique_properties = {"return_timestamps": False}
     if hasattr(request, "return_timestamps"):
         unique_properties["return_timestamps"] = request.return_timestamps
+    cached_parts = []
+    errors = []
 
     try:
         async for chunk_data in tts_service.generate_audio_stream(
@@ -127,6 +158,8 @@ async def stream_audio_chunks(
             lang_code=request.lang_code,
             normalization_options=request.normalization_options,
             return_timestamps=unique_properties["return_timestamps"],
+            first_chunk_tokens=get_first_chunk_tokens(request),
+            errors=errors,
         ):
             is_disconnected = client_request.is_disconnected
             if callable(is_disconnected):
@@ -135,12 +168,50 @@ async def stream_audio_chunks(
                 logger.info("Client disconnected, stopping audio generation")
                 break
 
+            if cache_key:
+                cached_parts.extend(chunk_data.output)
             yield chunk_data
+        else:
+            if errors:
+                logger.warning(f"Not caching audio stream with {len(errors)} failed chunks")
+            elif cache_key:
+                audio_cache = await get_audio_cache()
+                await audio_cache.put(cache_key, writer.complete_output(b"".join(cached_parts)))
     except Exception as e:
         logger.error(f"Error in audio streaming: {str(e)}")
         raise
 
 
+async def cached_speech_response(request: OpenAISpeechRequest, content: bytes, content_type: str) -> Response:
+    """Serve cached audio with the same response shape as a generated one."""
+    headers = {
+        "Content-Disposition": f"attachment; filename=speech.{request.response_format}",
+        "Cache-Control": "no-cache",
+    }
+
+    if request.return_download_link:
+        from ..services.temp_manager import TempFileWriter
+        output_format = request.download_format or request.response_format
+        temp_writer = TempFileWriter(output_format)
+        await temp_writer.__aenter__()
+        headers["X-Download-Path"] = temp_writer.download_path
+        if temp_writer._write_error:
+            headers["X-Download-Status"] = "unavailable"
+        await temp_writer.write(content)
+        await temp_writer.finalize()
+        await temp_writer.__aexit__(None, None, None)
+
+    if request.stream:
+        async def cached_output():
+            for start in range(0, len(content), 64 * 1024):
+                yield content[start : start + 64 * 1024]
+
+        headers.update({"X-Accel-Buffering": "no", "Transfer-Encoding": "chunked"})
+        return StreamingResponse(cached_output(), media_type=content_type, headers=headers)
+
+    return Response(content=content, media_type=content_type, headers=headers)
+
+
 @router.post("/audio/speech")
 async def create_speech(request: OpenAISpeechRequest, client_request: Request, x_raw_response: str = Header(None, alias="x-raw-response")):
     if request.model not in _openai_mappings["models"]:
@@ -148,13 +219,23 @@ async def create_speech(request: OpenAISpeechRequest, client_request: Request, x
 
     tts_service = await get_tts_service()
     voice_name = await process_and_validate_voices(request.voice, tts_service)
-    content_type = {
-        "mp3": "audio/mpeg", "opus": "audio/opus", "aac": "audio/aac", "flac": "audio/flac", "wav": "audio/wav", "pcm": "audio/pcm"
-    }.get(request.response_format, f"audio/{request.response_format}")
-    writer = StreamingAudioWriter(request.response_format, sample_rate=24000)
+    content_type = AUDIO_CONTENT_TYPES.get(request.response_format, f"audio/{request.response_format}")
+
+    audio_cache = await get_audio_cache()
+    cache_key = None
+    if audio_cache.enabled:
+        cache_key = audio_cache_key(
+            request.input, voice_name, request.speed, request.lang_code, request.response_format, request.normalization_options, request.sample_rate
+        )
+        cached = await audio_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Serving {len(cached)} bytes of cached audio")
+            return await cached_speech_response(request, cached, content_type)
+
+    writer = StreamingAudioWriter(request.response_format, sample_rate=request.sample_rate or settings.sample_rate, input_sample_rate=settings.sample_rate)
 
     if request.stream:
-        generator = stream_audio_chunks(tts_service, request, client_request, writer)
+        generator = stream_audio_chunks(tts_service, request, client_request, writer, cache_key=cache_key)
 
         if request.return_download_link:
             from ..services.temp_manager import TempFileWriter
@@ -172,8 +253,9 @@ async def create_speech(request: OpenAISpeechRequest, client_request: Request, x
             async def dual_output():
                 async for chunk_data in generator:
                     if chunk_data.output:
-                        await temp_writer.write(chunk_data.output)
-                        yield chunk_data.output
+                        output = join_output(chunk_data.output)
+                        await temp_writer.write(output)
+                        yield output
                 await temp_writer.finalize()
                 await temp_writer.__aexit__(None, None, None)
                 writer.close()
@@ -183,7 +265,8 @@ async def create_speech(request: OpenAISpeechRequest, client_request: Request, x
         async def single_output():
             async for chunk_data in generator:
                 if chunk_data.output:
-                    yield chunk_data.output
+                    # One body per chunk, rather than a response message per muxer write
+                    yield join_output(chunk_data.output)
             writer.close()
 
         return StreamingResponse(single_output(), media_type=content_type, headers={
@@ -196,13 +279,19 @@ async def create_speech(request: OpenAISpeechRequest, client_request: Request, x
         "Cache-Control": "no-cache",
     }
 
+    errors = []
     audio_data = await tts_service.generate_audio(
         text=request.input, voice=voice_name, writer=writer, speed=request.speed,
-        normalization_options=request.normalization_options, lang_code=request.lang_code
+        normalization_options=request.normalization_options, lang_code=request.lang_code, errors=errors
     )
-    audio_data = await AudioService.convert_audio(audio_data, request.response_format, writer, is_last_chunk=False, trim_audio=False)
-    final = await AudioService.convert_audio(AudioChunk(np.array([], dtype=np.int16)), request.response_format, writer, is_last_chunk=True)
-    output = audio_data.output + final.output
+    encoder_pool = await get_encoder_pool()
+    audio_data = await encoder_pool.encode(writer, audio_data, is_last_chunk=False, trim_audio=False)
+    final = await encoder_pool.encode(writer, AudioChunk(np.array([], dtype=np.int16)), is_last_chunk=True)
+    output = writer.complete_output(b"".join(audio_data.output + final.output))
+    if errors:
+        logger.warning(f"Not caching audio with {len(errors)} failed chunks")
+    elif cache_key:
+        await audio_cache.put(cache_key, output)
 
     if request.return_download_link:
         from ..services.temp_manager import TempFileWriter
@@ -219,6 +308,232 @@ async def create_speech(request: OpenAISpeechRequest, client_request: Request, x
 
 
 
+async def synthesize_bulk_item(
+    tts_service: TTSService, item: BulkSpeechItem, voice_name: str, request: BulkSpeechRequest, cache_key: str, writers: WriterPool
+) -> bytes:
+    """Encoded audio of one bulk item, served from and added to the audio cache.
+
+    The item is encoded with a writer from the request's pool, which gets it back once done.
+
+    Raises:
+        RuntimeError: If any chunk of the item failed, rather than returning audio with gaps
+    """
+    audio_cache = await get_audio_cache()
+    if audio_cache.enabled:
+        cached = await audio_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    writer = writers.acquire(item.response_format, item.sample_rate or settings.sample_rate)
+    parts = []
+    errors = []
+    try:
+        async for chunk_data in tts_service.generate_audio_stream(
+            text=item.input,
+            voice=voice_name,
+            writer=writer,
+            speed=item.speed,
+            output_format=item.response_format,
+            lang_code=item.lang_code,
+            normalization_options=request.normalization_options,
+            coalesce=False,
+            errors=errors,
+        ):
+            parts.extend(chunk_data.output)
+        output = writer.complete_output(b"".join(parts))
+    finally:
+        writers.release(writer)
+    if errors:
+        raise RuntimeError(f"{len(errors)} chunks failed: {errors[0]}")
+
+    if audio_cache.enabled:
+        await audio_cache.put(cache_key, output)
+    return output
+
+
+async def iter_bulk_results(
+    tts_service: TTSService, request: BulkSpeechRequest, voices: Dict[str, str]
+) -> AsyncGenerator[Tuple[int, Optional[bytes], Optional[str]], None]:
+    """Generate the items of a bulk request concurrently, yielding (index, audio, error) as each completes.
+
+    Enough items are kept in flight to keep every chunk slot busy; each is a separate
+    generation, so the model still runs one chunk at a time. Identical items are
+    generated once, and finished items hand their writer on to the next ones.
+    """
+    # Items with the same audio, by cache key, in order
+    groups: Dict[str, List[int]] = {}
+    for index, item in enumerate(request.items):
+        key = audio_cache_key(item.input, voices[item.voice], item.speed, item.lang_code, item.response_format, request.normalization_options, item.sample_rate)
+        groups.setdefault(key, []).append(index)
+    keys = iter(groups.items())
+    writers = WriterPool(settings.sample_rate)
+    pending: Dict[asyncio.Task, List[int]] = {}
+
+    def fill() -> None:
+        while len(pending) < 2 * settings.max_concurrent_chunks:
+            key, indices = next(keys, (None, None))
+            if key is None:
+                return
+            item = request.items[indices[0]]
+            pending[asyncio.create_task(synthesize_bulk_item(tts_service, item, voices[item.voice], request, key, writers))] = indices
+
+    try:
+        fill()
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                indices = pending.pop(task)
+                if task.exception() is not None:
+                    logger.error(f"Bulk item {indices[0]} failed: {task.exception()}")
+                for index in indices:
+                    if task.exception() is not None:
+                        yield index, None, str(task.exception())
+                    else:
+                        yield index, task.result(), None
+            fill()
+    finally:
+        # The client went away or the response failed; don't keep generating
+        for task in pending:
+            task.cancel()
+        writers.close()
+
+
+class ArchiveBuffer(io.RawIOBase):
+    """Write-only sink that hands what a ZipFile wrote so far to a streaming response."""
+
+    def __init__(self):
+        self._parts: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._parts.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts = []
+        return data
+
+
+@router.post("/audio/speech/bulk")
+async def create_bulk_speech(request: BulkSpeechRequest):
+    """Generate many short inputs in one request, as NDJSON lines or a zip archive streamed as items complete."""
+    if request.model not in _openai_mappings["models"]:
+        raise HTTPException(status_code=400, detail={"error": "invalid_model", "message": f"Unsupported model: {request.model}", "type": "invalid_request_error"})
+    if len(request.items) > settings.bulk_max_items:
+        raise HTTPException(status_code=400, detail={"error": "too_many_items", "message": f"At most {settings.bulk_max_items} items are allowed per request", "type": "invalid_request_error"})
+
+    # Every distinct voice is validated once, before anything is generated
+    tts_service = await get_tts_service()
+    voices = {}
+    for voice in {item.voice for item in request.items}:
+        try:
+            voices[voice] = await process_and_validate_voices(voice, tts_service)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail={"error": "validation_error", "message": str(e), "type": "invalid_request_error"})
+
+    width = len(str(len(request.items) - 1))
+
+    if request.output == "zip":
+        async def archive_output():
+            buffer = ArchiveBuffer()
+            manifest = []
+            # Audio is already compressed, so entries are stored as-is
+            with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_STORED) as archive:
+                async for index, audio, error in iter_bulk_results(tts_service, request, voices):
+                    entry = {"index": index, "file": None, "error": error}
+                    if audio is not None:
+                        entry["file"] = f"{index:0{width}d}.{request.items[index].response_format}"
+                        archive.writestr(entry["file"], audio)
+                        yield buffer.drain()
+                    manifest.append(entry)
+                archive.writestr("manifest.json", json.dumps(sorted(manifest, key=lambda e: e["index"])))
+            yield buffer.drain()
+
+        return StreamingResponse(archive_output(), media_type="application/zip", headers={
+            "Content-Disposition": "attachment; filename=speech.zip", "X-Accel-Buffering": "no", "Cache-Control": "no-cache",
+        })
+
+    async def ndjson_output():
+        async for index, audio, error in iter_bulk_results(tts_service, request, voices):
+            item = request.items[index]
+            if audio is None:
+                yield {"index": index, "status": TTSStatus.FAILED.value, "error": error}
+            else:
+                yield {
+                    "index": index,
+                    "status": TTSStatus.COMPLETED.value,
+                    "content_type": AUDIO_CONTENT_TYPES.get(item.response_format, f"audio/{item.response_format}"),
+                    "audio": base64.b64encode(audio).decode("ascii"),
+                }
+
+    return JSONStreamingResponse(ndjson_output(), media_type="application/x-ndjson", headers={"X-Accel-Buffering": "no", "Cache-Control": "no-cache"})
+
+
+@router.post("/audio/jobs", response_model=SpeechJob, status_code=202)
+async def create_speech_job(request: SpeechJobRequest):
+    if request.model not in _openai_mappings["models"]:
+        raise HTTPException(status_code=400, detail={"error": "invalid_model", "message": f"Unsupported model: {request.model}", "type": "invalid_request_error"})
+
+    tts_service = await get_tts_service()
+    voice_name = await process_and_validate_voices(request.voice, tts_service)
+    job_manager = await get_job_manager()
+    return await job_manager.submit(request, voice_name)
+
+
+@router.get("/audio/jobs", response_model=List[SpeechJob])
+async def list_speech_jobs():
+    job_manager = await get_job_manager()
+    return job_manager.list_jobs()
+
+
+async def get_speech_job(job_id: str) -> SpeechJob:
+    job_manager = await get_job_manager()
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail={"error": "not_found", "message": f"Speech job not found: {job_id}", "type": "invalid_request_error"})
+    return job
+
+
+@router.get("/audio/jobs/{job_id}", response_model=SpeechJob)
+async def retrieve_speech_job(job_id: str):
+    return await get_speech_job(job_id)
+
+
+@router.get("/audio/jobs/{job_id}/content")
+async def download_speech_job(job_id: str):
+    job = await get_speech_job(job_id)
+    if job.status != TTSStatus.COMPLETED:
+        raise HTTPException(status_code=409, detail={"error": "job_not_completed", "message": f"Speech job {job_id} is {job.status.value}", "type": "invalid_request_error"})
+
+    job_manager = await get_job_manager()
+    content_type = AUDIO_CONTENT_TYPES.get(job.response_format, f"audio/{job.response_format}")
+    return FileResponse(job_manager.output_path(job), media_type=content_type, filename=f"speech.{job.response_format}", headers={
+        "Cache-Control": "no-cache",
+    })
+
+
+@router.post("/audio/jobs/{job_id}/resume", response_model=SpeechJob, status_code=202)
+async def resume_speech_job(job_id: str):
+    await get_speech_job(job_id)
+    job_manager = await get_job_manager()
+    try:
+        return await job_manager.resume(job_id)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail={"error": "job_not_resumable", "message": str(e), "type": "invalid_request_error"})
+
+
+@router.delete("/audio/jobs/{job_id}", response_model=SpeechJob)
+async def delete_speech_job(job_id: str):
+    job_manager = await get_job_manager()
+    job = await job_manager.delete(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail={"error": "not_found", "message": f"Speech job not found: {job_id}", "type": "invalid_request_error"})
+    return job
+
+
 @router.get("/download/{filename}")
 async def download_audio_file(filename: str):
     from ..core.paths import _find_file, get_content_type
@@ -229,6 +544,14 @@ async def download_audio_file(filename: str):
     })
 
 
+@router.get("/cache/stats")
+async def cache_stats():
+    audio_cache = await get_audio_cache()
+    chunk_cache = await get_chunk_cache()
+    voice_manager = await get_voice_manager()
+    return {"audio": audio_cache.stats(), "chunks": chunk_cache.stats(), "voices": voice_manager.cache_info()}
+
+
 @router.get("/models")
 async def list_models():
     return {
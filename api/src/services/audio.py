@@ -1,4 +1,5 @@
 import math
+from typing import Optional
 
 import numpy as np
 from loguru import logger
@@ -13,9 +14,47 @@ class AudioNormalizer:
 
     def __init__(self):
         self.chunk_trim_ms = settings.gap_trim_ms
-        self.sample_rate = 24000  # Sample rate of the audio
+        self.sample_rate = settings.sample_rate  # Sample rate of the audio
         self.samples_to_trim = int(self.chunk_trim_ms * self.sample_rate / 1000)
         self.samples_to_pad_start = int(50 * self.sample_rate / 1000)
+        self.silence_frame_ms = settings.silence_frame_ms
+
+    def find_non_silent_bounds(self, audio_data: np.ndarray, amplitude_threshold: float, frame_ms: Optional[float] = None) -> Optional[tuple[int, int]]:
+        """Finds the first and last non-silent samples, or None if the audio is silent throughout.
+
+        A sample is non-silent when its absolute amplitude exceeds the threshold. With a
+        frame size, the RMS of each frame is compared instead and the bounds snap to the
+        first and last non-silent frames, which ignores isolated clicks in the silence.
+
+        Args:
+            audio_data: Input audio data as numpy array
+            amplitude_threshold: Amplitude above which audio is non-silent
+            frame_ms: RMS frame length in milliseconds, 0 to compare single samples. Defaults to settings.silence_frame_ms
+
+        Returns:
+            A tuple with the indices of the first and last non-silent samples
+        """
+        if len(audio_data) == 0:
+            return None
+        if frame_ms is None:
+            frame_ms = self.silence_frame_ms
+        frame_size = int(frame_ms * self.sample_rate / 1000)
+
+        if frame_size > 1:
+            frame_count = -(-len(audio_data) // frame_size)
+            frames = np.zeros(frame_count * frame_size, dtype=np.float32)
+            frames[: len(audio_data)] = audio_data
+            rms = np.sqrt(np.mean(np.square(frames.reshape(frame_count, frame_size)), axis=1))
+            non_silent = rms > amplitude_threshold
+        else:
+            frame_size = 1
+            non_silent = (audio_data > amplitude_threshold) | (audio_data < -amplitude_threshold)
+
+        first = int(non_silent.argmax())
+        if not non_silent[first]:
+            return None
+        last = len(non_silent) - 1 - int(non_silent[::-1].argmax())
+        return first * frame_size, min((last + 1) * frame_size, len(audio_data)) - 1
 
     def find_first_last_non_silent(
         self,
@@ -24,6 +63,7 @@ class AudioNormalizer:
         speed: float,
         silence_threshold_db: int = -45,
         is_last_chunk: bool = False,
+        frame_ms: Optional[float] = None,
     ) -> tuple[int, int]:
         """Finds the indices of the first and last non-silent samples in audio data.
 
@@ -33,6 +73,7 @@ class AudioNormalizer:
             speed: The speaking speed of the voice
             silence_threshold_db: How quiet audio has to be to be conssidered silent
             is_last_chunk: Whether this is the last chunk
+            frame_ms: RMS frame length in milliseconds, see find_non_silent_bounds
 
         Returns:
             A tuple with the start of the non silent portion and with the end of the non silent portion
@@ -55,21 +96,12 @@ class AudioNormalizer:
         # Convert dBFS threshold to amplitude
         amplitude_threshold = np.iinfo(audio_data.dtype).max * (10 ** (silence_threshold_db / 20))
         # Find the first samples above the silence threshold at the start and end of the audio
-        non_silent_index_start, non_silent_index_end = None, None
-
-        for X in range(0, len(audio_data)):
-            if audio_data[X] > amplitude_threshold:
-                non_silent_index_start = X
-                break
-
-        for X in range(len(audio_data) - 1, -1, -1):
-            if audio_data[X] > amplitude_threshold:
-                non_silent_index_end = X
-                break
+        bounds = self.find_non_silent_bounds(audio_data, amplitude_threshold, frame_ms)
 
         # Handle the case where the entire audio is silent
-        if non_silent_index_start == None or non_silent_index_end == None:
+        if bounds is None:
             return 0, len(audio_data)
+        non_silent_index_start, non_silent_index_end = bounds
 
         return max(non_silent_index_start - self.samples_to_pad_start, 0), min(
             non_silent_index_end + math.ceil(samples_to_pad_end / speed),
@@ -85,8 +117,10 @@ class AudioNormalizer:
             Normalized audio data
         """
         if audio_data.dtype != np.int16:
-            # Scale directly to int16 range with clipping
-            return np.clip(audio_data * 32767, -32768, 32767).astype(np.int16)
+            # Scale and clip in one float32 buffer, then convert it once
+            scaled = np.multiply(audio_data, 32767, dtype=np.float32)
+            np.clip(scaled, -32768, 32767, out=scaled)
+            return scaled.astype(np.int16)
         return audio_data
 
 
@@ -126,6 +160,23 @@ class AudioService:
     ) -> AudioChunk:
         """Convert audio data to specified format with streaming support
 
+        See encode_audio, which does the work and can be run in a worker thread.
+        """
+        return AudioService.encode_audio(audio_chunk, output_format, writer, speed, chunk_text, is_last_chunk, trim_audio, normalizer)
+
+    @staticmethod
+    def encode_audio(
+        audio_chunk: AudioChunk,
+        output_format: str,
+        writer: StreamingAudioWriter,
+        speed: float = 1,
+        chunk_text: str = "",
+        is_last_chunk: bool = False,
+        trim_audio: bool = True,
+        normalizer: AudioNormalizer = None,
+    ) -> AudioChunk:
+        """Normalize, trim and encode an audio chunk with the stream's writer
+
         Args:
             audio_data: Numpy array of audio samples
             output_format: Target format (wav, mp3, ogg, pcm)
@@ -137,7 +188,7 @@ class AudioService:
             normalizer: Optional AudioNormalizer instance for consistent normalization
 
         Returns:
-            Bytes of the converted audio chunk
+            The chunk, with its encoded bytes as parts in output
         """
 
         try:
@@ -213,6 +264,6 @@ class AudioService:
 
         if audio_chunk.word_timestamps is not None:
             for timestamp in audio_chunk.word_timestamps:
-                timestamp.start_time -= trimed_samples / 24000
-                timestamp.end_time -= trimed_samples / 24000
+                timestamp.start_time -= trimed_samples / normalizer.sample_rate
+                timestamp.end_time -= trimed_samples / normalizer.sample_rate
         return audio_chunk
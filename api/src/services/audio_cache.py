@@ -0,0 +1,296 @@
+"""Content-addressed cache of synthesized audio for repeated requests."""
+
+import asyncio
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import aiofiles
+import aiofiles.os
+import numpy as np
+from loguru import logger
+
+from ..core.config import settings
+from ..inference.base import AudioChunk
+from ..structures.schemas import NormalizationOptions
+from .audio import AudioNormalizer
+
+
+def audio_cache_key(
+    text: str,
+    voice: str,
+    speed: float,
+    lang_code: Optional[str],
+    output_format: str,
+    normalization_options: Optional[NormalizationOptions] = None,
+    sample_rate: Optional[int] = None,
+) -> str:
+    """Hash of everything that determines a request's audio.
+
+    Whitespace in the text is collapsed, so prompts that only differ in line breaks or
+    indentation share an entry. The text isn't normalized for the key: that would take
+    a second pass of the frontend over every request, hit or miss, to catch the rare
+    prompts that only differ in spelling, e.g. "$5" and "5 dollars". Normalization
+    options are part of the key since they change what gets spoken.
+    """
+    payload = {
+        "text": " ".join(text.split()),
+        "voice": voice,
+        "speed": round(speed, 4),
+        "lang_code": lang_code,
+        "format": output_format,
+        "normalization": normalization_options.model_dump() if normalization_options else None,
+        "sample_rate": sample_rate or settings.sample_rate,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class AudioCache:
+    """Encoded audio by request key, in a byte-bounded memory LRU backed by an optional directory.
+
+    Memory hits are served as-is. Disk hits are read back into memory, and entries evicted
+    from memory stay on disk until the directory exceeds its own size limit.
+    """
+
+    _instance = None
+
+    def __init__(
+        self,
+        max_memory_bytes: Optional[int] = None,
+        cache_dir: Optional[str] = None,
+        max_disk_bytes: Optional[int] = None,
+    ):
+        self.enabled = settings.audio_cache_enabled
+        self.max_memory_bytes = max_memory_bytes if max_memory_bytes is not None else settings.audio_cache_memory_mb * 1024 * 1024
+        self.cache_dir = cache_dir if cache_dir is not None else settings.audio_cache_dir
+        self.max_disk_bytes = max_disk_bytes if max_disk_bytes is not None else settings.audio_cache_disk_mb * 1024 * 1024
+
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_bytes = 0
+        # Disk entries in LRU order, key -> (path, size); loaded from the directory on first use
+        self._disk: Optional[OrderedDict[str, Tuple[str, int]]] = None
+        self._disk_bytes = 0
+
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._evictions = 0
+        self._bytes_served = 0
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Cached audio for a key, or None."""
+        data = self._memory.get(key)
+        if data is not None:
+            self._memory.move_to_end(key)
+            self._memory_hits += 1
+            self._bytes_served += len(data)
+            return data
+
+        if self.cache_dir:
+            data = await self._read_disk(key)
+            if data is not None:
+                self._disk_hits += 1
+                self._bytes_served += len(data)
+                self._store_memory(key, data)
+                return data
+
+        self._misses += 1
+        return None
+
+    async def put(self, key: str, data: bytes) -> None:
+        """Cache the audio of a completed request."""
+        if not data:
+            return
+        self._stores += 1
+        self._store_memory(key, data)
+        if self.cache_dir:
+            await self._write_disk(key, data)
+
+    def _store_memory(self, key: str, data: bytes) -> None:
+        if len(data) > self.max_memory_bytes:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+        self._memory[key] = data
+        self._memory_bytes += len(data)
+        while self._memory_bytes > self.max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            self._evictions += 1
+
+    def _scan_disk(self) -> OrderedDict:
+        """Entries in the cache directory, oldest first. Blocking, so run in a thread."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        entries = []
+        with os.scandir(self.cache_dir) as scan:
+            for entry in scan:
+                if entry.is_file() and entry.name.endswith(".audio"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, entry.name[: -len(".audio")], entry.path, stat.st_size))
+        return OrderedDict((key, (path, size)) for _, key, path, size in sorted(entries))
+
+    async def _disk_index(self) -> OrderedDict:
+        if self._disk is None:
+            index = await asyncio.to_thread(self._scan_disk)
+            if self._disk is not None:
+                # Loaded concurrently by another request
+                return self._disk
+            self._disk = index
+            self._disk_bytes = sum(size for _, size in index.values())
+            logger.info(f"Audio cache loaded {len(self._disk)} entries ({self._disk_bytes} bytes) from {self.cache_dir}")
+        return self._disk
+
+    async def _read_disk(self, key: str) -> Optional[bytes]:
+        index = await self._disk_index()
+        entry = index.get(key)
+        if entry is None:
+            return None
+        try:
+            async with aiofiles.open(entry[0], "rb") as f:
+                data = await f.read()
+        except OSError as e:
+            logger.warning(f"Failed to read cached audio {entry[0]}: {e}")
+            index.pop(key, None)
+            self._disk_bytes -= entry[1]
+            return None
+        index.move_to_end(key)
+        return data
+
+    async def _write_disk(self, key: str, data: bytes) -> None:
+        index = await self._disk_index()
+        if key in index or len(data) > self.max_disk_bytes:
+            return
+        path = os.path.join(self.cache_dir, f"{key}.audio")
+        try:
+            # Write under a temporary name so a crash never leaves a truncated entry behind
+            async with aiofiles.open(f"{path}.tmp", "wb") as f:
+                await f.write(data)
+            await aiofiles.os.replace(f"{path}.tmp", path)
+        except OSError as e:
+            logger.warning(f"Failed to write cached audio {path}: {e}")
+            return
+        index[key] = (path, len(data))
+        self._disk_bytes += len(data)
+
+        while self._disk_bytes > self.max_disk_bytes:
+            _, (evicted_path, size) = index.popitem(last=False)
+            self._disk_bytes -= size
+            self._evictions += 1
+            try:
+                await aiofiles.os.remove(evicted_path)
+            except OSError as e:
+                logger.warning(f"Failed to delete cached audio {evicted_path}: {e}")
+
+    def stats(self) -> Dict[str, object]:
+        hits = self._memory_hits + self._disk_hits
+        lookups = hits + self._misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._memory),
+            "memory_bytes": self._memory_bytes,
+            "max_memory_bytes": self.max_memory_bytes,
+            "disk_entries": len(self._disk) if self._disk is not None else None,
+            "disk_bytes": self._disk_bytes if self._disk is not None else None,
+            "max_disk_bytes": self.max_disk_bytes if self.cache_dir else None,
+            "hits": hits,
+            "memory_hits": self._memory_hits,
+            "disk_hits": self._disk_hits,
+            "misses": self._misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "stores": self._stores,
+            "evictions": self._evictions,
+            "bytes_served": self._bytes_served,
+        }
+
+
+async def get_audio_cache() -> AudioCache:
+    if AudioCache._instance is None:
+        AudioCache._instance = AudioCache()
+    return AudioCache._instance
+
+
+class ChunkCache:
+    """Untrimmed int16 audio of synthesized chunks, in a byte-bounded memory LRU.
+
+    Chunks are keyed by their phoneme tokens, and their text unless the audio is made
+    from those tokens, rather than the request, so boilerplate sentences shared by
+    otherwise different requests are synthesized once. The audio is
+    stored before trimming, so the stream trims a cached chunk exactly like a fresh one
+    and its word timestamps get the same trim and stream offsets.
+    """
+
+    _instance = None
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        self.enabled = settings.chunk_cache_enabled
+        self.max_bytes = max_bytes if max_bytes is not None else settings.chunk_cache_memory_mb * 1024 * 1024
+        self._chunks: OrderedDict[tuple, List[Tuple[np.ndarray, list]]] = OrderedDict()
+        self._bytes = 0
+        self._normalizer = AudioNormalizer()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def key(tokens: List[int], voice: str, speed: float, lang_code: Optional[str], text: Optional[str] = None) -> tuple:
+        """Cache key of a chunk.
+
+        Pass the chunk text unless the audio is synthesized from exactly these tokens.
+        Otherwise the model reads the text through its own G2P, which may phonemize two
+        texts differently even where the tokens agree, and word timestamps carry the
+        words themselves.
+        """
+        return (tuple(tokens), voice, round(speed, 4), lang_code, text)
+
+    def get(self, key: tuple) -> Optional[List[AudioChunk]]:
+        """Fresh AudioChunks for a cached chunk, or None."""
+        parts = self._chunks.get(key)
+        if parts is None:
+            self._misses += 1
+            return None
+        self._chunks.move_to_end(key)
+        self._hits += 1
+        # The audio is never modified in place, but timestamps are shifted by the stream
+        return [AudioChunk(audio, word_timestamps=[t.model_copy() for t in timestamps]) for audio, timestamps in parts]
+
+    def freeze(self, chunk: AudioChunk) -> Tuple[np.ndarray, list]:
+        """Copy of a freshly synthesized chunk to cache, taken before the stream trims or shifts it."""
+        return self._normalizer.normalize(chunk.audio), [t.model_copy() for t in chunk.word_timestamps or []]
+
+    def put(self, key: tuple, parts: List[Tuple[np.ndarray, list]]) -> None:
+        """Cache the frozen parts of a fully synthesized chunk."""
+        size = sum(audio.nbytes for audio, _ in parts)
+        if size > self.max_bytes:
+            return
+        previous = self._chunks.pop(key, None)
+        if previous is not None:
+            self._bytes -= sum(audio.nbytes for audio, _ in previous)
+        self._chunks[key] = parts
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            _, evicted = self._chunks.popitem(last=False)
+            self._bytes -= sum(audio.nbytes for audio, _ in evicted)
+            self._evictions += 1
+
+    def stats(self) -> Dict[str, object]:
+        lookups = self._hits + self._misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._chunks),
+            "memory_bytes": self._bytes,
+            "max_memory_bytes": self.max_bytes,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+            "evictions": self._evictions,
+        }
+
+
+async def get_chunk_cache() -> ChunkCache:
+    if ChunkCache._instance is None:
+        ChunkCache._instance = ChunkCache()
+    return ChunkCache._instance
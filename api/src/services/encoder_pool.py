@@ -0,0 +1,183 @@
+"""Worker pool that encodes stream audio off the event loop."""
+
+import asyncio
+import functools
+import multiprocessing
+import uuid
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Tuple
+
+from loguru import logger
+
+from ..core.config import settings
+from ..inference.base import AudioChunk
+from .audio import AudioNormalizer, AudioService
+from .streaming_audio_writer import StreamingAudioWriter
+
+# Codec state of the streams assigned to this encoder process, by stream id
+_stream_writers: Dict[str, StreamingAudioWriter] = {}
+
+
+def encode_stream_chunk(
+    stream_id: str,
+    output_format: str,
+    sample_rate: int,
+    input_sample_rate: int,
+    audio_chunk: AudioChunk,
+    speed: float,
+    chunk_text: str,
+    is_last_chunk: bool,
+    trim_audio: bool,
+    normalizer: AudioNormalizer,
+) -> AudioChunk:
+    """Encode a chunk with the stream's writer in this encoder process, opening it on first use."""
+    writer = _stream_writers.get(stream_id)
+    if writer is None:
+        writer = _stream_writers[stream_id] = StreamingAudioWriter(output_format, sample_rate=sample_rate, input_sample_rate=input_sample_rate)
+    try:
+        return AudioService.encode_audio(audio_chunk, output_format, writer, speed, chunk_text, is_last_chunk, trim_audio, normalizer)
+    finally:
+        if is_last_chunk:
+            release_stream(stream_id)
+
+
+def release_stream(stream_id: str) -> None:
+    """Drop a stream's writer in this encoder process."""
+    writer = _stream_writers.pop(stream_id, None)
+    if writer is not None:
+        writer.close()
+
+
+class EncoderPool:
+    """Encodes stream chunks on dedicated workers, so encoding scales apart from synthesis.
+
+    With the thread backend the codec state stays in each stream's StreamingAudioWriter
+    and the chunks are encoded by a shared thread pool. With the process backend each
+    stream is assigned to one single-process executor, the least busy one when it starts,
+    which keeps the stream's codec state in that process. The caller's writer is then
+    only a handle that names the stream and its format. wav and pcm have no codec and are
+    written in this process with either backend. Either way a stream awaits each chunk
+    before sending the next, so its encoded bytes come back in order.
+    """
+
+    _instance = None
+
+    def __init__(self, backend: str = None, workers: int = None):
+        self.backend = backend or settings.encoder_backend
+        self.workers = max(1, workers or settings.encoder_workers)
+        self._streams: "weakref.WeakKeyDictionary[StreamingAudioWriter, Tuple[str, int, int, weakref.finalize]]" = weakref.WeakKeyDictionary()
+        if self.backend == "thread":
+            self._executors: List[Executor] = [ThreadPoolExecutor(self.workers, thread_name_prefix="encoder")]
+        elif self.backend == "process":
+            self._executors = [self._start_process() for _ in range(self.workers)]
+        else:
+            raise ValueError(f"Unsupported encoder backend: {self.backend}")
+        # Streams assigned to each executor, and how often it was restarted after a crash
+        self._load = [0] * len(self._executors)
+        self._generation = [0] * len(self._executors)
+        logger.info(f"Started {self.workers} encoder {self.backend}s")
+
+    @staticmethod
+    def _start_process() -> ProcessPoolExecutor:
+        # Spawned rather than forked: the parent runs threads and may hold a GPU context
+        return ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+
+    def _assign(self, writer: StreamingAudioWriter) -> Tuple[str, int]:
+        stream = self._streams.get(writer)
+        if stream is None:
+            worker = self._load.index(min(self._load))
+            self._load[worker] += 1
+            # Unassigned when the stream ends, or when a writer is dropped mid-stream
+            unassign = weakref.finalize(writer, self._unassign, worker)
+            stream = self._streams[writer] = (uuid.uuid4().hex, worker, self._generation[worker], unassign)
+        stream_id, worker, generation, _ = stream
+        if generation != self._generation[worker]:
+            raise RuntimeError("Encoder process restarted, the stream's codec state is lost")
+        return stream_id, worker
+
+    def _unassign(self, worker: int) -> None:
+        self._load[worker] -= 1
+
+    async def _run(self, worker: int, fn: Callable, *args: Any) -> Any:
+        executor = self._executors[worker]
+        try:
+            return await asyncio.get_running_loop().run_in_executor(executor, fn, *args)
+        except BrokenProcessPool:
+            if self._executors[worker] is executor:
+                logger.error(f"Encoder process {worker} died, restarting it")
+                executor.shutdown(wait=False, cancel_futures=True)
+                self._executors[worker] = self._start_process()
+                self._generation[worker] += 1
+            raise
+
+    async def warm(self) -> None:
+        """Start the encoder processes ahead of the first request, they import the service."""
+        if self.backend == "process":
+            await asyncio.gather(*(self._run(worker, release_stream, "") for worker in range(self.workers)))
+
+    async def encode(
+        self,
+        writer: StreamingAudioWriter,
+        audio_chunk: AudioChunk,
+        speed: float = 1,
+        chunk_text: str = "",
+        is_last_chunk: bool = False,
+        trim_audio: bool = True,
+        normalizer: AudioNormalizer = None,
+    ) -> AudioChunk:
+        """Normalize, trim and encode a chunk with the stream's codec state, see AudioService.encode_audio."""
+        if normalizer is None:
+            normalizer = AudioNormalizer()
+        encode = functools.partial(AudioService.encode_audio, audio_chunk, writer.format, writer, speed, chunk_text, is_last_chunk, trim_audio, normalizer)
+        if self.backend == "thread":
+            return await self._run(0, encode)
+        if writer.format in ("wav", "pcm"):
+            # No codec state to keep in a process, and their output is a memoryview that can't be sent back
+            return await asyncio.to_thread(encode)
+
+        stream_id, worker = self._assign(writer)
+        try:
+            return await self._run(
+                worker,
+                encode_stream_chunk,
+                stream_id,
+                writer.format,
+                writer.sample_rate,
+                writer.input_sample_rate,
+                audio_chunk,
+                speed,
+                chunk_text,
+                is_last_chunk,
+                trim_audio,
+                normalizer,
+            )
+        finally:
+            if is_last_chunk:
+                stream = self._streams.pop(writer, None)
+                if stream is not None:
+                    stream[3]()
+
+    def release(self, writer: StreamingAudioWriter) -> None:
+        """Drop the codec state of a stream that ended without being finalized."""
+        stream = self._streams.pop(writer, None)
+        if stream is not None:
+            stream_id, worker, generation, unassign = stream
+            unassign()
+            if generation == self._generation[worker]:
+                self._executors[worker].submit(release_stream, stream_id)
+
+    async def run(self, fn: Callable, *args: Any) -> Any:
+        """Run a standalone encoding function, e.g. a whole file, on the least busy worker."""
+        return await self._run(self._load.index(min(self._load)), fn, *args)
+
+    def shutdown(self) -> None:
+        for executor in self._executors:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def get_encoder_pool() -> EncoderPool:
+    if EncoderPool._instance is None:
+        EncoderPool._instance = EncoderPool()
+    return EncoderPool._instance
@@ -0,0 +1,384 @@
+"""Asynchronous speech jobs rendered to disk by a worker queue."""
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+import uuid
+from typing import Awaitable, Dict, List, Optional, Tuple, TypeVar
+
+import aiofiles
+import aiofiles.os
+import numpy as np
+from loguru import logger
+
+from ..core.config import settings
+from ..structures.schemas import SpeechJob, SpeechJobRequest, TTSStatus
+from .encoder_pool import get_encoder_pool
+from .streaming_audio_writer import WAV_HEADER_SIZE, StreamingAudioWriter, wav_stream_header
+from .tts_service import TTSService
+
+# Seconds of checkpointed PCM encoded per write when a job is finalized
+ENCODE_BLOCK_SECONDS = 10
+
+T = TypeVar("T")
+
+
+async def _uninterrupted(awaitable: Awaitable[T]) -> T:
+    """Await file work to its end even when cancelled, then pass the cancellation on.
+
+    Cancelling a task doesn't stop work it handed to a thread or process, which would
+    otherwise go on to create job files after a delete removed them.
+    """
+    task = asyncio.ensure_future(awaitable)
+    try:
+        return await asyncio.shield(task)
+    except asyncio.CancelledError:
+        await asyncio.wait({task})
+        raise
+
+
+def encode_checkpoint(pcm_path: str, output_path: str, output_format: str, sample_rate: int) -> None:
+    """Encode a checkpoint's 16-bit PCM into a file of the requested format and sample rate, block by block."""
+    writer = StreamingAudioWriter(output_format, sample_rate=sample_rate, input_sample_rate=settings.sample_rate)
+    block_bytes = ENCODE_BLOCK_SECONDS * settings.sample_rate * 2
+    try:
+        with open(pcm_path, "rb") as source, open(output_path, "wb") as output:
+            while block := source.read(block_bytes):
+                output.writelines(writer.write_chunk(np.frombuffer(block, dtype=np.int16)))
+            output.writelines(writer.write_chunk(finalize=True))
+            if output_format == "wav":
+                # The file can seek back, so its header gets the real sizes
+                data_size = output.tell() - WAV_HEADER_SIZE
+                output.seek(0)
+                output.write(wav_stream_header(sample_rate, writer.channels, data_size))
+    finally:
+        writer.close()
+
+
+class JobManager:
+    """Queues speech jobs and renders them with a pool of worker tasks.
+
+    A job is rendered chunk by chunk into a 16-bit PCM checkpoint under
+    ``temp_file_dir/jobs``, so its memory use doesn't grow with the length of the
+    document and no HTTP connection has to stay open while it renders. After each chunk
+    a manifest records how many chunks and bytes of PCM are complete. A job that fails
+    or is interrupted by a restart picks up after the last completed chunk, and the
+    checkpoint is encoded to the requested format once all chunks are done.
+
+    Files per job, all named after its id: ``.json`` status, ``.request.json`` request
+    (until completed), ``.checkpoint.pcm`` and ``.manifest.json`` while rendering, and
+    the audio file itself.
+    """
+
+    _instance = None
+
+    def __init__(self, jobs_dir: Optional[str] = None, workers: Optional[int] = None):
+        self.jobs_dir = jobs_dir or os.path.join(settings.temp_file_dir, "jobs")
+        self.workers = max(1, workers or settings.job_workers)
+        self._jobs: Dict[str, SpeechJob] = {}
+        self._running: Dict[str, asyncio.Task] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._tts_service: Optional[TTSService] = None
+
+    async def start(self) -> None:
+        """Load the jobs kept on disk, queue interrupted ones again and start the workers."""
+        if self._queue is not None:
+            return
+        self._queue = asyncio.Queue()
+        await aiofiles.os.makedirs(self.jobs_dir, exist_ok=True)
+        self._tts_service = await TTSService.create()
+        await self._load()
+        await self.cleanup()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        logger.info(f"Started {self.workers} speech job workers with {len(self._jobs)} jobs on disk")
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+
+    def _path(self, job_id: str, suffix: str) -> str:
+        return os.path.join(self.jobs_dir, f"{job_id}.{suffix}")
+
+    def output_path(self, job: SpeechJob) -> str:
+        """Path of a job's audio file."""
+        return self._path(job.id, job.response_format)
+
+    def _read_jobs(self) -> List[Tuple[SpeechJob, bool]]:
+        """Jobs kept on disk, and whether each still has its request. Blocking, so run in a thread."""
+        jobs = []
+        with os.scandir(self.jobs_dir) as scan:
+            for entry in scan:
+                job_id, _, suffix = entry.name.partition(".")
+                if suffix != "json":
+                    continue
+                try:
+                    with open(entry.path, "r") as f:
+                        job = SpeechJob.model_validate_json(f.read())
+                except Exception as e:
+                    logger.warning(f"Skipping unreadable job file {entry.path}: {e}")
+                    continue
+                jobs.append((job, os.path.exists(self._path(job.id, "request.json"))))
+        return jobs
+
+    async def _load(self) -> None:
+        for job, has_request in await asyncio.to_thread(self._read_jobs):
+            self._jobs[job.id] = job
+            if job.status in (TTSStatus.PENDING, TTSStatus.PROCESSING):
+                if has_request:
+                    logger.info(f"Resuming speech job {job.id} interrupted at {job.chunks_completed} chunks")
+                    job.status = TTSStatus.PENDING
+                    self._queue.put_nowait(job.id)
+                else:
+                    job.status = TTSStatus.FAILED
+                    job.error = "Interrupted by a server restart"
+                    job.finished_at = time.time()
+                await self._save(job)
+
+    async def _save(self, job: SpeechJob) -> None:
+        await self._write_json(self._path(job.id, "json"), job.model_dump_json())
+
+    @staticmethod
+    async def _write_json(path: str, data: str) -> None:
+        # Replaced atomically, so a crash leaves either the old or the new version
+        async def write() -> None:
+            async with aiofiles.open(f"{path}.tmp", "w") as f:
+                await f.write(data)
+            await aiofiles.os.replace(f"{path}.tmp", path)
+
+        await _uninterrupted(write())
+
+    async def _remove(self, *paths: str) -> None:
+        for path in paths:
+            try:
+                await aiofiles.os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Failed to delete job file {path}: {e}")
+
+    async def cleanup(self) -> None:
+        """Delete finished jobs older than job_retention_hours."""
+        cutoff = time.time() - settings.job_retention_hours * 3600
+        for job in list(self._jobs.values()):
+            if job.finished_at is not None and job.finished_at < cutoff:
+                logger.info(f"Deleting expired speech job {job.id}")
+                await self.delete(job.id)
+
+    async def submit(self, request: SpeechJobRequest, voice: str) -> SpeechJob:
+        """Queue a request for rendering.
+
+        Args:
+            request: The speech request to render
+            voice: Validated voice expression to render with
+        """
+        await self.cleanup()
+        job = SpeechJob(
+            id=uuid.uuid4().hex,
+            status=TTSStatus.PENDING,
+            voice=voice,
+            response_format=request.response_format,
+            sample_rate=request.sample_rate or settings.sample_rate,
+            input_characters=len(request.input),
+            created_at=time.time(),
+        )
+        # The request is kept on disk rather than in memory, so the job survives a restart
+        await self._write_json(self._path(job.id, "request.json"), request.model_dump_json())
+        self._jobs[job.id] = job
+        await self._save(job)
+        await self._queue.put(job.id)
+        return job
+
+    async def resume(self, job_id: str) -> Optional[SpeechJob]:
+        """Queue a failed job again, continuing after its last completed chunk.
+
+        Raises:
+            ValueError: If the job didn't fail or its request is gone
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        if job.status != TTSStatus.FAILED:
+            raise ValueError(f"Only failed jobs can be resumed, job {job_id} is {job.status.value}")
+        if not await aiofiles.os.path.exists(self._path(job_id, "request.json")):
+            raise ValueError(f"The request of job {job_id} is no longer available")
+        job.status = TTSStatus.PENDING
+        job.error = None
+        job.finished_at = None
+        await self._save(job)
+        await self._queue.put(job.id)
+        return job
+
+    def get(self, job_id: str) -> Optional[SpeechJob]:
+        return self._jobs.get(job_id)
+
+    def list_jobs(self) -> List[SpeechJob]:
+        """All jobs, newest first."""
+        return sorted(self._jobs.values(), key=lambda job: job.created_at, reverse=True)
+
+    async def delete(self, job_id: str) -> Optional[SpeechJob]:
+        """Cancel a job if it is still running and delete its files.
+
+        A running job is stopped before its files are removed, which waits for file work
+        already in progress, e.g. encoding the finished audio.
+        """
+        job = self._jobs.pop(job_id, None)
+        if job is None:
+            return None
+        task = self._running.get(job_id)
+        if task is not None:
+            task.cancel()
+            await asyncio.wait({task})
+        await self._remove(
+            *(self._path(job_id, suffix) for suffix in ("json", "request.json", "manifest.json", "checkpoint.pcm")),
+            self.output_path(job),
+            f"{self.output_path(job)}.part",
+        )
+        job.status = TTSStatus.DELETED
+        return job
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            job = self._jobs.get(job_id)
+            if job is None or job.status != TTSStatus.PENDING:
+                # Deleted while queued
+                continue
+            task = asyncio.create_task(self._render(job))
+            self._running[job_id] = task
+            try:
+                await task
+            except asyncio.CancelledError:
+                if job_id in self._jobs:
+                    # The worker itself is being stopped rather than the job deleted
+                    raise
+            finally:
+                self._running.pop(job_id, None)
+
+    @staticmethod
+    def _fingerprint(request: SpeechJobRequest, voice: str) -> str:
+        """Hash of everything that decides how the text is chunked and voiced.
+
+        A checkpoint is only resumed under the same fingerprint, since chunk indices
+        from different chunking settings don't line up.
+        """
+        payload = {
+            "request": request.model_dump(),
+            "voice": voice,
+            "sample_rate": settings.sample_rate,
+            "tokens": [settings.target_min_tokens, settings.target_max_tokens, settings.absolute_max_tokens],
+            "normalization": settings.advanced_text_normalization,
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+    async def _restore_checkpoint(self, job: SpeechJob, fingerprint: str) -> int:
+        """Truncate the checkpoint to its last completed chunk and return the chunk to continue from."""
+        pcm_path = self._path(job.id, "checkpoint.pcm")
+        manifest = None
+        try:
+            async with aiofiles.open(self._path(job.id, "manifest.json"), "r") as f:
+                manifest = json.loads(await f.read())
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable checkpoint manifest of job {job.id}: {e}")
+
+        start_chunk, pcm_bytes = 0, 0
+        if manifest is not None and manifest.get("fingerprint") == fingerprint:
+            size = (await aiofiles.os.stat(pcm_path)).st_size if await aiofiles.os.path.exists(pcm_path) else 0
+            if size >= manifest["pcm_bytes"]:
+                start_chunk, pcm_bytes = manifest["chunks"], manifest["pcm_bytes"]
+            else:
+                logger.warning(f"Checkpoint of job {job.id} is shorter than its manifest, starting over")
+        elif manifest is not None:
+            logger.warning(f"Request or chunking settings of job {job.id} changed, starting over")
+
+        # Drops audio of a chunk that was being written when the job stopped
+        async with aiofiles.open(pcm_path, "ab") as f:
+            await f.truncate(pcm_bytes)
+        job.chunks_completed = start_chunk
+        job.audio_seconds = pcm_bytes / 2 / settings.sample_rate
+        job.output_bytes = 0
+        return start_chunk
+
+    async def _encode(self, job: SpeechJob, request: SpeechJobRequest, pcm_path: str) -> None:
+        """Encode a job's complete checkpoint into its audio file."""
+        # Written under a temporary name, so a file with the final name is always complete
+        part_path = f"{self.output_path(job)}.part"
+        sample_rate = request.sample_rate or settings.sample_rate
+        if job.response_format == "pcm" and sample_rate == settings.sample_rate:
+            await aiofiles.os.replace(pcm_path, part_path)
+        else:
+            encoder_pool = await get_encoder_pool()
+            await encoder_pool.run(encode_checkpoint, pcm_path, part_path, job.response_format, sample_rate)
+        await aiofiles.os.replace(part_path, self.output_path(job))
+
+    async def _render(self, job: SpeechJob) -> None:
+        job.status = TTSStatus.PROCESSING
+        job.started_at = time.time()
+        job.error = None
+        try:
+            async with aiofiles.open(self._path(job.id, "request.json"), "r") as f:
+                request = SpeechJobRequest.model_validate_json(await f.read())
+            fingerprint = self._fingerprint(request, job.voice)
+            start_chunk = await _uninterrupted(self._restore_checkpoint(job, fingerprint))
+            await self._save(job)
+            if start_chunk:
+                logger.info(f"Resuming speech job {job.id} at chunk {start_chunk} ({job.audio_seconds:.1f}s of audio)")
+            else:
+                logger.info(f"Rendering speech job {job.id} ({job.input_characters} characters)")
+
+            pcm_path = self._path(job.id, "checkpoint.pcm")
+            manifest_path = self._path(job.id, "manifest.json")
+            f = await _uninterrupted(aiofiles.open(pcm_path, "ab"))
+            try:
+                pcm_bytes = await f.tell()
+                async for chunk_index, chunk_data in self._tts_service.generate_chunk_audio(
+                    text=request.input,
+                    voice=job.voice,
+                    speed=request.speed,
+                    lang_code=request.lang_code,
+                    normalization_options=request.normalization_options,
+                    start_chunk=start_chunk,
+                ):
+                    if len(chunk_data.audio) > 0:
+                        data = chunk_data.audio.astype(np.int16, copy=False).tobytes()
+                        await f.write(data)
+                        await f.flush()
+                        await asyncio.to_thread(os.fsync, f.fileno())
+                        pcm_bytes += len(data)
+                    # The manifest only ever points at audio that is already on disk
+                    manifest = {"fingerprint": fingerprint, "chunks": chunk_index + 1, "pcm_bytes": pcm_bytes}
+                    await self._write_json(manifest_path, json.dumps(manifest))
+                    job.chunks_completed = chunk_index + 1
+                    job.audio_seconds = pcm_bytes / 2 / settings.sample_rate
+                    await self._save(job)
+            finally:
+                await f.close()
+
+            await _uninterrupted(self._encode(job, request, pcm_path))
+            job.output_bytes = (await aiofiles.os.stat(self.output_path(job))).st_size
+            await self._remove(pcm_path, manifest_path, self._path(job.id, "request.json"))
+            job.status = TTSStatus.COMPLETED
+            logger.info(f"Speech job {job.id} completed: {job.audio_seconds:.1f}s of audio in {time.time() - job.started_at:.1f}s")
+        except Exception as e:
+            # The checkpoint is kept, so the job can be resumed from where it failed
+            logger.error(f"Speech job {job.id} failed at chunk {job.chunks_completed}: {e}")
+            job.status = TTSStatus.FAILED
+            job.error = str(e)
+
+        # A cancelled job was either deleted or is still marked processing on disk,
+        # which the next start picks up again
+        job.finished_at = time.time()
+        await self._save(job)
+
+
+async def get_job_manager() -> JobManager:
+    if JobManager._instance is None:
+        JobManager._instance = JobManager()
+    return JobManager._instance
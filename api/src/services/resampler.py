@@ -0,0 +1,117 @@
+"""Streaming sample rate conversion for encoded output."""
+
+import math
+from functools import lru_cache
+from typing import Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+@lru_cache(maxsize=32)
+def design_filter(up: int, down: int, zero_crossings: int, rolloff: float, beta: float) -> Tuple[int, np.ndarray]:
+    """Polyphase low-pass for a conversion by up/down, as (delay, phases).
+
+    Shared by every stream with the same rates, so a new stream only allocates its buffer.
+    """
+    # Low-pass at the upsampled rate, centred on tap `delay` so output lines up with input
+    factor = max(up, down)
+    delay = zero_crossings * factor
+    offsets = np.arange(-delay, delay + 1)
+    cutoff = rolloff / (2 * factor)
+    taps = np.sinc(2 * cutoff * offsets) * np.kaiser(len(offsets), beta)
+    taps *= up / taps.sum()
+
+    # One row per phase, reversed to match windows of input that end at the newest sample
+    width = -(-len(taps) // up)
+    phases = np.zeros(width * up)
+    phases[: len(taps)] = taps
+    phases = phases.reshape(width, up).T[:, ::-1].astype(np.float32)
+    phases.flags.writeable = False
+    return delay, phases
+
+
+class Resampler:
+    """Polyphase resampler for a stream of 16-bit audio chunks.
+
+    Converts by the rational factor up/down between the two rates with a Kaiser windowed
+    sinc low-pass, computing only the output samples that are kept. The filter history
+    carries over from one chunk to the next, so a stream resampled chunk by chunk is the
+    same as the whole audio resampled at once. Each output sample needs a few input
+    samples after it: those held back are produced by the next chunk or by the final call,
+    which pads the end with silence. In total, n input samples give ceil(n * up / down)
+    output samples, aligned with the input in time.
+    """
+
+    def __init__(self, input_rate: int, output_rate: int, zero_crossings: int = 16, rolloff: float = 0.945, beta: float = 8.6):
+        """
+        Args:
+            input_rate: Sample rate of the audio passed in
+            output_rate: Sample rate of the audio returned
+            zero_crossings: Filter length in zero crossings on each side, longer is sharper but slower
+            rolloff: Cutoff as a fraction of the lower rate's Nyquist frequency
+            beta: Kaiser window shape, higher attenuates the stopband more
+        """
+        divisor = math.gcd(input_rate, output_rate)
+        self.input_rate = input_rate
+        self.output_rate = output_rate
+        self.up = output_rate // divisor
+        self.down = input_rate // divisor
+        self.delay, self.phases = design_filter(self.up, self.down, zero_crossings, rolloff, beta)
+        self.width = self.phases.shape[1]
+        self.reset()
+
+    def reset(self) -> None:
+        """Start a new stream with the same filter."""
+        # Input samples still needed, starting at input index `offset`, with silence before the start
+        self.buffer = np.zeros(self.width - 1, dtype=np.float32)
+        self.offset = 1 - self.width
+        self.received = 0
+        self.produced = 0
+
+    def _input_index(self, n: int) -> int:
+        """Index of the newest input sample that output sample n depends on."""
+        return (n * self.down + self.delay) // self.up
+
+    def process(self, audio_data: np.ndarray, final: bool = False) -> np.ndarray:
+        """Resample the next chunk of the stream.
+
+        Args:
+            audio_data: 16-bit input samples, may be empty or None
+            final: Whether this is the end of the stream, to return the held back samples
+
+        Returns:
+            16-bit output samples available so far
+        """
+        if audio_data is not None and len(audio_data) > 0:
+            self.buffer = np.concatenate((self.buffer, audio_data.astype(np.float32)))
+            self.received += len(audio_data)
+
+        total = -(-self.received * self.up // self.down)
+        if final:
+            end = total
+            if end > self.produced:
+                missing = self._input_index(end - 1) + 1 - (self.offset + len(self.buffer))
+                if missing > 0:
+                    self.buffer = np.concatenate((self.buffer, np.zeros(missing, dtype=np.float32)))
+        else:
+            end = min(max((self.received * self.up - 1 - self.delay) // self.down + 1, 0), total)
+        count = end - self.produced
+        if count <= 0:
+            return np.array([], dtype=np.int16)
+
+        # Outputs n apart by `up` share a phase, and their input windows are `down` apart
+        output = np.empty(count, dtype=np.float32)
+        windows = sliding_window_view(self.buffer, self.width)
+        for first in range(self.produced, min(self.produced + self.up, end)):
+            start = self._input_index(first) - self.width + 1 - self.offset
+            phase = (first * self.down + self.delay) % self.up
+            samples = len(range(first, end, self.up))
+            output[first - self.produced :: self.up] = windows[start :: self.down][:samples] @ self.phases[phase]
+        self.produced = end
+
+        keep = self._input_index(end) - self.width + 1 - self.offset
+        if keep > 0:
+            self.buffer = self.buffer[keep:]
+            self.offset += keep
+        return np.clip(np.rint(output), -32768, 32767).astype(np.int16)
@@ -1,92 +1,237 @@
-from io import BytesIO
-from typing import Optional
+import struct
+from typing import Dict, List, Optional, Tuple, Union
 
 import av
 import numpy as np
 
+from .resampler import Resampler
+
+
+class EncodedAudioSink:
+    """Write-only file object for PyAV to mux into.
+
+    PyAV hands every write over as a new bytes object, so the sink keeps those and
+    passes them on as a list instead of copying them into one buffer, which the
+    consumer would copy again into its own output.
+    It has no seek, which makes muxers write streaming headers up front rather than
+    seek back to patch bytes that were already returned to the caller.
+    """
+
+    def __init__(self):
+        self._parts: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._parts.append(data)
+        return len(data)
+
+    def take(self) -> List[bytes]:
+        """Everything written since the last call, in order."""
+        parts, self._parts = self._parts, []
+        return parts
+
+
+def join_output(parts: List[Union[bytes, memoryview]]) -> Union[bytes, memoryview]:
+    """The parts of a chunk's output as one buffer, copied only if there are several."""
+    if len(parts) == 1:
+        return parts[0]
+    return b"".join(parts)
+
+
+WAV_HEADER_SIZE = 44
+
+
+def wav_stream_header(sample_rate: int, channels: int = 1, data_size: Optional[int] = None) -> bytes:
+    """Header of a 16-bit PCM WAV stream.
+
+    While the length isn't known yet, and for data too large for the 32-bit fields, the
+    RIFF and data sizes are set to 0xFFFFFFFF, which decoders read as "until the end of
+    the stream", the same placeholder ffmpeg writes when it can't seek back.
+    """
+    if data_size is None or data_size + WAV_HEADER_SIZE - 8 > 0xFFFFFFFF:
+        riff_size = data_size = 0xFFFFFFFF
+    else:
+        riff_size = data_size + WAV_HEADER_SIZE - 8
+    block_align = channels * 2
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        riff_size,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,
+        channels,
+        sample_rate,
+        sample_rate * block_align,
+        block_align,
+        16,
+        b"data",
+        data_size,
+    )
+
 
 class StreamingAudioWriter:
     """Handles streaming audio format conversions"""
 
-    def __init__(self, format: str, sample_rate: int, channels: int = 1):
+    def __init__(self, format: str, sample_rate: int, channels: int = 1, input_sample_rate: Optional[int] = None):
         self.format = format.lower()
         self.sample_rate = sample_rate
+        self.input_sample_rate = input_sample_rate or sample_rate
         self.channels = channels
+        # Audio written at another rate is converted to the output rate before encoding
+        self.resampler = Resampler(self.input_sample_rate, sample_rate) if self.input_sample_rate != sample_rate else None
         self.bytes_written = 0
         self.pts = 0
+        self.closed = False
+        self.header_written = False
+
+        if self.format not in ["wav", "flac", "mp3", "pcm", "aac", "opus"]:
+            raise ValueError(f"Unsupported format: {format}")
 
+    def _open(self):
+        """Open the container on first use, so a writer whose encoding happens in an
+        encoder process doesn't set up a codec here as well."""
         codec_map = {
-            "wav": "pcm_s16le",
             "mp3": "mp3",
             "opus": "libopus",
             "flac": "flac",
             "aac": "aac",
         }
-        # Format-specific setup
-        if self.format in ["wav", "flac", "mp3", "pcm", "aac", "opus"]:
-            if self.format != "pcm":
-                self.output_buffer = BytesIO()
-                self.container = av.open(
-                    self.output_buffer,
-                    mode="w",
-                    format=self.format if self.format != "aac" else "adts",
-                )
-                self.stream = self.container.add_stream(
-                    codec_map[self.format],
-                    sample_rate=self.sample_rate,
-                    layout="mono" if self.channels == 1 else "stereo",
-                )
-                self.stream.bit_rate = 128000
-        else:
-            raise ValueError(f"Unsupported format: {format}")
+        self.output_buffer = EncodedAudioSink()
+        self.container = av.open(
+            self.output_buffer,
+            mode="w",
+            format=self.format if self.format != "aac" else "adts",
+        )
+        self.stream = self.container.add_stream(
+            codec_map[self.format],
+            sample_rate=self.sample_rate,
+            layout="mono" if self.channels == 1 else "stereo",
+        )
+        # 128 kbps at the native 24 kHz, lower rates carry less audio and get proportionally less
+        self.stream.bit_rate = 128000 * min(self.sample_rate, 24000) // 24000
 
     def close(self):
+        """Close the container. Safe to call more than once, e.g. after finalizing."""
+        if self.closed:
+            return
+        self.closed = True
         if hasattr(self, "container"):
             self.container.close()
 
-        if hasattr(self, "output_buffer"):
-            self.output_buffer.close()
+    def reset(self):
+        """Close the current stream and start a new one with the same settings.
+
+        Every output file needs its own container and codec state, which are opened
+        again on the next write, but the writer and its resampler's filter are reused.
+        """
+        self.close()
+        for name in ("container", "stream", "output_buffer"):
+            self.__dict__.pop(name, None)
+        if self.resampler is not None:
+            self.resampler.reset()
+        self.bytes_written = 0
+        self.pts = 0
+        self.closed = False
+        self.header_written = False
+
+    def complete_output(self, data: bytes) -> bytes:
+        """The stream's whole output, with the WAV sizes that weren't known while streaming filled in."""
+        if self.format != "wav" or len(data) < WAV_HEADER_SIZE:
+            return data
+        header = wav_stream_header(self.sample_rate, self.channels, len(data) - WAV_HEADER_SIZE)
+        return b"".join((header, memoryview(data)[WAV_HEADER_SIZE:]))
+
+    def write_chunk(self, audio_data: Optional[np.ndarray] = None, finalize: bool = False) -> List[Union[bytes, memoryview]]:
+        """Write a chunk of audio data and return its bytes in the target format, as parts in order.
 
-    def write_chunk(self, audio_data: Optional[np.ndarray] = None, finalize: bool = False) -> bytes:
-        """Write a chunk of audio data and return bytes in the target format.
+        The parts are what the muxer wrote, to be joined or written out by the consumer.
+        For wav and pcm the samples are a memoryview of the int16 array instead of a
+        copy, so the array must not be modified while the output is in use.
 
         Args:
             audio_data: Audio data to write, or None if finalizing
             finalize: Whether this is the final write to close the stream
         """
+        if self.resampler is not None:
+            audio_data = self.resampler.process(audio_data, final=finalize)
+            if finalize:
+                # The resampler's held back samples come before the end of the stream
+                return self._write(audio_data) + self._write(None, finalize=True)
+        return self._write(audio_data, finalize)
+
+    def _write(self, audio_data: Optional[np.ndarray], finalize: bool = False) -> List[Union[bytes, memoryview]]:
+        # wav and pcm need no codec, their samples are written as they are
+        if self.format in ("wav", "pcm"):
+            return self._write_raw(audio_data, finalize)
+        if not hasattr(self, "container"):
+            self._open()
 
         if finalize:
-            if self.format != "pcm":
-                packets = self.stream.encode(None)
-                for packet in packets:
-                    self.container.mux(packet)
+            packets = self.stream.encode(None)
+            for packet in packets:
+                self.container.mux(packet)
 
-                data = self.output_buffer.getvalue()
-                self.close()
-                return data
+            # Closing writes the trailer, which belongs to the final output too
+            self.close()
+            return self.output_buffer.take()
 
         if audio_data is None or len(audio_data) == 0:
-            return b""
-
-        if self.format == "pcm":
-            # Write raw bytes
-            return audio_data.tobytes()
-        else:
-            frame = av.AudioFrame.from_ndarray(
-                audio_data.reshape(1, -1),
-                format="s16",
-                layout="mono" if self.channels == 1 else "stereo",
-            )
-            frame.sample_rate = self.sample_rate
-
-            frame.pts = self.pts
-            self.pts += frame.samples
-
-            packets = self.stream.encode(frame)
-            for packet in packets:
-                self.container.mux(packet)
+            return []
 
-            data = self.output_buffer.getvalue()
-            self.output_buffer.seek(0)
-            self.output_buffer.truncate(0)
-            return data
+        frame = av.AudioFrame.from_ndarray(
+            audio_data.reshape(1, -1),
+            format="s16",
+            layout="mono" if self.channels == 1 else "stereo",
+        )
+        frame.sample_rate = self.sample_rate
+
+        frame.pts = self.pts
+        self.pts += frame.samples
+
+        packets = self.stream.encode(frame)
+        for packet in packets:
+            self.container.mux(packet)
+
+        return self.output_buffer.take()
+
+    def _write_raw(self, audio_data: Optional[np.ndarray], finalize: bool) -> List[Union[bytes, memoryview]]:
+        parts = []
+        if self.format == "wav" and not self.header_written:
+            self.header_written = True
+            parts.append(wav_stream_header(self.sample_rate, self.channels))
+
+        if finalize or audio_data is None or len(audio_data) == 0:
+            return parts
+
+        # A view unless the samples need converting to contiguous little-endian int16
+        parts.append(memoryview(np.ascontiguousarray(audio_data, dtype="<i2").view(np.uint8)))
+        return parts
+
+
+class WriterPool:
+    """Idle writers by format and sample rate, reused by outputs encoded one after another.
+
+    Saves setting up a writer per output when a request produces many, e.g. bulk items.
+    """
+
+    def __init__(self, input_sample_rate: int):
+        self.input_sample_rate = input_sample_rate
+        self._idle: Dict[Tuple[str, int], List[StreamingAudioWriter]] = {}
+
+    def acquire(self, format: str, sample_rate: int) -> StreamingAudioWriter:
+        idle = self._idle.get((format, sample_rate))
+        if idle:
+            return idle.pop()
+        return StreamingAudioWriter(format, sample_rate=sample_rate, input_sample_rate=self.input_sample_rate)
+
+    def release(self, writer: StreamingAudioWriter) -> None:
+        """Return a writer whose stream is done, finalized or not."""
+        writer.reset()
+        self._idle.setdefault((writer.format, writer.sample_rate), []).append(writer)
+
+    def close(self) -> None:
+        for idle in self._idle.values():
+            for writer in idle:
+                writer.close()
+        self._idle.clear()
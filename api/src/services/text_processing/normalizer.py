@@ -6,6 +6,9 @@ Converts them into a format suitable for text-to-speech processing.
 
 import math
 import re
+import threading
+from functools import lru_cache
+from typing import Callable, List, Optional, Tuple
 
 import inflect
 
@@ -139,6 +142,9 @@ URL_PATTERN = re.compile(
     re.IGNORECASE,
 )
 
+# URLs never contain whitespace and always contain a dot or "localhost", so only words like that need the full pattern
+URL_CANDIDATE_PATTERN = re.compile(r"(?<!\S)(?:[^\s.]*\.|\S*?localhost)\S*", re.IGNORECASE)
+
 UNIT_PATTERN = re.compile(
     r"((?<!\w)([+-]?)(\d{1,3}(,\d{3})*|\d+)(\.\d+)?)\s*(" + "|".join(sorted(list(VALID_UNITS.keys()), reverse=True)) + r"""){1}(?=[^\w\d]{1}|\b)""",
     re.IGNORECASE,
@@ -156,7 +162,92 @@ NUMBER_PATTERN = re.compile(
     re.IGNORECASE,
 )
 
+PHONE_PATTERN = re.compile(r"(\+?\d{1,2})?([ .-]?)(\(?\d{3}\)?)[\s.-](\d{3})[\s.-](\d{4})")
+
+DIGIT_PATTERN = re.compile(r"\d")
+
+# Quotes, brackets, CJK punctuation and some non standard chars, replaced in one pass
+CHARACTER_TRANSLATION = str.maketrans(
+    {
+        chr(8216): "'",
+        chr(8217): "'",
+        "«": '"',
+        "»": '"',
+        chr(8220): '"',
+        chr(8221): '"',
+        **{a: b + " " for a, b in zip("、。！，：；？–", ",.!,:;?-")},
+    }
+)
+
+# Any run of whitespace other than newlines collapses to a single space; single spaces are left as they are
+WHITESPACE_PATTERN = re.compile(r"[^\S\n]{2,}|[^\S \n]")
+BLANK_LINE_PATTERN = re.compile(r"(?<=\n) +(?=\n)")
+
+# Titles, abbreviations and "yeah", which never overlap and are handled by one scanner
+WORD_RULES = ("Doctor", "Mister", "Miss", "Mrs", "etc", None)
+WORD_PATTERN = re.compile(
+    r"\b(?:"
+    r"(D[Rr]\.(?= [A-Z]))"
+    r"|(Mr\.|MR\.(?= [A-Z]))"
+    r"|(Ms\.|MS\.(?= [A-Z]))"
+    r"|(Mrs\.|MRS\.(?= [A-Z]))"
+    r"|(etc\.(?! [A-Z]))"
+    r"|(?i:(y)eah?\b)"
+    r")"
+)
+
+THOUSANDS_SEPARATOR_PATTERN = re.compile(r"(?<=\d),(?=\d)")
+DECIMAL_PATTERN = re.compile(r"\d*\.\d+")
+NUMBER_RANGE_PATTERN = re.compile(r"(?<=\d)-(?=\d)")
+NUMBER_SUFFIX_PATTERN = re.compile(r"(?<=\d)S")
+INITIALISM_PLURAL_PATTERN = re.compile(r"(?<=[BCDFGHJ-NP-TV-Z])'?s\b")
+X_PLURAL_PATTERN = re.compile(r"(?<=X')S\b")
+SPACED_ABBREVIATION_PATTERN = re.compile(r"(?:[A-Za-z]\.){2,} [a-z]")
+DOTTED_ABBREVIATION_PATTERN = re.compile(r"(?i)(?<=[A-Z])\.(?=[A-Z])")
+
+URL_PROTOCOL_PATTERN = re.compile(r"^https?://", re.IGNORECASE)
+URL_WWW_PATTERN = re.compile(r"^www\.", re.IGNORECASE)
+URL_PORT_PATTERN = re.compile(r":(\d+)(?=/|$)")
+WHITESPACE_RUN_PATTERN = re.compile(r"\s+")
+
 INFLECT_ENGINE = inflect.engine()
+# The engine keeps per-call state on the instance, so frontend threads take turns
+_inflect_lock = threading.Lock()
+
+VERBALIZATION_CACHE_SIZE = 4096
+
+# Words for 0-99, which cover most counts, clock times and both halves of a year
+SMALL_NUMBER_WORDS = tuple(INFLECT_ENGINE.number_to_words(i) for i in range(100))
+
+
+@lru_cache(maxsize=VERBALIZATION_CACHE_SIZE, typed=True)
+def _number_to_words(number, group: int, comma: str) -> str:
+    with _inflect_lock:
+        return INFLECT_ENGINE.number_to_words(number, group=group, comma=comma)
+
+
+def number_to_words(number, group: int = 0, comma: str = ",") -> str:
+    """Memoized INFLECT_ENGINE.number_to_words, with a table for small numbers"""
+    if group == 0:
+        if type(number) is int and 0 <= number < 100:
+            return SMALL_NUMBER_WORDS[number]
+        if type(number) is str and 0 < len(number) <= 2 and number.isascii() and number.isdigit():
+            return SMALL_NUMBER_WORDS[int(number)]
+    return _number_to_words(number, group, comma)
+
+
+@lru_cache(maxsize=VERBALIZATION_CACHE_SIZE, typed=True)
+def plural(word: str, count) -> str:
+    """Memoized INFLECT_ENGINE.plural"""
+    with _inflect_lock:
+        return INFLECT_ENGINE.plural(word, count=count)
+
+
+@lru_cache(maxsize=VERBALIZATION_CACHE_SIZE, typed=True)
+def no(word: str, count) -> str:
+    """Memoized INFLECT_ENGINE.no"""
+    with _inflect_lock:
+        return INFLECT_ENGINE.no(word, count)
 
 
 def handle_units(u: re.Match[str]) -> str:
@@ -174,7 +265,7 @@ def handle_units(u: re.Match[str]) -> str:
                 unit[0] = unit[0][:-3] + "byte"
 
         number = u.group(1).strip()
-        unit[0] = INFLECT_ENGINE.no(unit[0], number)
+        unit[0] = no(unit[0], number)
     return " ".join(unit)
 
 
@@ -201,7 +292,7 @@ def translate_multiplier(multiplier: str) -> str:
 def split_four_digit(number: float):
     part1 = str(conditional_int(number))[:2]
     part2 = str(conditional_int(number))[2:]
-    return f"{INFLECT_ENGINE.number_to_words(part1)} {INFLECT_ENGINE.number_to_words(part2)}"
+    return f"{number_to_words(part1)} {number_to_words(part2)}"
 
 
 def handle_numbers(n: re.Match[str]) -> str:
@@ -224,7 +315,7 @@ def handle_numbers(n: re.Match[str]) -> str:
         if number % 1 == 0 and len(str(number)) == 4 and number > 1500 and number % 1000 > 9:
             return split_four_digit(number)
 
-    return f"{INFLECT_ENGINE.number_to_words(number)}{multiplier}"
+    return f"{number_to_words(number)}{multiplier}"
 
 
 def handle_money(m: re.Match[str]) -> str:
@@ -248,11 +339,11 @@ def handle_money(m: re.Match[str]) -> str:
         multiplier = f" {multiplier}"
 
     if number % 1 == 0 or multiplier != "":
-        text_number = f"{INFLECT_ENGINE.number_to_words(conditional_int(number))}{multiplier} {INFLECT_ENGINE.plural(bill, count=number)}"
+        text_number = f"{number_to_words(conditional_int(number))}{multiplier} {plural(bill, number)}"
     else:
         sub_number = int(str(number).split(".")[-1].ljust(2, "0"))
 
-        text_number = f"{INFLECT_ENGINE.number_to_words(int(math.floor(number)))} {INFLECT_ENGINE.plural(bill, count=number)} and {INFLECT_ENGINE.number_to_words(sub_number)} {INFLECT_ENGINE.plural(coin, count=sub_number)}"
+        text_number = f"{number_to_words(int(math.floor(number)))} {plural(bill, number)} and {number_to_words(sub_number)} {plural(coin, sub_number)}"
 
     return text_number
 
@@ -282,16 +373,11 @@ def handle_url(u: re.Match[str]) -> str:
     url = u.group(0).strip()
 
     # Handle protocol first
-    url = re.sub(
-        r"^https?://",
-        lambda a: "https " if "https" in a.group() else "http ",
-        url,
-        flags=re.IGNORECASE,
-    )
-    url = re.sub(r"^www\.", "www ", url, flags=re.IGNORECASE)
+    url = URL_PROTOCOL_PATTERN.sub(lambda a: "https " if "https" in a.group() else "http ", url)
+    url = URL_WWW_PATTERN.sub("www ", url)
 
     # Handle port numbers before other replacements
-    url = re.sub(r":(\d+)(?=/|$)", lambda m: f" colon {m.group(1)}", url)
+    url = URL_PORT_PATTERN.sub(lambda m: f" colon {m.group(1)}", url)
 
     # Split into domain and path
     parts = url.split("/", 1)
@@ -318,7 +404,12 @@ def handle_url(u: re.Match[str]) -> str:
     url = url.replace("/", " slash ")  # Handle any remaining slashes
 
     # Clean up extra spaces
-    return re.sub(r"\s+", " ", url).strip()
+    return WHITESPACE_RUN_PATTERN.sub(" ", url).strip()
+
+
+def replace_urls(text: str) -> str:
+    """Make every URL in a text speakable"""
+    return URL_CANDIDATE_PATTERN.sub(lambda m: URL_PATTERN.sub(handle_url, m.group()), text)
 
 
 def handle_phone_number(p: re.Match[str]) -> str:
@@ -327,13 +418,13 @@ def handle_phone_number(p: re.Match[str]) -> str:
     country_code = ""
     if p[0] is not None:
         p[0] = p[0].replace("+", "")
-        country_code += INFLECT_ENGINE.number_to_words(p[0])
+        country_code += number_to_words(p[0])
 
-    area_code = INFLECT_ENGINE.number_to_words(p[2].replace("(", "").replace(")", ""), group=1, comma="")
+    area_code = number_to_words(p[2].replace("(", "").replace(")", ""), group=1, comma="")
 
-    telephone_prefix = INFLECT_ENGINE.number_to_words(p[3], group=1, comma="")
+    telephone_prefix = number_to_words(p[3], group=1, comma="")
 
-    line_number = INFLECT_ENGINE.number_to_words(p[4], group=1, comma="")
+    line_number = number_to_words(p[4], group=1, comma="")
 
     return ",".join([country_code, area_code, telephone_prefix, line_number])
 
@@ -344,9 +435,9 @@ def handle_time(t: re.Match[str]) -> str:
     time_parts = t[0].split(":")
 
     numbers = []
-    numbers.append(INFLECT_ENGINE.number_to_words(time_parts[0].strip()))
+    numbers.append(number_to_words(time_parts[0].strip()))
 
-    minute_number = INFLECT_ENGINE.number_to_words(time_parts[1].strip())
+    minute_number = number_to_words(time_parts[1].strip())
     if int(time_parts[1]) < 10:
         if int(time_parts[1]) != 0:
             numbers.append(f"oh {minute_number}")
@@ -355,8 +446,8 @@ def handle_time(t: re.Match[str]) -> str:
 
     half = ""
     if len(time_parts) > 2:
-        seconds_number = INFLECT_ENGINE.number_to_words(time_parts[2].strip())
-        second_word = INFLECT_ENGINE.plural("second", int(time_parts[2].strip()))
+        seconds_number = number_to_words(time_parts[2].strip())
+        second_word = plural("second", int(time_parts[2].strip()))
         numbers.append(f"and {seconds_number} {second_word}")
     else:
         if t[2] is not None:
@@ -368,80 +459,110 @@ def handle_time(t: re.Match[str]) -> str:
     return " ".join(numbers) + half
 
 
-def normalize_text(text: str, normalization_options: NormalizationOptions) -> str:
+def handle_words(text: str) -> str:
+    """Expand titles and abbreviations and respell "yeah" in a single scan"""
+    # The rules used to run one after another, and each expansion ends in a letter. A match
+    # directly after the expansion of an earlier rule therefore lost its word boundary and
+    # was left alone, which is kept here
+    last_end, last_rule = -1, -1
+
+    def replace(m: re.Match[str]) -> str:
+        nonlocal last_end, last_rule
+        rule = m.lastindex - 1
+        if m.start() == last_end and rule > last_rule:
+            return m.group()
+        last_end, last_rule = m.end(), rule
+        if WORD_RULES[rule] is None:
+            return m.group(6) + "e'a"
+        return WORD_RULES[rule]
+
+    return WORD_PATTERN.sub(replace, text)
+
+
+Rule = Tuple[bool, str, Callable[[str], str]]
+
+
+class Normalizer:
+    """Text normalization for one set of NormalizationOptions.
+
+    The enabled rules are resolved once into a list of precompiled passes. Rules that
+    can't interfere with each other share a pass: quote and CJK replacements are a single
+    str.translate, whitespace cleanup a single pattern, and titles and "yeah" a single
+    scanner. A pass is skipped when the text lacks the characters it needs, e.g. all the
+    number rules when the text has no digits.
+    """
+
+    def __init__(self, normalization_options: NormalizationOptions):
+        # Each rule is (needs digits, characters it needs, pass)
+        rules: List[Rule] = []
+
+        # Handle email addresses first if enabled
+        if normalization_options.email_normalization:
+            rules.append((False, "@", lambda text: EMAIL_PATTERN.sub(handle_email, text)))
+
+        # Handle URLs if enabled
+        if normalization_options.url_normalization:
+            rules.append((False, "", replace_urls))
+
+        # Pre-process numbers with units if enabled
+        if normalization_options.unit_normalization:
+            rules.append((True, "", lambda text: UNIT_PATTERN.sub(handle_units, text)))
+
+        # Replace optional pluralization
+        if normalization_options.optional_pluralization_normalization:
+            rules.append((False, "(s)", lambda text: text.replace("(s)", "s")))
+
+        # Replace phone numbers
+        if normalization_options.phone_normalization:
+            rules.append((True, "", lambda text: PHONE_PATTERN.sub(handle_phone_number, text)))
+
+        rules += [
+            # Replace quotes, brackets and CJK punctuation
+            (False, "", lambda text: text.translate(CHARACTER_TRANSLATION)),
+            # Handle simple time in the format of HH:MM:SS (am/pm)
+            (True, ":", lambda text: TIME_PATTERN.sub(handle_time, text)),
+            # Clean up whitespace
+            (False, "", lambda text: WHITESPACE_PATTERN.sub(" ", text)),
+            (False, "\n", lambda text: BLANK_LINE_PATTERN.sub("", text)),
+            # Handle titles, abbreviations and common words
+            (False, "", handle_words),
+            # Handle numbers and money
+            (True, ",", lambda text: THOUSANDS_SEPARATOR_PATTERN.sub("", text)),
+            (True, "", lambda text: MONEY_PATTERN.sub(handle_money, text)),
+            (True, "", lambda text: NUMBER_PATTERN.sub(handle_numbers, text)),
+            (True, ".", lambda text: DECIMAL_PATTERN.sub(handle_decimal, text)),
+            # Handle various formatting
+            (True, "-", lambda text: NUMBER_RANGE_PATTERN.sub(" to ", text)),
+            (True, "S", lambda text: NUMBER_SUFFIX_PATTERN.sub(" S", text)),
+            (False, "s", lambda text: INITIALISM_PLURAL_PATTERN.sub("'S", text)),
+            (False, "X'S", lambda text: X_PLURAL_PATTERN.sub("s", text)),
+            (False, ".", lambda text: SPACED_ABBREVIATION_PATTERN.sub(lambda m: m.group().replace(".", "-"), text)),
+            (False, ".", lambda text: DOTTED_ABBREVIATION_PATTERN.sub("-", text)),
+        ]
+        self.rules = rules
+
+    def __call__(self, text: str) -> str:
+        # No rule turns text into digits, so digit-only rules can be skipped up front
+        has_digits = DIGIT_PATTERN.search(text) is not None
+        for needs_digits, needs, rule in self.rules:
+            if needs_digits and not has_digits:
+                continue
+            if needs and needs not in text:
+                continue
+            text = rule(text)
+        return text.strip()
+
+
+@lru_cache(maxsize=64)
+def _get_normalizer(options: Tuple[Tuple[str, bool], ...]) -> Normalizer:
+    return Normalizer(NormalizationOptions(**dict(options)))
+
+
+def get_normalizer(normalization_options: NormalizationOptions) -> Normalizer:
+    """Get the shared Normalizer for a set of options"""
+    return _get_normalizer(tuple(sorted(normalization_options.model_dump().items())))
+
+
+def normalize_text(text: str, normalization_options: Optional[NormalizationOptions] = None) -> str:
     """Normalize text for TTS processing"""
-    # Handle email addresses first if enabled
-    if normalization_options.email_normalization:
-        text = EMAIL_PATTERN.sub(handle_email, text)
-
-    # Handle URLs if enabled
-    if normalization_options.url_normalization:
-        text = URL_PATTERN.sub(handle_url, text)
-
-    # Pre-process numbers with units if enabled
-    if normalization_options.unit_normalization:
-        text = UNIT_PATTERN.sub(handle_units, text)
-
-    # Replace optional pluralization
-    if normalization_options.optional_pluralization_normalization:
-        text = re.sub(r"\(s\)", "s", text)
-
-    # Replace phone numbers:
-    if normalization_options.phone_normalization:
-        text = re.sub(
-            r"(\+?\d{1,2})?([ .-]?)(\(?\d{3}\)?)[\s.-](\d{3})[\s.-](\d{4})",
-            handle_phone_number,
-            text,
-        )
-
-    # Replace quotes and brackets
-    text = text.replace(chr(8216), "'").replace(chr(8217), "'")
-    text = text.replace("«", chr(8220)).replace("»", chr(8221))
-    text = text.replace(chr(8220), '"').replace(chr(8221), '"')
-
-    # Handle CJK punctuation and some non standard chars
-    for a, b in zip("、。！，：；？–", ",.!,:;?-"):
-        text = text.replace(a, b + " ")
-
-    # Handle simple time in the format of HH:MM:SS (am/pm)
-    text = TIME_PATTERN.sub(
-        handle_time,
-        text,
-    )
-
-    # Clean up whitespace
-    text = re.sub(r"[^\S \n]", " ", text)
-    text = re.sub(r"  +", " ", text)
-    text = re.sub(r"(?<=\n) +(?=\n)", "", text)
-
-    # Handle titles and abbreviations
-    text = re.sub(r"\bD[Rr]\.(?= [A-Z])", "Doctor", text)
-    text = re.sub(r"\b(?:Mr\.|MR\.(?= [A-Z]))", "Mister", text)
-    text = re.sub(r"\b(?:Ms\.|MS\.(?= [A-Z]))", "Miss", text)
-    text = re.sub(r"\b(?:Mrs\.|MRS\.(?= [A-Z]))", "Mrs", text)
-    text = re.sub(r"\betc\.(?! [A-Z])", "etc", text)
-
-    # Handle common words
-    text = re.sub(r"(?i)\b(y)eah?\b", r"\1e'a", text)
-
-    # Handle numbers and money
-    text = re.sub(r"(?<=\d),(?=\d)", "", text)
-
-    text = MONEY_PATTERN.sub(
-        handle_money,
-        text,
-    )
-
-    text = NUMBER_PATTERN.sub(handle_numbers, text)
-
-    text = re.sub(r"\d*\.\d+", handle_decimal, text)
-
-    # Handle various formatting
-    text = re.sub(r"(?<=\d)-(?=\d)", " to ", text)
-    text = re.sub(r"(?<=\d)S", " S", text)
-    text = re.sub(r"(?<=[BCDFGHJ-NP-TV-Z])'?s\b", "'S", text)
-    text = re.sub(r"(?<=X')S\b", "s", text)
-    text = re.sub(r"(?:[A-Za-z]\.){2,} [a-z]", lambda m: m.group().replace(".", "-"), text)
-    text = re.sub(r"(?i)(?<=[A-Z])\.(?=[A-Z])", "-", text)
-
-    return text.strip()
+    return get_normalizer(normalization_options or NormalizationOptions())(text)
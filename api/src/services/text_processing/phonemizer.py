@@ -1,11 +1,26 @@
 import re
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import List, Tuple
 
 import phonemizer
 
+from ...core.config import settings
 from .normalizer import normalize_text
 
 phonemizers = {}
+_phonemizers_lock = threading.Lock()
+
+# LRU of post-processed phonemes keyed by (language, text), shared by all frontend threads
+_phoneme_cache: OrderedDict[Tuple[str, str], str] = OrderedDict()
+_phoneme_cache_lock = threading.Lock()
+
+# Pre-compiled post-processing patterns
+HUNDRED_PATTERN = re.compile(r"(?<=[a-zɹː])(?=hˈʌndɹɪd)")
+TRAILING_Z_PATTERN = re.compile(r' z(?=[;:,.!?¡¿—…"«»"" ]|$)')
+NINETY_PATTERN = re.compile(r"(?<=nˈaɪn)ti(?!ː)")
+CHARACTER_FIXES = str.maketrans({"ʲ": "j", "r": "ɹ", "x": "k", "ɬ": "l"})
 
 
 class PhonemizerBackend(ABC):
@@ -23,6 +38,17 @@ class PhonemizerBackend(ABC):
         """
         pass
 
+    def phonemize_batch(self, texts: List[str]) -> List[str]:
+        """Convert several texts to phonemes
+
+        Args:
+            texts: Texts to convert to phonemes
+
+        Returns:
+            Phonemized texts, in the same order
+        """
+        return [self.phonemize(text) for text in texts]
+
 
 class EspeakBackend(PhonemizerBackend):
     """Espeak-based phonemizer implementation"""
@@ -34,6 +60,8 @@ class EspeakBackend(PhonemizerBackend):
             language: Language code ('en-us' or 'en-gb')
         """
         self.backend = phonemizer.backend.EspeakBackend(language=language, preserve_punctuation=True, with_stress=True)
+        # espeak keeps global state per loaded library, so calls from frontend threads must not overlap
+        self._lock = threading.Lock()
 
         self.language = language
 
@@ -47,18 +75,37 @@ class EspeakBackend(PhonemizerBackend):
             Phonemized text
         """
         # Phonemize text
-        ps = self.backend.phonemize([text])
+        with self._lock:
+            ps = self.backend.phonemize([text])
         ps = ps[0] if ps else ""
+        return self._postprocess(ps)
+
+    def phonemize_batch(self, texts: List[str]) -> List[str]:
+        """Convert several texts to phonemes with a single espeak call
+
+        Args:
+            texts: Texts to convert to phonemes
 
+        Returns:
+            Phonemized texts, in the same order
+        """
+        with self._lock:
+            results = self.backend.phonemize(texts)
+        if len(results) != len(texts):
+            # espeak dropped or merged lines, e.g. for punctuation-only input
+            return [self.phonemize(text) for text in texts]
+        return [self._postprocess(ps) for ps in results]
+
+    def _postprocess(self, ps: str) -> str:
         # Handle special cases
         ps = ps.replace("kəkˈoːɹoʊ", "kˈoʊkəɹoʊ").replace("kəkˈɔːɹəʊ", "kˈəʊkəɹəʊ")
-        ps = ps.replace("ʲ", "j").replace("r", "ɹ").replace("x", "k").replace("ɬ", "l")
-        ps = re.sub(r"(?<=[a-zɹː])(?=hˈʌndɹɪd)", " ", ps)
-        ps = re.sub(r' z(?=[;:,.!?¡¿—…"«»"" ]|$)', "z", ps)
+        ps = ps.translate(CHARACTER_FIXES)
+        ps = HUNDRED_PATTERN.sub(" ", ps)
+        ps = TRAILING_Z_PATTERN.sub("z", ps)
 
         # Language-specific rules
         if self.language == "en-us":
-            ps = re.sub(r"(?<=nˈaɪn)ti(?!ː)", "di", ps)
+            ps = NINETY_PATTERN.sub("di", ps)
 
         return ps.strip()
 
@@ -81,6 +128,56 @@ def create_phonemizer(language: str = "a") -> PhonemizerBackend:
     return EspeakBackend(lang_map[language])
 
 
+def get_phonemizer(language: str = "a") -> PhonemizerBackend:
+    """Get the shared phonemizer backend for a language, creating it on first use"""
+    if language not in phonemizers:
+        with _phonemizers_lock:
+            if language not in phonemizers:
+                phonemizers[language] = create_phonemizer(language)
+    return phonemizers[language]
+
+
+def _cache_phonemes(key: Tuple[str, str], phonemes: str) -> None:
+    with _phoneme_cache_lock:
+        _phoneme_cache[key] = phonemes
+        _phoneme_cache.move_to_end(key)
+        while len(_phoneme_cache) > settings.phoneme_cache_size:
+            _phoneme_cache.popitem(last=False)
+
+
+def phonemize_batch(texts: List[str], language: str = "a") -> List[str]:
+    """Convert already normalized texts to phonemes
+
+    Cached texts are served from the LRU cache and all others are sent to the
+    backend in one batch.
+
+    Args:
+        texts: Texts to convert to phonemes
+        language: Language code ('a' for US English, 'b' for British English)
+
+    Returns:
+        Phonemized texts, in the same order
+    """
+    results = [None] * len(texts)
+    missing = {}
+    with _phoneme_cache_lock:
+        for i, text in enumerate(texts):
+            phonemes = _phoneme_cache.get((language, text))
+            if phonemes is not None:
+                _phoneme_cache.move_to_end((language, text))
+                results[i] = phonemes
+            else:
+                missing.setdefault(text, []).append(i)
+
+    if missing:
+        for text, phonemes in zip(missing, get_phonemizer(language).phonemize_batch(list(missing))):
+            for i in missing[text]:
+                results[i] = phonemes
+            if settings.phoneme_cache_size > 0:
+                _cache_phonemes((language, text), phonemes)
+    return results
+
+
 def phonemize(text: str, language: str = "a", normalize: bool = True) -> str:
     """Convert text to phonemes
 
@@ -92,9 +189,6 @@ def phonemize(text: str, language: str = "a", normalize: bool = True) -> str:
     Returns:
         Phonemized text
     """
-    global phonemizers
     if normalize:
         text = normalize_text(text)
-    if language not in phonemizers:
-        phonemizers[language] = create_phonemizer(language)
-    return phonemizers[language].phonemize(text)
+    return phonemize_batch([text], language)[0]
@@ -1,19 +1,43 @@
 """Unified text processing for TTS with smart chunking."""
 
+import asyncio
+import math
+import multiprocessing
 import re
+import threading
 import time
-from typing import AsyncGenerator, Dict, List, Tuple
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import AsyncGenerator, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from loguru import logger
 
+from ...core.concurrency import iterate_in_executor
 from ...core.config import settings
 from ...structures.schemas import NormalizationOptions
 from .normalizer import normalize_text
-from .phonemizer import phonemize
-from .vocabulary import tokenize
+from .phonemizer import phonemize, phonemize_batch
+from .vocabulary import VOCAB, tokenize
 
 # Pre-compiled regex patterns for performance
 CUSTOM_PHONEMES = re.compile(r"(\[([^\]]|\n)*?\])(\(\/([^\/)]|\n)*?\/\))")
+CUSTOM_PHONEME_ID = re.compile(r"</\|custom_phonemes_\d+\|/>")
+
+# Sentence ends in raw text that stay sentence ends after normalization. Only a capital
+# letter or an opening quote or bracket after the break is safe: digits, symbols and
+# dashes can normalize to lowercase words that the abbreviation rules join with "p.m.".
+SEGMENT_BOUNDARY = re.compile(r"(?<=[.!?])\s+(?=[A-Z\"'“‘«(\[])|(?<=[。！？；])(?![，。！？；])")
+SEGMENT_ABBREVIATIONS = re.compile(r"\b(?:Dr|DR|Mr|MR|Ms|MS|Mrs|MRS|etc)\.$")
+
+SPACE_TOKEN = VOCAB[" "]
+
+# Text preparation runs here so normalization and espeak don't block the event loop
+_frontend_executor = ThreadPoolExecutor(thread_name_prefix="text-frontend")
+
+# Optional worker processes for long texts, see text_frontend_processes
+_frontend_pool: Optional[ProcessPoolExecutor] = None
+_frontend_pool_lock = threading.Lock()
 
 
 def process_text_chunk(text: str, language: str = "a", skip_phonemize: bool = False) -> List[int]:
@@ -79,32 +103,260 @@ def process_text(text: str, language: str = "a") -> List[int]:
     return process_text_chunk(text, language)
 
 
-def get_sentence_info(text: str, custom_phenomes_list: Dict[str, str], lang_code: str = "a") -> List[Tuple[str, List[int], int]]:
-    """Process all sentences and return info, 支持中文分句"""
+def split_segments(text: str) -> Iterator[str]:
+    """Lazily split raw text at sentence ends that normalization can't move.
+
+    Each segment can be normalized on its own and still split into the same
+    sentences as the whole text would, so sentences are processed as the
+    text is consumed instead of all up front.
+    """
+    start = 0
+    for match in SEGMENT_BOUNDARY.finditer(text):
+        end = match.start()
+        # Titles and "etc." are rewritten depending on the word that follows them
+        if SEGMENT_ABBREVIATIONS.search(text, max(start, end - 4), end):
+            continue
+        if end > start:
+            yield text[start:end]
+        start = match.end()
+    if start < len(text):
+        yield text[start:]
+
+
+def split_sentences(
+    text: str,
+    custom_phenomes_list: Dict[str, str],
+    lang_code: str = "a",
+    is_chinese: Optional[bool] = None,
+) -> Iterator[str]:
+    """Split text into sentences with their punctuation, 支持中文分句"""
     # 判断是否为中文
-    is_chinese = lang_code.startswith("z") or re.search(r"[\u4e00-\u9fff]", text)
+    if is_chinese is None:
+        is_chinese = lang_code.startswith("z") or re.search(r"[\u4e00-\u9fff]", text)
     if is_chinese:
         # 按中文标点断句
         sentences = re.split(r"([，。！？；])+", text)
     else:
         sentences = re.split(r"([.!?;:])(?=\s|$)", text)
-    phoneme_length, min_value = len(custom_phenomes_list), 0
 
-    results = []
     for i in range(0, len(sentences), 2):
         sentence = sentences[i].strip()
-        for replaced in range(min_value, phoneme_length):
-            current_id = f"</|custom_phonemes_{replaced}|/>"
-            if current_id in sentence:
-                sentence = sentence.replace(current_id, custom_phenomes_list.pop(current_id))
-                min_value += 1
+        if custom_phenomes_list:
+            sentence = CUSTOM_PHONEME_ID.sub(lambda m: custom_phenomes_list.pop(m.group(0), m.group(0)), sentence)
         punct = sentences[i + 1] if i + 1 < len(sentences) else ""
         if not sentence:
             continue
-        full = sentence + punct
-        tokens = process_text_chunk(full)
-        results.append((full, tokens, len(tokens)))
-    return results
+        yield sentence + punct
+
+
+def tokenize_sentences(sentences: List[str], lang_code: str = "a") -> Iterator[Tuple[str, List[int], int]]:
+    """Phonemize sentences in one batch and yield their info."""
+    # Chunk phonemes may be synthesized directly, so English variants get their own espeak voice
+    language = lang_code if lang_code in ("a", "b") else "a"
+    for sentence, phonemes in zip(sentences, phonemize_batch(sentences, language)):
+        tokens = tokenize(phonemes)
+        yield sentence, tokens, len(tokens)
+
+
+def get_sentence_info(
+    text: str,
+    custom_phenomes_list: Dict[str, str],
+    lang_code: str = "a",
+    is_chinese: Optional[bool] = None,
+) -> Iterator[Tuple[str, List[int], int]]:
+    """Process sentences and yield their info, 支持中文分句"""
+    yield from tokenize_sentences(list(split_sentences(text, custom_phenomes_list, lang_code, is_chinese)), lang_code)
+
+
+def prepare_segments(
+    segments: Iterable[str],
+    custom_phenomes_list: Dict[str, str],
+    lang_code: str,
+    normalization_options: NormalizationOptions,
+    normalize: bool,
+    is_chinese: bool,
+) -> Iterator[Tuple[str, List[int], int]]:
+    """Normalize, split and phonemize segments sentence by sentence as they are consumed.
+
+    Sentences are phonemized in batches that start with a single segment, so the first
+    chunk isn't held back, and double up to phoneme_batch_size sentences.
+    """
+    batch = []
+    batch_size = 1
+    for segment in segments:
+        if normalize:
+            segment = normalize_text(segment, normalization_options)
+        batch.extend(split_sentences(segment, custom_phenomes_list, lang_code=lang_code, is_chinese=is_chinese))
+        if len(batch) >= batch_size:
+            yield from tokenize_sentences(batch, lang_code)
+            batch = []
+            batch_size = min(batch_size * 2, settings.phoneme_batch_size)
+    if batch:
+        yield from tokenize_sentences(batch, lang_code)
+
+
+def prepare_partition(
+    segments: List[str],
+    custom_phenomes_list: Dict[str, str],
+    lang_code: str,
+    normalization_options: NormalizationOptions,
+    normalize: bool,
+    is_chinese: bool,
+) -> List[Tuple[str, List[int], int]]:
+    """Sentence info of a run of segments, computed in a frontend worker process."""
+    return list(prepare_segments(segments, custom_phenomes_list, lang_code, normalization_options, normalize, is_chinese))
+
+
+def partition_segments(segments: Iterable[str], partition_chars: int) -> Iterator[List[str]]:
+    """Group consecutive segments into partitions of at least partition_chars characters."""
+    partition = []
+    size = 0
+    for segment in segments:
+        partition.append(segment)
+        size += len(segment)
+        if size >= partition_chars:
+            yield partition
+            partition = []
+            size = 0
+    if partition:
+        yield partition
+
+
+def get_frontend_pool() -> ProcessPoolExecutor:
+    """The shared pool of text frontend processes, started on first use."""
+    global _frontend_pool
+    with _frontend_pool_lock:
+        if _frontend_pool is None:
+            # Spawned rather than forked: the parent runs threads and may hold a GPU context
+            _frontend_pool = ProcessPoolExecutor(
+                max_workers=settings.text_frontend_processes,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.info(f"Started {settings.text_frontend_processes} text frontend processes")
+        return _frontend_pool
+
+
+async def warm_frontend_pool() -> None:
+    """Start the frontend processes ahead of the first long request.
+
+    Spawning a process imports the service and loads espeak, which would otherwise
+    delay the first request that uses the pool by seconds.
+    """
+    pool = get_frontend_pool()
+    await asyncio.gather(
+        *(
+            asyncio.wrap_future(pool.submit(prepare_partition, ["Hello world."], {}, "a", NormalizationOptions(), True, False))
+            for _ in range(settings.text_frontend_processes)
+        )
+    )
+
+
+def shutdown_frontend_pool() -> None:
+    """Stop the text frontend processes, if they were started."""
+    global _frontend_pool
+    with _frontend_pool_lock:
+        if _frontend_pool is not None:
+            _frontend_pool.shutdown(wait=False, cancel_futures=True)
+            _frontend_pool = None
+
+
+def prepare_segments_in_pool(
+    segments: Iterable[str],
+    custom_phenomes_list: Dict[str, str],
+    lang_code: str,
+    normalization_options: NormalizationOptions,
+    normalize: bool,
+    is_chinese: bool,
+) -> Iterator[Tuple[str, List[int], int]]:
+    """prepare_segments spread over the frontend processes, in the original order.
+
+    The first partition is prepared in this thread with the usual small first batch, so
+    the first chunk doesn't wait for a worker, while the following partitions are
+    already being prepared in parallel. At most two partitions per process are in
+    flight, which bounds the memory held for a slow consumer.
+    """
+    pool = get_frontend_pool()
+    partitions = partition_segments(segments, settings.text_frontend_partition_chars)
+    first = next(partitions, None)
+    if first is None:
+        return
+
+    args = (dict(custom_phenomes_list), lang_code, normalization_options, normalize, is_chinese)
+    pending = deque()
+
+    def submit() -> None:
+        while len(pending) < 2 * settings.text_frontend_processes:
+            partition = next(partitions, None)
+            if partition is None:
+                return
+            pending.append(pool.submit(prepare_partition, partition, *args))
+
+    try:
+        submit()
+        yield from prepare_segments(first, custom_phenomes_list, lang_code, normalization_options, normalize, is_chinese)
+        while pending:
+            sentences = pending.popleft().result()
+            submit()
+            yield from sentences
+    except BrokenProcessPool:
+        # A worker died; let the next request start a fresh pool
+        shutdown_frontend_pool()
+        raise
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def iter_sentence_info(
+    text: str,
+    lang_code: str = "a",
+    normalization_options: NormalizationOptions = NormalizationOptions(),
+) -> Iterator[Tuple[str, List[int], int]]:
+    """Normalize, split and phonemize text sentence by sentence as it is consumed.
+
+    Long texts are spread over the frontend processes when text_frontend_processes is
+    set. They are partitioned at the same safe sentence ends, so the result is the same.
+    """
+    custom_phoneme_list = {}
+    normalize = settings.advanced_text_normalization and normalization_options.normalize
+    if normalize:
+        if lang_code in ["a", "b", "en-us", "en-gb"]:
+            text = CUSTOM_PHONEMES.sub(lambda s: handle_custom_phonemes(s, custom_phoneme_list), text)
+        else:
+            logger.info("Skipping text normalization as it is only supported for english")
+            normalize = False
+
+    is_chinese = bool(lang_code.startswith("z") or re.search(r"[\u4e00-\u9fff]", text))
+    prepare = prepare_segments
+    if settings.text_frontend_processes > 0 and len(text) > settings.text_frontend_partition_chars:
+        prepare = prepare_segments_in_pool
+    yield from prepare(split_segments(text), custom_phoneme_list, lang_code, normalization_options, normalize, is_chinese)
+
+
+def append_tokens(chunk_tokens: List[int], tokens: List[int]) -> None:
+    """Append a sentence's tokens to a chunk, keeping the word break the chunk text gets from " ".join."""
+    if chunk_tokens:
+        chunk_tokens.append(SPACE_TOKEN)
+    chunk_tokens.extend(tokens)
+
+
+def chunk_targets(chunk_index: int, first_chunk_tokens: Optional[int] = None) -> Tuple[int, int]:
+    """Token (min, max) targets for the chunk at chunk_index.
+
+    Without first_chunk_tokens every chunk aims at the configured target range. With it,
+    the first chunk aims at first_chunk_tokens and each following one grows by
+    stream_chunk_growth until it reaches that range.
+    """
+    if not first_chunk_tokens:
+        return settings.target_min_tokens, settings.target_max_tokens
+    growth = max(settings.stream_chunk_growth, 1.0)
+    target = float(first_chunk_tokens)
+    if growth > 1.0 and target < settings.target_max_tokens:
+        # Growth stops at the target range, so late chunks of long streams don't overflow
+        steps = math.ceil(math.log(settings.target_max_tokens / target, growth))
+        target *= growth ** min(chunk_index, steps)
+    target_max = min(int(target), settings.target_max_tokens)
+    return min(settings.target_min_tokens, target_max), target_max
 
 
 def handle_custom_phonemes(s: re.Match[str], phenomes_list: Dict[str, str]) -> str:
@@ -113,37 +365,37 @@ def handle_custom_phonemes(s: re.Match[str], phenomes_list: Dict[str, str]) -> s
     return latest_id
 
 
-async def smart_split(
+def split_chunks(
     text: str,
     max_tokens: int = settings.absolute_max_tokens,
     lang_code: str = "a",
     normalization_options: NormalizationOptions = NormalizationOptions(),
-) -> AsyncGenerator[Tuple[str, List[int]], None]:
-    """Build optimal chunks targeting 300-400 tokens, never exceeding max_tokens."""
+    first_chunk_tokens: Optional[int] = None,
+) -> Iterator[Tuple[str, List[int]]]:
+    """Build optimal chunks targeting 300-400 tokens, never exceeding max_tokens.
+
+    If first_chunk_tokens is set, chunks start at that size and grow towards the
+    target range, so a stream can start playing before a full-size chunk is ready.
+    """
     start_time = time.time()
     chunk_count = 0
     logger.info(f"Starting smart split for {len(text)} chars")
 
-    custom_phoneme_list = {}
+    language = lang_code if lang_code in ("a", "b") else "a"
 
-    # Normalize text
-    if settings.advanced_text_normalization and normalization_options.normalize:
-        if lang_code in ["a", "b", "en-us", "en-gb"]:
-            text = CUSTOM_PHONEMES.sub(lambda s: handle_custom_phonemes(s, custom_phoneme_list), text)
-            text = normalize_text(text, normalization_options)
-        else:
-            logger.info("Skipping text normalization as it is only supported for english")
-
-    # Process all sentences
-    sentences = get_sentence_info(text, custom_phoneme_list, lang_code=lang_code)
+    # Sentences are produced lazily, so the first chunk is ready as soon as it is full
+    sentences = iter_sentence_info(text, lang_code=lang_code, normalization_options=normalization_options)
 
     current_chunk = []
     current_tokens = []
     current_count = 0
 
     for sentence, tokens, count in sentences:
-        # Handle sentences that exceed max tokens
-        if count > max_tokens:
+        target_min, target_max = chunk_targets(chunk_count, first_chunk_tokens)
+
+        # Handle sentences that exceed max tokens, or that are too long for an early
+        # chunk that is still meant to be smaller than the target range
+        if count > max_tokens or (target_max < settings.target_max_tokens and count > target_max):
             # Yield current chunk if any
             if current_chunk:
                 chunk_text = " ".join(current_chunk)
@@ -169,13 +421,13 @@ async def smart_split(
 
                 full_clause = clause + comma
 
-                tokens = process_text_chunk(full_clause)
+                tokens = process_text_chunk(full_clause, language)
                 count = len(tokens)
 
                 # If adding clause keeps us under max and not optimal yet
-                if clause_count + count <= max_tokens and clause_count + count <= settings.target_max_tokens:
+                if clause_count + count <= max_tokens and clause_count + count <= chunk_targets(chunk_count, first_chunk_tokens)[1]:
                     clause_chunk.append(full_clause)
-                    clause_tokens.extend(tokens)
+                    append_tokens(clause_tokens, tokens)
                     clause_count += count
                 else:
                     # Yield clause chunk if we have one
@@ -196,7 +448,7 @@ async def smart_split(
                 yield chunk_text, clause_tokens
 
         # Regular sentence handling
-        elif current_count >= settings.target_min_tokens and current_count + count > settings.target_max_tokens:
+        elif current_count >= target_min and current_count + count > target_max:
             # If we have a good sized chunk and adding next sentence exceeds target,
             # yield current chunk and start new one
             chunk_text = " ".join(current_chunk)
@@ -206,15 +458,15 @@ async def smart_split(
             current_chunk = [sentence]
             current_tokens = tokens
             current_count = count
-        elif current_count + count <= settings.target_max_tokens:
+        elif current_count + count <= target_max:
             # Keep building chunk while under target max
             current_chunk.append(sentence)
-            current_tokens.extend(tokens)
+            append_tokens(current_tokens, tokens)
             current_count += count
-        elif current_count + count <= max_tokens and current_count < settings.target_min_tokens:
+        elif current_count + count <= max_tokens and current_count < target_min:
             # Only exceed target max if we haven't reached minimum size yet
             current_chunk.append(sentence)
-            current_tokens.extend(tokens)
+            append_tokens(current_tokens, tokens)
             current_count += count
         else:
             # Yield current chunk and start new one
@@ -236,3 +488,29 @@ async def smart_split(
 
     total_time = time.time() - start_time
     logger.info(f"Split completed in {total_time * 1000:.2f}ms, produced {chunk_count} chunks")
+
+
+async def smart_split(
+    text: str,
+    max_tokens: int = settings.absolute_max_tokens,
+    lang_code: str = "a",
+    normalization_options: NormalizationOptions = NormalizationOptions(),
+    first_chunk_tokens: Optional[int] = None,
+    lookahead: Optional[int] = None,
+) -> AsyncGenerator[Tuple[str, List[int]], None]:
+    """Yield the chunks of split_chunks, preparing them in a frontend thread.
+
+    Up to lookahead chunks (pipeline_text_queue_size by default) are prepared ahead
+    of the caller, so the next chunks are normalized and phonemized while the
+    current one is synthesized.
+    """
+    chunks = split_chunks(
+        text,
+        max_tokens=max_tokens,
+        lang_code=lang_code,
+        normalization_options=normalization_options,
+        first_chunk_tokens=first_chunk_tokens,
+    )
+    maxsize = settings.pipeline_text_queue_size if lookahead is None else lookahead
+    async for chunk in iterate_in_executor(chunks, _frontend_executor, maxsize=maxsize):
+        yield chunk
@@ -12,6 +12,7 @@ def get_vocab():
 
 # Initialize vocabulary
 VOCAB = get_vocab()
+ID_TO_SYMBOL = {i: s for s, i in VOCAB.items()}
 
 
 def tokenize(phonemes: str) -> list[int]:
@@ -35,6 +36,4 @@ def decode_tokens(tokens: list[int]) -> str:
     Returns:
         String of phonemes
     """
-    # Create reverse mapping
-    id_to_symbol = {i: s for s, i in VOCAB.items()}
-    return "".join(id_to_symbol[t] for t in tokens)
+    return "".join(ID_TO_SYMBOL[t] for t in tokens)
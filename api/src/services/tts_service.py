@@ -1,14 +1,14 @@
 import asyncio
 import os
 import re
-import tempfile
 import time
-from typing import AsyncGenerator, List, Optional, Tuple
+from typing import AsyncGenerator, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import torch
 from loguru import logger
 
+from ..core.concurrency import SharedStream
 from ..core.config import settings
 from ..inference.base import AudioChunk
 from ..inference.kokoro_v1 import KokoroV1
@@ -16,21 +16,27 @@ from ..inference.model_manager import get_manager as get_model_manager
 from ..inference.voice_manager import get_manager as get_voice_manager
 from ..structures.schemas import NormalizationOptions
 from .audio import AudioNormalizer, AudioService
+from .audio_cache import audio_cache_key, get_chunk_cache
+from .encoder_pool import get_encoder_pool
 from .streaming_audio_writer import StreamingAudioWriter
-from .text_processing.text_processor import smart_split
+from .text_processing.text_processor import CUSTOM_PHONEMES, smart_split
+from .text_processing.vocabulary import decode_tokens
 
 
 class TTSService:
     """Text-to-speech service."""
 
     # Limit concurrent chunk processing
-    _chunk_semaphore = asyncio.Semaphore(4)
+    _chunk_semaphore = asyncio.Semaphore(settings.max_concurrent_chunks)
 
     def __init__(self, output_dir: str = None):
         """Initialize service."""
         self.output_dir = output_dir
         self.model_manager = None
         self._voice_manager = None
+        # Generations in progress by request key, joined by identical concurrent requests,
+        # with the errors of chunks that failed in them
+        self._flights: Dict[str, Tuple[SharedStream[AudioChunk], List[str]]] = {}
 
     @classmethod
     async def create(cls, output_dir: str = None) -> "TTSService":
@@ -40,134 +46,180 @@ class TTSService:
         service._voice_manager = await get_voice_manager()
         return service
 
-    async def _process_chunk(
+    @staticmethod
+    def _can_reuse_chunk_phonemes(chunk_text: str, tokens: List[int], lang_code: Optional[str], return_timestamps: bool) -> bool:
+        """Whether a chunk can be synthesized straight from the phonemes smart_split produced."""
+        return (
+            settings.single_pass_phonemization
+            and not return_timestamps  # word timestamps need the pipeline's grapheme alignment
+            and lang_code in ("a", "b")
+            and 0 < len(tokens) <= 510
+            and not CUSTOM_PHONEMES.search(chunk_text)
+        )
+
+    async def _generate_from_chunk_tokens(
+        self,
+        backend: KokoroV1,
+        tokens: List[int],
+        voice_name: str,
+        voice_path: Union[str, torch.Tensor],
+        speed: float,
+        lang_code: Optional[str] = None,
+    ) -> AsyncGenerator[AudioChunk, None]:
+        async for audio in backend.generate_from_tokens(decode_tokens(tokens), (voice_name, voice_path), speed=speed, lang_code=lang_code):
+            yield AudioChunk(audio)
+
+    async def _synthesize_chunk(
         self,
         chunk_text: str,
         tokens: List[int],
         voice_name: str,
-        voice_path: str,
+        voice_path: Union[str, torch.Tensor],
         speed: float,
-        writer: StreamingAudioWriter,
-        output_format: Optional[str] = None,
-        is_first: bool = False,
-        is_last: bool = False,
-        normalizer: Optional[AudioNormalizer] = None,
         lang_code: Optional[str] = None,
         return_timestamps: Optional[bool] = False,
     ) -> AsyncGenerator[AudioChunk, None]:
-        """Process tokens into audio."""
-        async with self._chunk_semaphore:
-            try:
-                # Handle stream finalization
-                if is_last:
-                    # Skip format conversion for raw audio mode
-                    if not output_format:
-                        yield AudioChunk(np.array([], dtype=np.int16), output=b"")
-                        return
-                    chunk_data = await AudioService.convert_audio(
-                        AudioChunk(np.array([], dtype=np.float32)),  # Dummy data for type checking
-                        output_format,
-                        writer,
-                        speed,
-                        "",
-                        normalizer=normalizer,
-                        is_last_chunk=True,
-                    )
+        """Synthesize a text chunk into raw audio, reusing the audio of an identical chunk if cached."""
+        # Skip empty chunks
+        if not tokens and not chunk_text:
+            return
+
+        chunk_cache = await get_chunk_cache()
+        cache_key = None
+        if chunk_cache.enabled and tokens:
+            # Only audio synthesized from the chunker's own tokens is determined by them alone
+            from_tokens = self._can_reuse_chunk_phonemes(chunk_text, tokens, lang_code, return_timestamps)
+            cache_key = chunk_cache.key(tokens, voice_name, speed, lang_code, None if from_tokens else chunk_text)
+            cached = chunk_cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"Using cached audio for chunk: '{chunk_text[:50]}{'...' if len(chunk_text) > 50 else ''}'")
+                for chunk_data in cached:
                     yield chunk_data
-                    return
-
-                # Skip empty chunks
-                if not tokens and not chunk_text:
-                    return
-
-                # Get backend
-                backend = self.model_manager.get_backend()
+                return
+
+        parts = []
+        async for chunk_data in self._generate_chunk(chunk_text, tokens, voice_name, voice_path, speed, lang_code, return_timestamps):
+            if cache_key is not None:
+                parts.append(chunk_cache.freeze(chunk_data))
+            yield chunk_data
+        # Only reached once the whole chunk was synthesized; failures raise out of the loop
+        if cache_key is not None and parts:
+            chunk_cache.put(cache_key, parts)
+
+    async def _generate_chunk(
+        self,
+        chunk_text: str,
+        tokens: List[int],
+        voice_name: str,
+        voice_path: Union[str, torch.Tensor],
+        speed: float,
+        lang_code: Optional[str] = None,
+        return_timestamps: Optional[bool] = False,
+    ) -> AsyncGenerator[AudioChunk, None]:
+        """Run a text chunk through the model."""
+        async with self._chunk_semaphore:
+            # Get backend
+            backend = self.model_manager.get_backend()
 
-                # Generate audio using pre-warmed model
-                if isinstance(backend, KokoroV1):
-                    chunk_index = 0
+            # Generate audio using pre-warmed model
+            if isinstance(backend, KokoroV1):
+                if self._can_reuse_chunk_phonemes(chunk_text, tokens, lang_code, return_timestamps):
+                    # Synthesize the chunker's phonemes instead of running G2P a second time
+                    audio_chunks = self._generate_from_chunk_tokens(backend, tokens, voice_name, voice_path, speed, lang_code)
+                else:
                     # For Kokoro V1, pass text and voice info with lang_code
-                    async for chunk_data in self.model_manager.generate(
+                    audio_chunks = self.model_manager.generate(
                         chunk_text,
                         (voice_name, voice_path),
                         speed=speed,
                         lang_code=lang_code,
                         return_timestamps=return_timestamps,
-                    ):
-                        # For streaming, convert to bytes
-                        if output_format:
-                            try:
-                                chunk_data = await AudioService.convert_audio(
-                                    chunk_data,
-                                    output_format,
-                                    writer,
-                                    speed,
-                                    chunk_text,
-                                    is_last_chunk=is_last,
-                                    normalizer=normalizer,
-                                )
-                                yield chunk_data
-                            except Exception as e:
-                                logger.error(f"Failed to convert audio: {str(e)}")
-                        else:
-                            chunk_data = AudioService.trim_audio(chunk_data, chunk_text, speed, is_last, normalizer)
-                            yield chunk_data
-                        chunk_index += 1
-                else:
-                    # For legacy backends, load voice tensor
-                    voice_tensor = await self._voice_manager.load_voice(voice_name, device=backend.device)
-                    chunk_data = await self.model_manager.generate(
-                        tokens,
-                        voice_tensor,
-                        speed=speed,
-                        return_timestamps=return_timestamps,
                     )
+                async for chunk_data in audio_chunks:
+                    yield chunk_data
+            else:
+                # For legacy backends, load voice tensor
+                voice_tensor = await self._voice_manager.load_voice(voice_name, device=backend.device)
+                chunk_data = await self.model_manager.generate(
+                    tokens,
+                    voice_tensor,
+                    speed=speed,
+                    return_timestamps=return_timestamps,
+                )
+
+                if chunk_data.audio is None:
+                    logger.error("Model generated None for audio chunk")
+                    return
 
-                    if chunk_data.audio is None:
-                        logger.error("Model generated None for audio chunk")
-                        return
-
-                    if len(chunk_data.audio) == 0:
-                        logger.error("Model generated empty audio chunk")
-                        return
+                if len(chunk_data.audio) == 0:
+                    logger.error("Model generated empty audio chunk")
+                    return
 
-                    # For streaming, convert to bytes
-                    if output_format:
-                        try:
-                            chunk_data = await AudioService.convert_audio(
-                                chunk_data,
-                                output_format,
-                                writer,
-                                speed,
-                                chunk_text,
-                                normalizer=normalizer,
-                                is_last_chunk=is_last,
-                            )
-                            yield chunk_data
-                        except Exception as e:
-                            logger.error(f"Failed to convert audio: {str(e)}")
-                    else:
-                        trimmed = AudioService.trim_audio(chunk_data, chunk_text, speed, is_last, normalizer)
-                        yield trimmed
-            except Exception as e:
-                logger.error(f"Failed to process tokens: {str(e)}")
+                yield chunk_data
 
-    async def _load_voice_from_path(self, path: str, weight: float):
-        # Check if the path is None and raise a ValueError if it is not
-        if not path:
-            raise ValueError(f"Voice not found at path: {path}")
+    async def _synthesize_chunks(
+        self,
+        chunks: AsyncGenerator[Tuple[str, List[int]], None],
+        audio_queue: asyncio.Queue,
+        voice_name: str,
+        voice_path: Union[str, torch.Tensor],
+        speed: float,
+        lang_code: Optional[str] = None,
+        return_timestamps: Optional[bool] = False,
+    ) -> None:
+        """Synthesis stage of a stream: turn text chunks into raw audio as they arrive.
 
-        logger.debug(f"Loading voice tensor from path: {path}")
-        return torch.load(path, map_location="cpu") * weight
+        Puts (chunk_text, AudioChunk) pairs on audio_queue, or (chunk_text, error) for a
+        chunk that failed to synthesize, then (None, error) once the text runs out, with
+        error set if text preparation failed.
+        """
+        try:
+            async for chunk_text, tokens in chunks:
+                try:
+                    async for chunk_data in self._synthesize_chunk(chunk_text, tokens, voice_name, voice_path, speed, lang_code, return_timestamps):
+                        await audio_queue.put((chunk_text, chunk_data))
+                except Exception as e:
+                    logger.error(f"Failed to process audio for chunk: '{chunk_text[:100]}...'. Error: {str(e)}")
+                    await audio_queue.put((chunk_text, e))
+        except Exception as e:
+            await audio_queue.put((None, e))
+        else:
+            await audio_queue.put((None, None))
+        finally:
+            # Stops text preparation right away when the stream is cancelled
+            await chunks.aclose()
+
+    @staticmethod
+    async def _encode_chunk(
+        chunk_data: AudioChunk,
+        chunk_text: str,
+        writer: StreamingAudioWriter,
+        output_format: Optional[str],
+        speed: float,
+        normalizer: AudioNormalizer,
+        is_last: bool = False,
+    ) -> AudioChunk:
+        """Encoding stage of a stream: trim a chunk and, for formatted output, encode it on the encoder pool."""
+        if output_format:
+            encoder_pool = await get_encoder_pool()
+            encoding = asyncio.ensure_future(encoder_pool.encode(writer, chunk_data, speed, chunk_text, is_last_chunk=is_last, normalizer=normalizer))
+            try:
+                return await asyncio.shield(encoding)
+            except asyncio.CancelledError:
+                # The encoder can't be interrupted, and the writer must outlive it: callers
+                # close it as soon as the stream is cancelled
+                await asyncio.wait({encoding})
+                raise
+        return await asyncio.to_thread(AudioService.trim_audio, chunk_data, chunk_text, speed, is_last, normalizer)
 
-    async def _get_voices_path(self, voice: str) -> Tuple[str, str]:
-        """Get voice path, handling combined voices.
+    async def _get_voice(self, voice: str) -> Tuple[str, Union[str, torch.Tensor]]:
+        """Get voice path or blended voice tensor, handling combined voices.
 
         Args:
-            voice: Voice name or combined voice names (e.g., 'af_jadzia+af_jessica')
+            voice: Voice name or combined voice expression (e.g., 'af_bella(2)+am_adam-bf_emma')
 
         Returns:
-            Tuple of (voice name to use, voice path to use)
+            Tuple of (voice name to use, voice path or blended voice tensor)
 
         Raises:
             RuntimeError: If voice not found
@@ -176,18 +228,19 @@ class TTSService:
             # Split the voice on + and - and ensure that they get added to the list eg: hi+bob = ["hi","+","bob"]
             split_voice = re.split(r"([-+])", voice)
 
-            # If it is only once voice there is no point in loading it up, doing nothing with it, then saving it
+            # A single voice is used from disk as-is unless it carries a weight that must be applied
             if len(split_voice) == 1:
                 # Since its a single voice the only time that the weight would matter is if voice_weight_normalization is off
                 if ("(" not in voice and ")" not in voice) or settings.voice_weight_normalization == True:
+                    voice = voice.split("(")[0].strip()
                     path = await self._voice_manager.get_voice_path(voice)
                     if not path:
                         raise RuntimeError(f"Voice not found: {voice}")
                     logger.debug(f"Using single voice path: {path}")
                     return voice, path
 
+            components = []
             total_weight = 0
-
             for voice_index in range(0, len(split_voice), 2):
                 voice_object = split_voice[voice_index]
 
@@ -195,40 +248,25 @@ class TTSService:
                     voice_name = voice_object.split("(")[0].strip()
                     voice_weight = float(voice_object.split("(")[1].split(")")[0])
                 else:
-                    voice_name = voice_object
+                    voice_name = voice_object.strip()
                     voice_weight = 1
 
+                sign = -1 if voice_index > 0 and split_voice[voice_index - 1] == "-" else 1
                 total_weight += voice_weight
-                split_voice[voice_index] = (voice_name, voice_weight)
+                components.append((voice_name, sign * voice_weight))
 
             # If voice_weight_normalization is false prevent normalizing the weights by setting the total_weight to 1 so it divides each weight by 1
             if settings.voice_weight_normalization == False:
                 total_weight = 1
 
-            # Load the first voice as the starting point for voices to be combined onto
-            path = await self._voice_manager.get_voice_path(split_voice[0][0])
-            combined_tensor = await self._load_voice_from_path(path, split_voice[0][1] / total_weight)
-
-            # Loop through each + or - in split_voice so they can be applied to combined voice
-            for operation_index in range(1, len(split_voice) - 1, 2):
-                # Get the voice path of the voice 1 index ahead of the operator
-                path = await self._voice_manager.get_voice_path(split_voice[operation_index + 1][0])
-                voice_tensor = await self._load_voice_from_path(path, split_voice[operation_index + 1][1] / total_weight)
+            weights = {}
+            for voice_name, weight in components:
+                weights[voice_name] = weights.get(voice_name, 0) + weight / total_weight
 
-                # Either add or subtract the voice from the current combined voice
-                if split_voice[operation_index] == "+":
-                    combined_tensor += voice_tensor
-                else:
-                    combined_tensor -= voice_tensor
-
-            # Save the new combined voice so it can be loaded latter
-            temp_dir = tempfile.gettempdir()
-            combined_path = os.path.join(temp_dir, f"{voice}.pt")
-            logger.debug(f"Saving combined voice to: {combined_path}")
-            torch.save(combined_tensor, combined_path)
-            return voice, combined_path
+            combined_tensor = await self._voice_manager.blend_voices(weights)
+            return voice, combined_tensor
         except Exception as e:
-            logger.error(f"Failed to get voice path: {e}")
+            logger.error(f"Failed to get voice: {e}")
             raise
 
     async def generate_audio_stream(
@@ -241,87 +279,220 @@ class TTSService:
         lang_code: Optional[str] = None,
         normalization_options: Optional[NormalizationOptions] = NormalizationOptions(),
         return_timestamps: Optional[bool] = False,
+        first_chunk_tokens: Optional[int] = None,
+        coalesce: bool = True,
+        errors: Optional[List[str]] = None,
+    ) -> AsyncGenerator[AudioChunk, None]:
+        """Generate and stream audio chunks.
+
+        first_chunk_tokens enables adaptive chunking: the first chunk is kept around
+        that size and later chunks grow to the usual target size.
+
+        With coalesce_requests, identical concurrent requests share one generation:
+        a request that arrives while it is in progress gets the chunks produced so far
+        replayed, then follows it live. Shared generations encode with their own
+        writer, and their chunks must be treated as read-only. Requests can only join
+        within the first coalesce_max_replay_chunks chunks, so a long generation
+        doesn't keep all of its chunks for replay.
+
+        A chunk that fails to synthesize or encode is left out and the stream carries
+        on. Pass an errors list to find out: it gets one message per failed chunk once
+        the stream is exhausted, so a caller can tell a complete stream from one with
+        gaps, e.g. before caching it.
+        """
+        if not (coalesce and settings.coalesce_requests):
+            async for chunk_data in self._generate_audio_stream(
+                text, voice, writer, speed, output_format, lang_code, normalization_options, return_timestamps, first_chunk_tokens, errors
+            ):
+                yield chunk_data
+            return
+
+        sample_rate = writer.sample_rate if writer is not None else settings.sample_rate
+        key = audio_cache_key(text, voice, speed, lang_code, output_format or "raw", normalization_options, sample_rate)
+        key = f"{key}:{bool(return_timestamps)}:{first_chunk_tokens}"
+        if key not in self._flights:
+            flight_errors = []
+            flight = SharedStream(
+                self._generate_shared_audio_stream(
+                    text, voice, speed, output_format, sample_rate, lang_code, normalization_options, return_timestamps, first_chunk_tokens, flight_errors
+                ),
+                on_close=lambda: self._flights.pop(key, None),
+                max_replay=settings.coalesce_max_replay_chunks,
+            )
+            self._flights[key] = flight, flight_errors
+        else:
+            flight, flight_errors = self._flights[key]
+            logger.info(f"Joining in-progress generation with {flight.subscribers} listeners, replaying {len(flight.items)} chunks")
+
+        async for chunk_data in flight.subscribe():
+            yield chunk_data
+        if errors is not None:
+            errors.extend(flight_errors)
+
+    async def _generate_shared_audio_stream(
+        self,
+        text: str,
+        voice: str,
+        speed: float,
+        output_format: Optional[str],
+        sample_rate: int,
+        lang_code: Optional[str],
+        normalization_options: Optional[NormalizationOptions],
+        return_timestamps: Optional[bool],
+        first_chunk_tokens: Optional[int],
+        errors: List[str],
+    ) -> AsyncGenerator[AudioChunk, None]:
+        """Generate a stream that may outlive the request that started it, so it owns its writer."""
+        writer = StreamingAudioWriter(output_format, sample_rate=sample_rate, input_sample_rate=settings.sample_rate) if output_format else None
+        try:
+            async for chunk_data in self._generate_audio_stream(
+                text, voice, writer, speed, output_format, lang_code, normalization_options, return_timestamps, first_chunk_tokens, errors
+            ):
+                yield chunk_data
+        finally:
+            if writer is not None:
+                writer.close()
+
+    async def _generate_audio_stream(
+        self,
+        text: str,
+        voice: str,
+        writer: StreamingAudioWriter,
+        speed: float = 1.0,
+        output_format: str = "wav",
+        lang_code: Optional[str] = None,
+        normalization_options: Optional[NormalizationOptions] = NormalizationOptions(),
+        return_timestamps: Optional[bool] = False,
+        first_chunk_tokens: Optional[int] = None,
+        errors: Optional[List[str]] = None,
     ) -> AsyncGenerator[AudioChunk, None]:
-        """Generate and stream audio chunks."""
+        if errors is None:
+            errors = []
         stream_normalizer = AudioNormalizer()
+        encoder_pool = await get_encoder_pool()
         chunk_index = 0
         current_offset = 0.0
+        synthesis = None
         try:
-            # Get backend
-            backend = self.model_manager.get_backend()
-
             # Get voice path, handling combined voices
-            voice_name, voice_path = await self._get_voices_path(voice)
-            logger.debug(f"Using voice path: {voice_path}")
+            voice_name, voice_path = await self._get_voice(voice)
+            logger.debug(f"Using voice: {voice_path if isinstance(voice_path, str) else 'blended ' + voice_name}")
 
             # Use provided lang_code or determine from voice name
             pipeline_lang_code = lang_code if lang_code else voice[:1].lower()
             logger.info(f"Using lang_code '{pipeline_lang_code}' for voice '{voice_name}' in audio stream")
 
-            # Process text in chunks with smart splitting
-            async for chunk_text, tokens in smart_split(
+            # The stream runs as three overlapping stages joined by bounded queues: smart_split
+            # prepares upcoming chunks in a frontend thread, the synthesis task feeds the model,
+            # and this generator encodes finished audio on the encoder pool
+            chunks = smart_split(
                 text,
                 lang_code=pipeline_lang_code,
                 normalization_options=normalization_options,
-            ):
+                first_chunk_tokens=first_chunk_tokens,
+            )
+            audio_queue = asyncio.Queue(settings.pipeline_audio_queue_size)
+            synthesis = asyncio.create_task(
+                self._synthesize_chunks(chunks, audio_queue, voice_name, voice_path, speed, pipeline_lang_code, return_timestamps)
+            )
+
+            while True:
+                chunk_text, chunk_data = await audio_queue.get()
+                if chunk_text is None:
+                    if chunk_data is not None:
+                        raise chunk_data
+                    break
+                if isinstance(chunk_data, Exception):
+                    errors.append(f"Failed to synthesize chunk: {chunk_data}")
+                    continue
+
                 try:
-                    # Process audio for chunk
-                    async for chunk_data in self._process_chunk(
-                        chunk_text,  # Pass text for Kokoro V1
-                        tokens,  # Pass tokens for legacy backends
-                        voice_name,  # Pass voice name
-                        voice_path,  # Pass voice path
-                        speed,
-                        writer,
-                        output_format,
-                        is_first=(chunk_index == 0),
-                        is_last=False,  # We'll update the last chunk later
-                        normalizer=stream_normalizer,
-                        lang_code=pipeline_lang_code,  # Pass lang_code
-                        return_timestamps=return_timestamps,
-                    ):
-                        if chunk_data.word_timestamps is not None:
-                            for timestamp in chunk_data.word_timestamps:
-                                timestamp.start_time += current_offset
-                                timestamp.end_time += current_offset
+                    chunk_data = await self._encode_chunk(chunk_data, chunk_text, writer, output_format, speed, stream_normalizer)
+                except Exception as e:
+                    logger.error(f"Failed to convert audio: {str(e)}")
+                    errors.append(f"Failed to convert audio: {e}")
+                    continue
 
-                        current_offset += len(chunk_data.audio) / 24000
+                if chunk_data.word_timestamps is not None:
+                    for timestamp in chunk_data.word_timestamps:
+                        timestamp.start_time += current_offset
+                        timestamp.end_time += current_offset
 
-                        if chunk_data.output is not None:
-                            yield chunk_data
+                current_offset += len(chunk_data.audio) / settings.sample_rate
 
-                        else:
-                            logger.warning(f"No audio generated for chunk: '{chunk_text[:100]}...'")
-                        chunk_index += 1
-                except Exception as e:
-                    logger.error(f"Failed to process audio for chunk: '{chunk_text[:100]}...'. Error: {str(e)}")
-                    continue
+                if chunk_data.output is not None:
+                    yield chunk_data
+                else:
+                    logger.warning(f"No audio generated for chunk: '{chunk_text[:100]}...'")
+                chunk_index += 1
 
             # Only finalize if we successfully processed at least one chunk
             if chunk_index > 0:
                 try:
-                    # Empty tokens list to finalize audio
-                    async for chunk_data in self._process_chunk(
-                        "",  # Empty text
-                        [],  # Empty tokens
-                        voice_name,
-                        voice_path,
-                        speed,
-                        writer,
-                        output_format,
-                        is_first=False,
-                        is_last=True,  # Signal this is the last chunk
-                        normalizer=stream_normalizer,
-                        lang_code=pipeline_lang_code,  # Pass lang_code
-                    ):
-                        if chunk_data.output is not None:
-                            yield chunk_data
+                    if output_format:
+                        # Flush the encoder with an empty final chunk
+                        chunk_data = await self._encode_chunk(
+                            AudioChunk(np.array([], dtype=np.float32)),
+                            "",
+                            writer,
+                            output_format,
+                            speed,
+                            stream_normalizer,
+                            is_last=True,
+                        )
+                    else:
+                        # Skip format conversion for raw audio mode
+                        chunk_data = AudioChunk(np.array([], dtype=np.int16), output=[])
+                    if chunk_data.output is not None:
+                        yield chunk_data
                 except Exception as e:
                     logger.error(f"Failed to finalize audio stream: {str(e)}")
+                    errors.append(f"Failed to finalize audio stream: {e}")
 
         except Exception as e:
             logger.error(f"Error in phoneme audio generation: {str(e)}")
             raise e
+        finally:
+            # Stop synthesizing ahead when the stream ends early, e.g. on client disconnect
+            if synthesis is not None:
+                synthesis.cancel()
+            if output_format and writer is not None:
+                encoder_pool.release(writer)
+
+    async def generate_chunk_audio(
+        self,
+        text: str,
+        voice: str,
+        speed: float = 1.0,
+        lang_code: Optional[str] = None,
+        normalization_options: Optional[NormalizationOptions] = NormalizationOptions(),
+        start_chunk: int = 0,
+    ) -> AsyncGenerator[Tuple[int, AudioChunk], None]:
+        """Generate trimmed 16-bit audio one text chunk at a time, for checkpointed renders.
+
+        Yields (chunk index, audio) once each chunk is fully synthesized, with empty
+        audio for chunks that produced none. Chunks before start_chunk are still split,
+        so indices are the same on every run for the same text and settings, but they
+        aren't synthesized. Unlike the stream, a chunk that fails to synthesize raises.
+        """
+        normalizer = AudioNormalizer()
+        voice_name, voice_path = await self._get_voice(voice)
+        pipeline_lang_code = lang_code if lang_code else voice[:1].lower()
+
+        chunks = smart_split(text, lang_code=pipeline_lang_code, normalization_options=normalization_options)
+        try:
+            chunk_index = -1
+            async for chunk_text, tokens in chunks:
+                chunk_index += 1
+                if chunk_index < start_chunk:
+                    continue
+                parts = []
+                async for chunk_data in self._synthesize_chunk(chunk_text, tokens, voice_name, voice_path, speed, pipeline_lang_code):
+                    chunk_data = await asyncio.to_thread(AudioService.trim_audio, chunk_data, chunk_text, speed, False, normalizer)
+                    parts.append(chunk_data)
+                yield chunk_index, AudioChunk.combine(parts) if parts else AudioChunk(np.array([], dtype=np.int16))
+        finally:
+            await chunks.aclose()
 
     async def generate_audio(
         self,
@@ -332,8 +503,12 @@ class TTSService:
         return_timestamps: bool = False,
         normalization_options: Optional[NormalizationOptions] = NormalizationOptions(),
         lang_code: Optional[str] = None,
+        errors: Optional[List[str]] = None,
     ) -> AudioChunk:
-        """Generate complete audio for text using streaming internally."""
+        """Generate complete audio for text using streaming internally.
+
+        Failed chunks are left out, see generate_audio_stream for the errors list.
+        """
         audio_data_chunks = []
 
         try:
@@ -346,6 +521,7 @@ class TTSService:
                 return_timestamps=return_timestamps,
                 lang_code=lang_code,
                 output_format=None,
+                errors=errors,
             ):
                 if len(audio_stream_data.audio) > 0:
                     audio_data_chunks.append(audio_stream_data)
@@ -391,7 +567,7 @@ class TTSService:
         try:
             # Get backend and voice path
             backend = self.model_manager.get_backend()
-            voice_name, voice_path = await self._get_voices_path(voice)
+            voice_name, voice_path = await self._get_voice(voice)
 
             if isinstance(backend, KokoroV1):
                 # For Kokoro V1, use generate_from_tokens with raw phonemes
@@ -401,24 +577,23 @@ class TTSService:
                 logger.info(f"Using lang_code '{pipeline_lang_code}' for voice '{voice_name}' in phoneme pipeline")
 
                 try:
-                    # Use backend's pipeline management
-                    for r in backend._get_pipeline(pipeline_lang_code).generate_from_tokens(
+                    async for audio in backend.generate_from_tokens(
                         tokens=phonemes,  # Pass raw phonemes string
-                        voice=voice_path,
+                        voice=(voice_name, voice_path),
                         speed=speed,
+                        lang_code=pipeline_lang_code,
                     ):
-                        if r.audio is not None:
-                            result = r
-                            break
+                        result = audio
+                        break
                 except Exception as e:
                     logger.error(f"Failed to generate from phonemes: {e}")
                     raise RuntimeError(f"Phoneme generation failed: {e}")
 
-                if result is None or result.audio is None:
+                if result is None:
                     raise ValueError("No audio generated")
 
                 processing_time = time.time() - start_time
-                return result.audio.numpy(), processing_time
+                return result, processing_time
             else:
                 raise ValueError("Phoneme generation only supported with Kokoro V1 backend")
 
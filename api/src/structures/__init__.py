@@ -2,6 +2,8 @@ from .schemas import (
     CaptionedSpeechRequest,
     CaptionedSpeechResponse,
     OpenAISpeechRequest,
+    SpeechJob,
+    SpeechJobRequest,
     TTSStatus,
     VoiceCombineRequest,
     WordTimestamp,
@@ -13,5 +15,7 @@ __all__ = [
     "CaptionedSpeechResponse",
     "WordTimestamp",
     "TTSStatus",
+    "SpeechJob",
+    "SpeechJobRequest",
     "VoiceCombineRequest",
 ]
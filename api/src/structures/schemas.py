@@ -84,6 +84,10 @@ class OpenAISpeechRequest(BaseModel):
         default=None,
         description="Optional different format for the final download. If not provided, uses response_format.",
     )
+    sample_rate: Optional[Literal[8000, 12000, 16000, 24000, 48000]] = Field(
+        default=None,
+        description="Sample rate of the returned audio in Hz, e.g. 8000 or 16000 for telephony. If not provided, uses the model's native 24000.",
+    )
     speed: float = Field(
         default=1.0,
         ge=0.25,
@@ -94,6 +98,15 @@ class OpenAISpeechRequest(BaseModel):
         default=True,  # Default to streaming for OpenAI compatibility
         description="If true (default), audio will be streamed as it's generated. Each chunk will be a complete sentence.",
     )
+    adaptive_chunking: Optional[bool] = Field(
+        default=None,
+        description="If true, the first chunk is kept short and later chunks grow to full size, so audio starts sooner. Defaults to the value of stream.",
+    )
+    first_chunk_tokens: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Target size in tokens of the first chunk when adaptive chunking is on. If not provided, uses the server default.",
+    )
     return_download_link: bool = Field(
         default=False,
         description="If true, returns a download link in X-Download-Path header after streaming completes",
@@ -134,6 +147,15 @@ class CaptionedSpeechRequest(BaseModel):
         default=True,  # Default to streaming for OpenAI compatibility
         description="If true (default), audio will be streamed as it's generated. Each chunk will be a complete sentence.",
     )
+    adaptive_chunking: Optional[bool] = Field(
+        default=None,
+        description="If true, the first chunk is kept short and later chunks grow to full size, so audio starts sooner. Defaults to the value of stream.",
+    )
+    first_chunk_tokens: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Target size in tokens of the first chunk when adaptive chunking is on. If not provided, uses the server default.",
+    )
     return_timestamps: bool = Field(
         default=True,
         description="If true (default), returns word-level timestamps in the response",
@@ -150,3 +172,103 @@ class CaptionedSpeechRequest(BaseModel):
         default=NormalizationOptions(),
         description="Options for the normalization system",
     )
+
+
+class SpeechJobRequest(BaseModel):
+    """Request schema for asynchronous speech jobs"""
+
+    model: str = Field(
+        default="kokoro",
+        description="The model to use for generation. Supported models: tts-1, tts-1-hd, kokoro",
+    )
+    input: str = Field(..., description="The text to generate audio for")
+    voice: str = Field(
+        default="af_heart",
+        description="The voice to use for generation. Can be a base voice or a combined voice name.",
+    )
+    response_format: Literal["mp3", "opus", "aac", "flac", "wav", "pcm"] = Field(
+        default="mp3",
+        description="The format of the rendered audio file. Supported formats: mp3, opus, flac, wav, pcm.",
+    )
+    sample_rate: Optional[Literal[8000, 12000, 16000, 24000, 48000]] = Field(
+        default=None,
+        description="Sample rate of the rendered audio file in Hz, e.g. 8000 or 16000 for telephony. If not provided, uses the model's native 24000.",
+    )
+    speed: float = Field(
+        default=1.0,
+        ge=0.25,
+        le=4.0,
+        description="The speed of the generated audio. Select a value from 0.25 to 4.0.",
+    )
+    lang_code: Optional[str] = Field(
+        default=None,
+        description="Optional language code to use for text processing. If not provided, will use first letter of voice name.",
+    )
+    normalization_options: Optional[NormalizationOptions] = Field(
+        default=NormalizationOptions(),
+        description="Options for the normalization system",
+    )
+
+
+class SpeechJob(BaseModel):
+    """Status and progress of an asynchronous speech job"""
+
+    id: str = Field(..., description="Job identifier")
+    status: TTSStatus = Field(..., description="Current state of the job")
+    voice: str = Field(..., description="The voice the job renders with")
+    response_format: str = Field(..., description="Format of the rendered audio file")
+    sample_rate: Optional[int] = Field(default=None, description="Sample rate of the rendered audio file in Hz")
+    input_characters: int = Field(..., description="Length of the input text")
+    chunks_completed: int = Field(default=0, description="Number of text chunks synthesized so far")
+    audio_seconds: float = Field(default=0.0, description="Duration of the audio rendered so far")
+    output_bytes: int = Field(default=0, description="Size of the rendered audio file, once completed")
+    created_at: float = Field(..., description="Unix time the job was submitted")
+    started_at: Optional[float] = Field(default=None, description="Unix time synthesis started")
+    finished_at: Optional[float] = Field(default=None, description="Unix time the job completed or failed")
+    error: Optional[str] = Field(default=None, description="Reason the job failed")
+
+
+class BulkSpeechItem(BaseModel):
+    """A single input of a bulk speech request"""
+
+    input: str = Field(..., description="The text to generate audio for")
+    voice: str = Field(
+        default="af_heart",
+        description="The voice to use for generation. Can be a base voice or a combined voice name.",
+    )
+    speed: float = Field(
+        default=1.0,
+        ge=0.25,
+        le=4.0,
+        description="The speed of the generated audio. Select a value from 0.25 to 4.0.",
+    )
+    response_format: Literal["mp3", "opus", "aac", "flac", "wav", "pcm"] = Field(
+        default="mp3",
+        description="The format to return audio in. Supported formats: mp3, opus, flac, wav, pcm.",
+    )
+    sample_rate: Optional[Literal[8000, 12000, 16000, 24000, 48000]] = Field(
+        default=None,
+        description="Sample rate of the returned audio in Hz, e.g. 8000 or 16000 for telephony. If not provided, uses the model's native 24000.",
+    )
+    lang_code: Optional[str] = Field(
+        default=None,
+        description="Optional language code to use for text processing. If not provided, will use first letter of voice name.",
+    )
+
+
+class BulkSpeechRequest(BaseModel):
+    """Request schema for generating many short inputs at once"""
+
+    model: str = Field(
+        default="kokoro",
+        description="The model to use for generation. Supported models: tts-1, tts-1-hd, kokoro",
+    )
+    items: List[BulkSpeechItem] = Field(..., min_length=1, description="The inputs to generate audio for")
+    output: Literal["ndjson", "zip"] = Field(
+        default="ndjson",
+        description="ndjson streams one JSON line with base64 audio per item as it completes. zip streams an archive with one file per item and a manifest.json.",
+    )
+    normalization_options: Optional[NormalizationOptions] = Field(
+        default=NormalizationOptions(),
+        description="Options for the normalization system, applied to every item",
+    )
@@ -0,0 +1,49 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from api.src.core.config import settings
+from api.src.inference.base import AudioChunk
+from api.src.services.tts_service import TTSService
+
+
+class FakeBackend:
+    device = "cpu"
+
+
+class FakeModelManager:
+    """Returns a second of noise per chunk, and fails the calls numbered in fail_calls."""
+
+    def __init__(self):
+        self.calls = 0
+        self.fail_calls = set()
+
+    def get_backend(self):
+        return FakeBackend()
+
+    async def generate(self, tokens, voice, speed=1.0, return_timestamps=False):
+        self.calls += 1
+        await asyncio.sleep(0)
+        if self.calls in self.fail_calls:
+            raise RuntimeError("model failed")
+        return AudioChunk(np.random.default_rng(self.calls).uniform(-0.5, 0.5, settings.sample_rate).astype(np.float32))
+
+
+class FakeVoiceManager:
+    async def get_voice_path(self, voice):
+        return f"/voices/{voice}.pt"
+
+    async def load_voice(self, voice, device=None):
+        return None
+
+
+@pytest.fixture
+def tts_service(monkeypatch):
+    """A TTSService on a fake model, with the caches off."""
+    monkeypatch.setattr(settings, "audio_cache_enabled", False)
+    monkeypatch.setattr(settings, "chunk_cache_enabled", False)
+    service = TTSService()
+    service.model_manager = FakeModelManager()
+    service._voice_manager = FakeVoiceManager()
+    return service
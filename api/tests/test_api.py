@@ -0,0 +1,96 @@
+import base64
+import json
+import struct
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.src.core.config import settings
+from api.src.routers import api
+from api.src.services.audio_cache import AudioCache
+
+TEXT = " ".join(f"Sentence number {i} is here, and it keeps going for a while." for i in range(12))
+
+
+@pytest.fixture
+def audio_cache(monkeypatch):
+    monkeypatch.setattr(settings, "audio_cache_enabled", True)
+    cache = AudioCache(cache_dir=None)
+    monkeypatch.setattr(AudioCache, "_instance", cache)
+    return cache
+
+
+@pytest.fixture
+def client(tts_service, monkeypatch):
+    async def get_tts_service():
+        return tts_service
+
+    async def process_and_validate_voices(voice, service):
+        return voice
+
+    monkeypatch.setattr(settings, "coalesce_requests", False)
+    monkeypatch.setattr(api, "get_tts_service", get_tts_service)
+    monkeypatch.setattr(api, "process_and_validate_voices", process_and_validate_voices)
+    app = FastAPI()
+    app.include_router(api.router, prefix="/v1")
+    with TestClient(app) as client:
+        yield client
+
+
+def wav_sizes(data):
+    return struct.unpack_from("<I", data, 4)[0], struct.unpack_from("<I", data, 40)[0]
+
+
+@pytest.mark.parametrize("stream", [True, False])
+def test_complete_speech_is_cached(client, audio_cache, stream):
+    response = client.post("/v1/audio/speech", json={"input": TEXT, "response_format": "wav", "stream": stream})
+    assert response.status_code == 200
+    [cached] = audio_cache._memory.values()
+    # The cached copy is complete, so it has the real sizes even when the stream couldn't
+    assert cached[44:] == response.content[44:]
+    assert wav_sizes(cached) == (len(cached) - 8, len(cached) - 44)
+
+
+@pytest.mark.parametrize("stream", [True, False])
+def test_wav_sizes(client, stream):
+    response = client.post("/v1/audio/speech", json={"input": TEXT, "response_format": "wav", "stream": stream})
+    content = response.content
+    if stream:
+        assert wav_sizes(content) == (0xFFFFFFFF, 0xFFFFFFFF)
+    else:
+        assert wav_sizes(content) == (len(content) - 8, len(content) - 44)
+
+
+@pytest.mark.parametrize("stream", [True, False])
+def test_speech_with_failed_chunk_is_not_cached(client, tts_service, audio_cache, stream):
+    tts_service.model_manager.fail_calls = {2}
+    response = client.post("/v1/audio/speech", json={"input": TEXT, "response_format": "wav", "stream": stream})
+    assert response.status_code == 200
+    assert audio_cache._memory == {}
+
+
+def test_bulk_item_with_failed_chunk_fails(client, tts_service, audio_cache):
+    tts_service.model_manager.fail_calls = {2}
+    response = client.post("/v1/audio/speech/bulk", json={"items": [{"input": TEXT, "response_format": "wav"}]})
+    assert response.status_code == 200
+    result = json.loads(response.text.splitlines()[0])
+    assert result["status"] == "failed"
+    assert "model failed" in result["error"]
+    assert audio_cache._memory == {}
+
+
+def test_complete_bulk_item_is_cached(client, audio_cache):
+    response = client.post("/v1/audio/speech/bulk", json={"items": [{"input": TEXT, "response_format": "wav"}]})
+    result = json.loads(response.text.splitlines()[0])
+    assert result["status"] == "completed"
+    assert list(audio_cache._memory.values()) == [base64.b64decode(result["audio"])]
+
+
+def test_identical_bulk_items_are_generated_once(client, tts_service):
+    items = [{"input": "First item.", "response_format": "wav"}, {"input": "Second item.", "response_format": "wav"}]
+    response = client.post("/v1/audio/speech/bulk", json={"items": items + items})
+    results = {result["index"]: result for result in map(json.loads, response.text.splitlines())}
+    assert tts_service.model_manager.calls == 2
+    assert results[2]["audio"] == results[0]["audio"]
+    assert results[3]["audio"] == results[1]["audio"]
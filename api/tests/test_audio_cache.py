@@ -0,0 +1,23 @@
+import asyncio
+import os
+
+from api.src.services.audio_cache import AudioCache
+
+
+def test_disk_entries_survive_a_restart(tmp_path):
+    async def main():
+        cache = AudioCache(max_memory_bytes=1024, cache_dir=str(tmp_path))
+        await cache.put("old", b"a" * 100)
+        await cache.put("new", b"b" * 100)
+        os.utime(tmp_path / "old.audio", (1, 1))
+
+        # A new process finds the entries, oldest first, and evicts from the least recently used
+        restarted = AudioCache(max_memory_bytes=0, cache_dir=str(tmp_path), max_disk_bytes=250)
+        assert await restarted.get("missing") is None
+        assert list(restarted._disk) == ["old", "new"]
+        assert await restarted.get("old") == b"a" * 100
+        await restarted.put("newest", b"c" * 100)
+        assert list(restarted._disk) == ["old", "newest"]
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["newest.audio", "old.audio"]
+
+    asyncio.run(main())
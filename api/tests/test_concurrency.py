@@ -0,0 +1,61 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from api.src.core.concurrency import SharedStream, iterate_in_executor
+
+
+def test_iterators_share_a_single_worker():
+    # An iterator whose consumer is stalled must not keep the only worker from serving another
+    executor = ThreadPoolExecutor(max_workers=1)
+    release = threading.Event()
+
+    async def stalled():
+        async for _ in iterate_in_executor(iter(range(5)), executor, maxsize=1):
+            await asyncio.to_thread(release.wait)
+
+    async def main():
+        task = asyncio.create_task(stalled())
+        await asyncio.sleep(0.1)
+        try:
+            return await asyncio.wait_for(asyncio.create_task(collect()), 5)
+        finally:
+            release.set()
+            await task
+
+    async def collect():
+        return [item async for item in iterate_in_executor(iter(range(3)), executor, maxsize=1)]
+
+    try:
+        assert asyncio.run(main()) == [0, 1, 2]
+    finally:
+        release.set()
+        executor.shutdown()
+
+
+def test_shared_stream_bounds_its_replay_buffer():
+    async def source():
+        for i in range(50):
+            yield i
+            await asyncio.sleep(0)
+
+    async def main():
+        closed = []
+        stream = SharedStream(source(), on_close=lambda: closed.append(True), max_replay=4)
+        first, second = stream.subscribe(), stream.subscribe()
+        received, buffered = [], []
+        for _ in range(50):
+            received.append((await first.__anext__(), await second.__anext__()))
+            buffered.append(len(stream.items))
+        # Closed to new subscribers once the buffer is full, and only unreceived items are kept
+        assert closed == [True]
+        assert max(buffered) <= 4
+        assert received == [(i, i) for i in range(50)]
+        with pytest.raises(RuntimeError):
+            await stream.subscribe().__anext__()
+        await first.aclose()
+        await second.aclose()
+
+    asyncio.run(main())
@@ -0,0 +1,102 @@
+import asyncio
+import threading
+import time
+import wave
+
+import pytest
+
+from api.src.services import job_manager
+from api.src.services.encoder_pool import EncoderPool
+from api.src.services.job_manager import JobManager
+from api.src.structures.schemas import SpeechJobRequest, TTSStatus
+
+TEXT = " ".join(f"Sentence number {i} is here to make the document long enough for several chunks." for i in range(40))
+
+
+@pytest.fixture
+def manager(monkeypatch, tmp_path, tts_service):
+    async def create():
+        return tts_service
+
+    monkeypatch.setattr(job_manager.TTSService, "create", create)
+    monkeypatch.setattr(EncoderPool, "_instance", EncoderPool("thread", 1))
+    return JobManager(jobs_dir=str(tmp_path), workers=1)
+
+
+async def wait_for(condition):
+    for _ in range(500):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise TimeoutError
+
+
+def test_job_completes(manager, tmp_path):
+    async def main():
+        await manager.start()
+        job = await manager.submit(SpeechJobRequest(input=TEXT, response_format="wav"), "af_heart")
+        await wait_for(lambda: job.status == TTSStatus.COMPLETED)
+        await manager.stop()
+        return job
+
+    job = asyncio.run(main())
+    assert sorted(path.name for path in tmp_path.iterdir()) == [f"{job.id}.json", f"{job.id}.wav"]
+    with wave.open(str(tmp_path / f"{job.id}.wav")) as audio:
+        assert audio.getnframes() * 2 == job.output_bytes - 44
+
+
+def test_delete_while_rendering(manager, tmp_path):
+    async def main():
+        await manager.start()
+        job = await manager.submit(SpeechJobRequest(input=TEXT, response_format="wav"), "af_heart")
+        await wait_for(lambda: job.chunks_completed >= 1)
+        await manager.delete(job.id)
+        await asyncio.sleep(0.2)
+        await manager.stop()
+
+    asyncio.run(main())
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_delete_while_encoding(monkeypatch, manager, tmp_path):
+    started = threading.Event()
+
+    def slow_encode(pcm_path, output_path, output_format, sample_rate):
+        started.set()
+        time.sleep(0.3)
+        with open(output_path, "wb") as f:
+            f.write(b"audio")
+
+    monkeypatch.setattr(job_manager, "encode_checkpoint", slow_encode)
+
+    async def main():
+        await manager.start()
+        job = await manager.submit(SpeechJobRequest(input="Short.", response_format="mp3"), "af_heart")
+        await wait_for(started.is_set)
+        await manager.delete(job.id)
+        await asyncio.sleep(0.5)
+        await manager.stop()
+
+    asyncio.run(main())
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_interrupted_job_resumes_after_restart(manager, tmp_path, tts_service):
+    async def main():
+        await manager.start()
+        job = await manager.submit(SpeechJobRequest(input=TEXT, response_format="wav"), "af_heart")
+        await wait_for(lambda: job.chunks_completed >= 2)
+        await manager.stop()
+
+        restarted = JobManager(jobs_dir=str(tmp_path), workers=1)
+        await restarted.start()
+        resumed = restarted.get(job.id)
+        await wait_for(lambda: resumed.status == TTSStatus.COMPLETED)
+        await restarted.stop()
+        return job, resumed
+
+    job, resumed = asyncio.run(main())
+    # Continued from the checkpoint: only a chunk in flight at the restart is synthesized twice
+    assert tts_service.model_manager.calls <= resumed.chunks_completed + 1
+    with wave.open(str(tmp_path / f"{job.id}.wav")) as audio:
+        assert audio.getnframes() * 2 == resumed.output_bytes - 44
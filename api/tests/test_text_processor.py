@@ -0,0 +1,56 @@
+import pytest
+
+from api.src.core.config import settings
+from api.src.services.text_processing.normalizer import normalize_text
+from api.src.services.text_processing.text_processor import chunk_targets, split_segments, split_sentences
+from api.src.structures.schemas import NormalizationOptions
+
+
+def test_chunk_targets_without_first_chunk_tokens():
+    assert chunk_targets(0) == (settings.target_min_tokens, settings.target_max_tokens)
+    assert chunk_targets(5) == (settings.target_min_tokens, settings.target_max_tokens)
+
+
+@pytest.mark.parametrize("growth", [1.0, 1.5, 2.0])
+def test_chunk_targets_grow_to_target_range(monkeypatch, growth):
+    monkeypatch.setattr(settings, "stream_chunk_growth", growth)
+    previous = 0
+    for chunk_index in range(20):
+        target_min, target_max = chunk_targets(chunk_index, 40)
+        expected = min(int(40 * growth**chunk_index), settings.target_max_tokens)
+        assert target_max == expected
+        assert target_min == min(settings.target_min_tokens, target_max)
+        assert target_max >= previous
+        previous = target_max
+
+
+def test_chunk_targets_of_very_long_streams():
+    # growth**chunk_index alone overflows a float past about 1024 chunks
+    for chunk_index in (1024, 1100, 100_000):
+        assert chunk_targets(chunk_index, 40) == (settings.target_min_tokens, settings.target_max_tokens)
+
+
+def test_chunk_targets_with_large_first_chunk():
+    assert chunk_targets(3, settings.target_max_tokens * 2)[1] == settings.target_max_tokens
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "ends at 3 p.m. 5 people attended.",
+        "Call the U.S. $5 is enough.",
+        "It was e.g. -5 degrees.",
+        "See i.e. \u2018hi.\u2019 and more.",
+        "Ask Dr. Smith. Mr. Jones said etc. Then he left.",
+        "Meet at 3 p.m. \"Hello.\" (Note.) Done!",
+    ],
+)
+def test_split_segments_keeps_sentences(text):
+    options = NormalizationOptions()
+    whole = list(split_sentences(normalize_text(text, options), {}))
+    segmented = [sentence for segment in split_segments(text) for sentence in split_sentences(normalize_text(segment, options), {})]
+    assert segmented == whole
+
+
+def test_split_segments_at_safe_sentence_ends():
+    assert list(split_segments('One. Two! "Three?" (Four.) 5 five.')) == ["One.", "Two!", '"Three?" (Four.) 5 five.']
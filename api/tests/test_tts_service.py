@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+from api.src.core.config import settings
+from api.src.services.streaming_audio_writer import StreamingAudioWriter
+
+TEXT = " ".join(f"Sentence number {i} is here, and it keeps going for a while." for i in range(12))
+
+
+async def collect(tts_service, errors, output_format="wav"):
+    writer = StreamingAudioWriter(output_format, sample_rate=settings.sample_rate)
+    try:
+        return [
+            chunk
+            async for chunk in tts_service.generate_audio_stream(TEXT, "af_heart", writer, output_format=output_format, errors=errors)
+        ]
+    finally:
+        writer.close()
+
+
+@pytest.mark.parametrize("coalesce", [False, True])
+def test_stream_reports_no_errors_when_complete(tts_service, monkeypatch, coalesce):
+    monkeypatch.setattr(settings, "coalesce_requests", coalesce)
+    errors = []
+    chunks = asyncio.run(collect(tts_service, errors))
+    assert chunks
+    assert errors == []
+
+
+@pytest.mark.parametrize("coalesce", [False, True])
+def test_stream_reports_failed_chunks(tts_service, monkeypatch, coalesce):
+    monkeypatch.setattr(settings, "coalesce_requests", coalesce)
+    tts_service.model_manager.fail_calls = {2}
+    errors = []
+    chunks = asyncio.run(collect(tts_service, errors))
+    # The stream carries on past the failed chunk
+    assert chunks
+    assert len(errors) == 1
+    assert "model failed" in errors[0]
+
+
+def test_stream_reports_failed_encoding(tts_service, monkeypatch):
+    from api.src.services import tts_service as tts_module
+
+    encode_chunk = tts_module.TTSService._encode_chunk
+    calls = 0
+
+    async def failing_encode(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise ValueError("encoder failed")
+        return await encode_chunk(*args, **kwargs)
+
+    monkeypatch.setattr(settings, "coalesce_requests", False)
+    monkeypatch.setattr(tts_module.TTSService, "_encode_chunk", staticmethod(failing_encode))
+    errors = []
+    asyncio.run(collect(tts_service, errors, "mp3"))
+    assert errors == ["Failed to convert audio: encoder failed"]
+
+
+async def synthesize_twice(tts_service, first_text, second_text, tokens):
+    for text in (first_text, second_text):
+        async for _ in tts_service._synthesize_chunk(text, tokens, "af_heart", "/voices/af_heart.pt", 1.0, "a"):
+            pass
+    return tts_service.model_manager.calls
+
+
+@pytest.fixture
+def chunk_cache(monkeypatch):
+    from api.src.services.audio_cache import ChunkCache
+
+    monkeypatch.setattr(settings, "chunk_cache_enabled", True)
+    monkeypatch.setattr(ChunkCache, "_instance", None)
+
+
+def test_chunk_cache_keeps_texts_with_equal_tokens_apart(tts_service, chunk_cache, monkeypatch):
+    # The model reads the text itself here, so equal tokens don't mean equal audio
+    monkeypatch.setattr(settings, "single_pass_phonemization", False)
+    assert asyncio.run(synthesize_twice(tts_service, "Read it.", "Red it.", [50, 60, 70])) == 2
+
+
+def test_chunk_cache_shares_audio_synthesized_from_tokens(tts_service, chunk_cache, monkeypatch):
+    monkeypatch.setattr(settings, "single_pass_phonemization", True)
+    assert asyncio.run(synthesize_twice(tts_service, "Read it.", "Red it.", [50, 60, 70])) == 1
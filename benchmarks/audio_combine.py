@@ -0,0 +1,67 @@
+"""Benchmark AudioChunk.combine on hundreds of chunks against the old concatenate loop.
+
+Run from the repository root: python -m benchmarks.audio_combine
+"""
+
+import time
+from typing import List
+
+import numpy as np
+
+from api.src.inference.base import AudioChunk
+from api.src.structures.schemas import WordTimestamp
+
+# 3 seconds of 24 kHz audio per chunk
+CHUNK_SAMPLES = 72000
+TIMESTAMPS_PER_CHUNK = 10
+
+
+def combine_loop(audio_chunks: List[AudioChunk]) -> AudioChunk:
+    """The previous implementation, which copies the growing buffer for every chunk."""
+    combined_audio = audio_chunks[0].audio
+    combined_timestamps = audio_chunks[0].word_timestamps.copy() if audio_chunks[0].word_timestamps else []
+
+    for chunk in audio_chunks[1:]:
+        combined_audio = np.concatenate((combined_audio, chunk.audio), dtype=np.int16)
+        if chunk.word_timestamps:
+            combined_timestamps += chunk.word_timestamps
+
+    return AudioChunk(combined_audio, combined_timestamps)
+
+
+def make_chunks(count: int) -> List[AudioChunk]:
+    rng = np.random.default_rng(0)
+    return [
+        AudioChunk(
+            rng.integers(-32768, 32767, CHUNK_SAMPLES, dtype=np.int16),
+            [WordTimestamp(word="word", start_time=i * 0.3, end_time=i * 0.3 + 0.2) for i in range(TIMESTAMPS_PER_CHUNK)],
+        )
+        for _ in range(count)
+    ]
+
+
+def best_of(fn, chunks: List[AudioChunk], repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(chunks)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    print(f"int16 chunks of {CHUNK_SAMPLES} samples with {TIMESTAMPS_PER_CHUNK} timestamps each")
+    print(f"{'chunks':>8} {'before':>12} {'after':>12}")
+    for count in (100, 300, 600):
+        chunks = make_chunks(count)
+        expected = combine_loop(chunks)
+        combined = AudioChunk.combine(chunks)
+        assert np.array_equal(combined.audio, expected.audio)
+        assert combined.word_timestamps == expected.word_timestamps
+        before = best_of(combine_loop, chunks, 1)
+        after = best_of(AudioChunk.combine, chunks, 5)
+        print(f"{count:>8} {before * 1000:>9.1f} ms {after * 1000:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Benchmark collecting a stream's encoded output as parts against joining each chunk first.
+
+The muxer's writes for each format are recorded once from a real StreamingAudioWriter
+and replayed, so the numbers are the cost of handling the output, not of encoding it.
+
+Run from the repository root: python -m benchmarks.encoded_output
+"""
+
+import time
+import tracemalloc
+from typing import Callable, List
+
+import numpy as np
+
+from api.src.services.streaming_audio_writer import StreamingAudioWriter
+
+# 200 chunks of 1.5 seconds of 24 kHz audio, a long document
+CHUNK_SAMPLES = 36000
+CHUNKS = 200
+
+
+def take_joined(parts: List[bytes]) -> bytes:
+    """The previous EncodedAudioSink.take, which joined a chunk's writes into one bytes."""
+    if not parts:
+        return b""
+    return parts[0] if len(parts) == 1 else b"".join(parts)
+
+
+def collect_joined(chunks: List[List[bytes]]) -> bytes:
+    """Whole output as before: every chunk joined, then the chunks joined again."""
+    outputs = []
+    for parts in chunks:
+        outputs.append(take_joined(parts))
+    return b"".join(outputs)
+
+
+def collect_parts(chunks: List[List[bytes]]) -> bytes:
+    """Whole output now: the parts of every chunk are collected and joined once."""
+    outputs = []
+    for parts in chunks:
+        outputs.extend(parts)
+    return b"".join(outputs)
+
+
+def record_writes(output_format: str) -> List[List[bytes]]:
+    rng = np.random.default_rng(0)
+    writer = StreamingAudioWriter(output_format, sample_rate=24000)
+    try:
+        chunks = [writer.write_chunk(rng.integers(-8000, 8000, CHUNK_SAMPLES, dtype=np.int16)) for _ in range(CHUNKS)]
+        chunks.append(writer.write_chunk(finalize=True))
+    finally:
+        writer.close()
+    return [[bytes(part) for part in parts] for parts in chunks]
+
+
+def measure(fn: Callable, chunks: List[List[bytes]], repeat: int = 5):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(chunks)
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    fn(chunks)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return min(times), peak
+
+
+def main() -> None:
+    print(f"{CHUNKS} chunks of {CHUNK_SAMPLES} samples, collected into one output")
+    print(f"{'format':>6} {'writes':>7} {'output':>10} {'before':>22} {'after':>22}")
+    for output_format in ("mp3", "aac", "flac", "wav"):
+        chunks = record_writes(output_format)
+        assert collect_parts(chunks) == collect_joined(chunks)
+        writes = sum(map(len, chunks))
+        size = sum(len(part) for parts in chunks for part in parts)
+        before, before_peak = measure(collect_joined, chunks)
+        after, after_peak = measure(collect_parts, chunks)
+        print(
+            f"{output_format:>6} {writes:>7} {size / 1024:>7.0f} KiB"
+            f" {before * 1000:>7.2f} ms {before_peak / 1024:>7.0f} KiB"
+            f" {after * 1000:>7.2f} ms {after_peak / 1024:>7.0f} KiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Benchmark memoized number, money, time, unit and phone verbalization against plain inflect calls.
+
+Run from the repository root: python -m benchmarks.number_verbalization
+"""
+
+import random
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from api.src.services.text_processing import normalizer
+from api.src.structures.schemas import NormalizationOptions
+
+# Size of each corpus, in characters
+CORPUS_CHARS = 250_000
+
+PARAGRAPH = (
+    "Revenue rose 12% to $4.5 million in 2023, up from $3,950,000 in 2022. "
+    "The board met at 10:30 am on March 3 and approved 250 new hires. "
+    "Call 555-123-4567 or +1 (555) 987-6543 for details on the 3.75 GB archive. "
+)
+
+PROSE = (
+    "The committee gathered in the old library to discuss the northern valley. "
+    "Nobody spoke for a while, and the rain kept falling against the tall windows. "
+)
+
+
+def varied_numbers(chars: int) -> str:
+    """Mostly distinct amounts, clock times, units and phone numbers."""
+    rng = random.Random(0)
+    parts = []
+    size = 0
+    while size < chars:
+        part = rng.choice(
+            [
+                f"${rng.randint(1, 10**7):,}.{rng.randint(0, 99):02d}",
+                f"{rng.randint(0, 10**6)} items",
+                f"{rng.randint(1, 12)}:{rng.randint(0, 59):02d} pm",
+                f"{rng.randint(1, 999)} km",
+                f"{rng.randint(200, 999)}-{rng.randint(200, 999)}-{rng.randint(1000, 9999)}",
+                f"in {rng.randint(1500, 2099)}",
+                f"{rng.randint(0, 1000)}.{rng.randint(0, 99)}",
+            ]
+        )
+        parts.append(part + ".")
+        size += len(part) + 2
+    return " ".join(parts)
+
+
+@contextmanager
+def uncached() -> Iterator[None]:
+    """Route the handlers straight to the inflect engine, as before memoization."""
+    engine = normalizer.INFLECT_ENGINE
+    saved = normalizer.number_to_words, normalizer.plural, normalizer.no
+    normalizer.number_to_words = lambda number, group=0, comma=",": engine.number_to_words(number, group=group, comma=comma)
+    normalizer.plural = lambda word, count: engine.plural(word, count=count)
+    normalizer.no = lambda word, count: engine.no(word, count)
+    try:
+        yield
+    finally:
+        normalizer.number_to_words, normalizer.plural, normalizer.no = saved
+
+
+def clear_caches() -> None:
+    for cached in (normalizer._number_to_words, normalizer.plural, normalizer.no):
+        cached.cache_clear()
+
+
+def seconds_per_mb(text: str, options: NormalizationOptions) -> float:
+    start = time.perf_counter()
+    normalizer.normalize_text(text, options)
+    return (time.perf_counter() - start) / (len(text.encode("utf-8")) / 1e6)
+
+
+def main() -> None:
+    options = NormalizationOptions()
+    corpora = {
+        "varied numbers/money/times/phones": varied_numbers(CORPUS_CHARS),
+        "mixed paragraph repeated": PARAGRAPH * (CORPUS_CHARS // len(PARAGRAPH)),
+        "plain prose": PROSE * (CORPUS_CHARS // len(PROSE)),
+    }
+    print(f"normalize_text, {CORPUS_CHARS // 1000}k characters per corpus, one run each:")
+    for name, text in corpora.items():
+        with uncached():
+            before = seconds_per_mb(text, options)
+            expected = normalizer.normalize_text(text, options)
+        clear_caches()
+        after = seconds_per_mb(text, options)
+        assert normalizer.normalize_text(text, options) == expected
+        print(f"  {name + ':':<36} {before:6.2f} -> {after:6.2f} s/MB")
+
+
+if __name__ == "__main__":
+    main()
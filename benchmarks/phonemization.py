@@ -0,0 +1,73 @@
+"""Benchmark memoized and batched espeak phonemization on a large generated corpus.
+
+Run from the repository root: python -m benchmarks.phonemization
+"""
+
+import random
+import time
+from typing import List
+
+from api.src.core.config import settings
+from api.src.services.text_processing import phonemizer
+from api.src.services.text_processing.text_processor import iter_sentence_info
+
+SENTENCES = 3000
+BATCH = 32
+
+SUBJECTS = ["The committee", "Our neighbour", "A quiet engineer", "The old library", "Every student", "The river"]
+VERBS = ["considered", "described", "carried", "painted", "remembered", "measured"]
+OBJECTS = ["the long report", "a broken bridge", "seven yellow boats", "the northern valley", "their first harvest", "an unusual sound"]
+ENDINGS = ["before sunrise.", "with great care.", "during the storm.", "for the second time.", "without a word.", "near the station."]
+
+
+def make_sentences(count: int, seed: int) -> List[str]:
+    rng = random.Random(seed)
+    return [f"{rng.choice(SUBJECTS)} {rng.choice(VERBS)} {rng.choice(OBJECTS)} {rng.choice(ENDINGS)}" for _ in range(count)]
+
+
+def per_sentence_ms(fn, sentences: List[str]) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000 / len(sentences)
+
+
+def frontend(sentences: List[str]) -> None:
+    for _ in iter_sentence_info(" ".join(sentences)):
+        pass
+
+
+def main() -> None:
+    backend = phonemizer.get_phonemizer("a")
+    # Numbered so every sentence is unique
+    unique = [f"{sentence[:-1]} number {i}." for i, sentence in enumerate(make_sentences(SENTENCES, 0))]
+    backend.phonemize_batch(unique[:BATCH])
+
+    single = per_sentence_ms(lambda: [backend.phonemize(sentence) for sentence in unique], unique)
+    batched = per_sentence_ms(lambda: [backend.phonemize_batch(unique[i : i + BATCH]) for i in range(0, len(unique), BATCH)], unique)
+    assert [backend.phonemize(sentence) for sentence in unique[:BATCH]] == backend.phonemize_batch(unique[:BATCH])
+    phonemizer._phoneme_cache.clear()
+    phonemizer.phonemize_batch(unique)
+    cached = per_sentence_ms(lambda: phonemizer.phonemize_batch(unique), unique)
+
+    print(f"espeak over {SENTENCES} sentences, per sentence:")
+    print(f"  phonemize each:         {single:.4f} ms")
+    print(f"  batches of {BATCH}, cold:    {batched:.4f} ms")
+    print(f"  cached:                 {cached:.4f} ms")
+
+    # Half of the sentences repeat earlier ones, as in documents with recurring phrases
+    repeated = unique[: SENTENCES // 2] + random.Random(1).choices(unique[: SENTENCES // 2], k=SENTENCES // 2)
+    cache_size, batch_size = settings.phoneme_cache_size, settings.phoneme_batch_size
+    print("Full text frontend, per sentence:")
+    try:
+        for name, sentences in (("unique text", unique), ("50% repeated", repeated)):
+            times = []
+            for settings.phoneme_cache_size, settings.phoneme_batch_size in ((0, 1), (cache_size, batch_size)):
+                phonemizer._phoneme_cache.clear()
+                times.append(per_sentence_ms(lambda: frontend(sentences), sentences))
+            print(f"  {name + ':':<22} {times[0]:.4f} -> {times[1]:.4f} ms")
+    finally:
+        settings.phoneme_cache_size, settings.phoneme_batch_size = cache_size, batch_size
+
+
+if __name__ == "__main__":
+    main()
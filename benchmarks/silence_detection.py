@@ -0,0 +1,67 @@
+"""Benchmark AudioNormalizer's vectorized silence detection against the old sample loops.
+
+Run from the repository root: python -m benchmarks.silence_detection
+"""
+
+import time
+from typing import Optional, Tuple
+
+import numpy as np
+
+from api.src.services.audio import AudioNormalizer
+
+SAMPLE_RATE = 24000
+
+
+def bounds_loop(audio_data: np.ndarray, amplitude_threshold: float) -> Optional[Tuple[int, int]]:
+    """The previous Python loops from both ends, with the same absolute amplitude rule."""
+    start, end = None, None
+    for x in range(0, len(audio_data)):
+        if abs(int(audio_data[x])) > amplitude_threshold:
+            start = x
+            break
+    for x in range(len(audio_data) - 1, -1, -1):
+        if abs(int(audio_data[x])) > amplitude_threshold:
+            end = x
+            break
+    if start is None or end is None:
+        return None
+    return start, end
+
+
+def make_audio(seconds: float, silent_seconds: float, rng: np.random.Generator) -> np.ndarray:
+    """Speech-like noise with quiet edges on both sides."""
+    audio = rng.integers(-20, 20, int(seconds * SAMPLE_RATE), dtype=np.int16)
+    edge = int(silent_seconds * SAMPLE_RATE)
+    audio[edge:-edge] = rng.integers(-12000, 12000, len(audio) - 2 * edge, dtype=np.int16)
+    return audio
+
+
+def best_of(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    normalizer = AudioNormalizer()
+    threshold = np.iinfo(np.int16).max * (10 ** (-45 / 20))
+    rng = np.random.default_rng(0)
+
+    for _ in range(300):
+        audio = rng.integers(-400, 400, rng.integers(0, 2000), dtype=np.int16)
+        assert normalizer.find_non_silent_bounds(audio, threshold, frame_ms=0) == bounds_loop(audio, threshold)
+    print("Bounds match the loop on 300 random arrays")
+
+    audio = make_audio(10, 3, rng)
+    print("10s of 24 kHz audio with 3s of silence on each edge:")
+    print(f"  Python loop:      {best_of(lambda: bounds_loop(audio, threshold), 3) * 1000:8.2f} ms")
+    print(f"  per-sample mask:  {best_of(lambda: normalizer.find_non_silent_bounds(audio, threshold, frame_ms=0), 50) * 1000:8.2f} ms")
+    print(f"  10 ms RMS frames: {best_of(lambda: normalizer.find_non_silent_bounds(audio, threshold, frame_ms=10), 50) * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()